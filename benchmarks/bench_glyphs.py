@@ -0,0 +1,117 @@
+"""
+| The following script measures a full repaint of the letters grid, the 30 letters of a game five
+| guesses in, in every font. The glyphs are rendered with a fresh font every time, as before the glyph
+| cache, then looked up in the cache, and the whole grid is drawn with rich through the cache. The
+| cells of the game are 7 columns by 3 rows, too small for figlet, so the letters are drawn in larger
+| cells here, as on a roomier layout. The first paint, through an empty cache, is measured with the
+| prebuilt atlas, atlas file loading included, and without it.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import asyncio
+import io
+from pyfiglet import (
+    Figlet,  # type: ignore
+)
+from rich.console import (
+    Console,
+)
+import time
+from typing import (
+    Optional,
+)
+
+from deepwordle.components.glyphs import (
+    ATLAS_FILE,
+    GLYPH_CACHE,
+    GlyphCache,
+)
+from deepwordle.components.letters_grid import (
+    LettersGrid,
+)
+from deepwordle.core.game_state import (
+    GameState,
+)
+
+GUESSES = ("crane", "pilot", "dough", "react", "mercy")
+FONTS = ("mini", "small", "standard", "big")
+# the width and the height of a cell, in columns and rows.
+CELL = (24, 10)
+REPEAT = 20
+
+
+def letters_grid() -> LettersGrid:
+    grid = LettersGrid(GameState("merry"))
+    asyncio.run(grid.on_mount())
+    for guess in GUESSES:
+        for character in guess:
+            grid.add_letter(character)
+        grid.game_state.submit()
+        grid.render_letters()
+    return grid
+
+
+def repaint(console: Console, grid: LettersGrid, font_name: str) -> None:
+    options = console.options.update(width=CELL[0], height=CELL[1])
+    for letter in grid.letters:
+        letter.font_name = font_name
+        console.render_lines(letter.render(), options)
+
+
+def glyphs(grid: LettersGrid, font_name: str, cached: bool) -> None:
+    # the width left to the text by the padding of the letters.
+    width = CELL[0] - 2
+    for letter in grid.letters:
+        if cached:
+            GLYPH_CACHE.render(letter.character, font_name, width)
+        else:
+            Figlet(font=font_name, width=width).renderText(letter.character)
+
+
+def first_paint(grid: LettersGrid, atlas_path: Optional[str]) -> float:
+    """
+    A function that returns the seconds taken to render the glyphs of the grid in every
+    font through an empty cache, with or without the atlas.
+    """
+    cache = GlyphCache(atlas_path=atlas_path)
+    start = time.perf_counter()
+    for font_name in FONTS:
+        for letter in grid.letters:
+            cache.render(letter.character, font_name, CELL[0] - 2)
+    return time.perf_counter() - start
+
+
+def timed(function, *args) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        function(*args)
+    return (time.perf_counter() - start) / REPEAT
+
+
+def main() -> int:
+    console = Console(file=io.StringIO(), width=120, height=40)
+    grid = letters_grid()
+    print(f"{'font':<10}{'pyfiglet':>12}{'cached':>12}{'repaint':>12}")
+    for font_name in FONTS:
+        uncached = timed(glyphs, grid, font_name, False)
+        cached = timed(glyphs, grid, font_name, True)
+        painted = timed(repaint, console, grid, font_name)
+        print(
+            f"{font_name:<10}{uncached * 1e3:>10.2f}ms{cached * 1e3:>10.2f}ms"
+            f"{painted * 1e3:>10.2f}ms"
+        )
+    print(f"glyph cache: {GLYPH_CACHE.stats.format()}")
+    print(f"{'first paint, pyfiglet':<24}{first_paint(grid, None) * 1e3:>10.2f}ms")
+    print(f"{'first paint, atlas':<24}{first_paint(grid, ATLAS_FILE) * 1e3:>10.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+| The following script measures how long it takes to map a transcript to a valid guess.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import time
+
+from deepwordle.core import (
+    WordStore,
+)
+from deepwordle.core.matcher import (
+    WordMatcher,
+)
+
+TOKENS = ("react", "reakt", "reacts", "rite", "wright", "nolij", "xylophone")
+REPEAT = 2000
+
+
+def main() -> int:
+    word_store = WordStore.open()
+    start = time.perf_counter()
+    word_matcher = WordMatcher(word_store)
+    print(f"{'indices build':<24} {(time.perf_counter() - start) * 1e3:>10.1f} ms")
+    for token in TOKENS:
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            match = word_matcher.match(token)
+        seconds = time.perf_counter() - start
+        print(f"{token + ' -> ' + str(match):<24} {seconds / REPEAT * 1e6:>10.1f} us")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+| The following script measures what the preprocessing of a recording saves: the bytes uploaded and
+| the end-to-end latency, the upload time saved minus the preprocessing time, for every combination of
+| the preprocessing steps.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import numpy as np
+
+from deepwordle.audio.preprocess import (
+    Preprocessor,
+)
+
+RATE = 44100
+REPEAT = 20
+# 1 Mbit/s and 10 Mbit/s uplinks.
+UPLINKS = (125_000, 1_250_000)
+
+
+def recording(seconds: float = 2.0, word: float = 0.5) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    time = np.arange(int(RATE * word)) / RATE
+    voice = 7000 * np.sin(2 * np.pi * 180 * time) + 2000 * np.sin(
+        2 * np.pi * 900 * time
+    )
+    samples = np.zeros(int(RATE * seconds))
+    start = int(RATE * 0.4)
+    samples[start : start + len(voice)] = voice * np.hanning(len(voice))
+    return (samples + rng.normal(0, 50, len(samples))).astype(np.int16)
+
+
+def main() -> int:
+    samples = recording()
+    for name, options in (
+        ("resample", {"trim_silence": False}),
+        ("trim + resample", {}),
+        ("trim + resample + flac", {"compress": True}),
+    ):
+        preprocessor = Preprocessor(**options)
+        reports = [preprocessor.process(samples, RATE)[1] for _ in range(REPEAT)]
+        report = reports[-1]
+        seconds = np.median([item.seconds for item in reports])
+        report.seconds = seconds
+        saved = "  ".join(
+            f"{report.saved_seconds(uplink) * 1e3:>7.1f} ms @ {uplink * 8 / 1e6:g} Mbit/s"
+            for uplink in UPLINKS
+        )
+        print(
+            f"{name:<24} {report.output_bytes:>7} B of {report.input_bytes} B "
+            f"in {seconds * 1e3:>5.1f} ms, saved {saved}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+| The following script measures the tail latency of the recognitions with and without hedged requests,
+| against the local stand-in of the prerecorded endpoint answering 3% of the uploads slowly, a tail
+| beyond the 95th percentile the hedges are sent after. The latencies are measured once the first
+| recognitions gave the percentile.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import asyncio
+import numpy as np
+import time
+
+from deepwordle.resilience import (
+    MIN_HEDGE_SAMPLES,
+    ResilientRecognizer,
+)
+from deepwordle.stand_ins import (
+    PrerecordedStandIn,
+)
+from deepwordle.transcribe import (
+    Recognizer,
+)
+
+CALLS = 200
+FAST_SECONDS = 0.02
+SLOW_SECONDS = 0.5
+SLOW_RATIO = 0.03
+
+
+async def measure(hedge: bool) -> None:
+    rng = np.random.default_rng(0)
+    # enough delays for the hedged requests as well.
+    delays = np.where(rng.random(2 * CALLS) < SLOW_RATIO, SLOW_SECONDS, FAST_SECONDS)
+    delays[:MIN_HEDGE_SAMPLES] = FAST_SECONDS
+    async with PrerecordedStandIn(delays=delays.tolist()) as stand_in:
+        recognizer = ResilientRecognizer(
+            Recognizer(api_key="key", api_url=stand_in.url), hedge=hedge
+        )
+        await recognizer.warm()
+        for _ in range(MIN_HEDGE_SAMPLES):
+            await recognizer.recognize(b"audio")
+        latencies = []
+        for _ in range(CALLS):
+            start = time.perf_counter()
+            await recognizer.recognize(b"audio")
+            latencies.append(time.perf_counter() - start)
+        await recognizer.close()
+    p50, p99 = np.percentile(latencies, [50, 99]) * 1e3
+    name = "hedged" if hedge else "single"
+    print(
+        f"{name:<8} p50 {p50:>7.1f} ms  p99 {p99:>7.1f} ms  "
+        f"{recognizer.stats.format()}"
+    )
+
+
+def main() -> int:
+    for hedge in (False, True):
+        asyncio.run(measure(hedge))
+    return 0
+
+
+if __name__ == "__main__":
+    main()
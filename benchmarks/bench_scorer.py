@@ -0,0 +1,104 @@
+"""
+| The following script measures how many feedback patterns per second each scorer computes.
+
+| With `--verify`, the patterns of every guess against every answer of the full word lists are also
+| checked against `update_letters_state`, the feedback shown by the game. The tests only check
+| sampled subsets: the full check takes a few minutes.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import argparse
+import time
+from types import (
+    SimpleNamespace,
+)
+from typing import (
+    List,
+    Optional,
+    Sequence,
+)
+
+from deepwordle.components.utils import (
+    update_letters_state,
+)
+from deepwordle.core.patterns import (
+    feedback_pattern,
+    states_to_pattern,
+)
+from deepwordle.core.scorer import (
+    score,
+    score_many,
+    to_letters,
+)
+from deepwordle.core.word_store import (
+    ANSWERS_FILE,
+    GUESSES_FILE,
+    _read_words,
+)
+
+
+def report(name: str, patterns: int, seconds: float) -> None:
+    print(f"{name:<36} {patterns / seconds:>16,.0f} patterns/s")
+
+
+def verify(guesses: List[str], answers: List[str]) -> int:
+    """
+    A function that checks the scorer against `update_letters_state` on every guess and
+    every answer, and returns the number of patterns that differ.
+    """
+    patterns = score_many(guesses, answers)
+    mismatches = 0
+    for guess, row in zip(guesses, patterns.tolist()):
+        for answer, pattern in zip(answers, row):
+            letters = [SimpleNamespace(character=char, state=0) for char in guess]
+            letters = update_letters_state(letters, answer)
+            if states_to_pattern([letter.state for letter in letters]) != pattern:
+                mismatches += 1
+    return mismatches
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1][2:])
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="check the patterns of the full word lists against the game",
+    )
+    args = parser.parse_args(argv)
+    answers = _read_words(ANSWERS_FILE)
+    guesses = _read_words(GUESSES_FILE) + answers
+    start = time.perf_counter()
+    for guess in guesses[:50]:
+        for answer in answers:
+            feedback_pattern(guess, answer)
+    report("python: 50 x N", 50 * len(answers), time.perf_counter() - start)
+    answer_letters = to_letters(answers)
+    start = time.perf_counter()
+    for guess in guesses[:500]:
+        score(guess, answer_letters)
+    report("numpy: 1 x N, 500 times", 500 * len(answers), time.perf_counter() - start)
+    guess_letters = to_letters(guesses)
+    start = time.perf_counter()
+    score_many(guess_letters, answer_letters)
+    report("numpy: M x N", len(guesses) * len(answers), time.perf_counter() - start)
+    if args.verify:
+        start = time.perf_counter()
+        mismatches = verify(guesses, answers)
+        print(
+            f"{len(guesses) * len(answers):,} patterns checked in "
+            f"{time.perf_counter() - start:.0f}s, {mismatches} mismatches"
+        )
+        return 1 if mismatches else 0
+    return 0
+
+
+if __name__ == "__main__":
+    # the exit status tells whether `--verify` found a mismatch.
+    raise SystemExit(main())
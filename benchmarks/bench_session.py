@@ -0,0 +1,63 @@
+"""
+| The following script measures the latency of an upload through a new session every time, like the
+| Deepgram SDK does, versus through the keep-alive session of the recognizer, against the local
+| stand-in of the prerecorded endpoint. The stand-in is reached over plain HTTP on the loopback, the
+| DNS lookup and the TLS handshake saved on the real endpoint are worth far more.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import aiohttp
+import asyncio
+import numpy as np
+import time
+
+from deepwordle.audio.wav import (
+    wav_bytes,
+)
+from deepwordle.stand_ins import (
+    PrerecordedStandIn,
+)
+from deepwordle.transcribe import (
+    Recognizer,
+)
+
+REPEAT = 50
+AUDIO = bytes(wav_bytes(np.zeros(16000, dtype=np.int16), 16000))
+
+
+async def measure() -> None:
+    async with PrerecordedStandIn(latency=0) as stand_in:
+        latencies = []
+        for _ in range(REPEAT):
+            start = time.perf_counter()
+            async with aiohttp.request(
+                "POST", stand_in.url + "/listen", data=AUDIO, raise_for_status=True
+            ) as response:
+                await response.read()
+            latencies.append(time.perf_counter() - start)
+        print(f"{'new session':<16} {np.median(latencies) * 1e3:>10.3f} ms")
+        recognizer = Recognizer(api_key="key", api_url=stand_in.url)
+        await recognizer.warm()
+        for _ in range(REPEAT):
+            await recognizer.recognize(AUDIO)
+        await recognizer.close()
+        stats = recognizer.stats
+        print(f"{'keep-alive cold':<16} {np.median(stats.cold) * 1e3:>10.3f} ms")
+        print(f"{'keep-alive warm':<16} {np.median(stats.warm) * 1e3:>10.3f} ms")
+        print(stats.format())
+
+
+def main() -> int:
+    asyncio.run(measure())
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""
+| The following script measures the time from the start of a recording to the word being known,
+| recording a fixed duration then uploading it versus streaming it, against the local stand-in of the
+| live endpoint. The audio is fed at the pace of a microphone.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import asyncio
+import numpy as np
+import time
+from typing import (
+    AsyncIterator,
+)
+
+from deepwordle.stand_ins import (
+    LiveStandIn,
+)
+from deepwordle.streaming import (
+    StreamingRecognizer,
+)
+
+RATE = 44100
+FRAMES_PER_BUFFER = 1024
+# the fixed duration of a recording of the game.
+RECORD_SECONDS = 2
+SPEECH_SECONDS = (0.4, 0.8, 1.2)
+LATENCY = 0.1
+REPEAT = 3
+
+
+async def microphone(seconds: float) -> AsyncIterator[np.ndarray]:
+    step = FRAMES_PER_BUFFER / RATE
+    for _ in range(int(seconds / step)):
+        await asyncio.sleep(step)
+        yield np.zeros(FRAMES_PER_BUFFER, dtype=np.int16)
+
+
+async def recorded(seconds: float) -> AsyncIterator[np.ndarray]:
+    chunks = [chunk async for chunk in microphone(seconds)]
+    yield np.concatenate(chunks)
+
+
+async def measure(speech_seconds: float) -> None:
+    async with LiveStandIn(speech_seconds=speech_seconds, latency=LATENCY) as stand_in:
+        recognizer = StreamingRecognizer(api_key="key", url=stand_in.url, rate=RATE)
+        for name, chunks in (("record", recorded), ("stream", microphone)):
+            start = time.perf_counter()
+            for _ in range(REPEAT):
+                await recognizer.transcribe(chunks(RECORD_SECONDS))
+            seconds = (time.perf_counter() - start) / REPEAT
+            print(
+                f"{name + f' {speech_seconds:.1f} s word':<24} {seconds * 1e3:>10.1f} ms"
+            )
+
+
+def main() -> int:
+    for speech_seconds in SPEECH_SECONDS:
+        asyncio.run(measure(speech_seconds))
+    return 0
+
+
+if __name__ == "__main__":
+    main()
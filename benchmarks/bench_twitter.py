@@ -0,0 +1,80 @@
+"""
+| The following script measures what the twitter client costs the startup of the game: creating it
+| and verifying its credentials on the spot, as the game used to, versus creating it lazily, the
+| credentials being verified on the first tweet, over the network once and from the cache on disk
+| afterwards. The stand-in of the API answers after LATENCY seconds, a round trip to the real one.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import asyncio
+import numpy as np
+import os
+import tempfile
+import time
+
+from deepwordle.stand_ins import (
+    TwitterStandIn,
+)
+from deepwordle.twitter import (
+    Twitter,
+)
+
+REPEAT = 20
+LATENCY = 0.15
+CREDENTIALS = {
+    "consumer_key": "key",
+    "consumer_secret": "secret",
+    "access_token": "token",
+    "access_token_secret": "token secret",
+}
+
+
+def timed(function) -> float:
+    latencies = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        latencies.append(time.perf_counter() - start)
+    return float(np.median(latencies))
+
+
+async def measure(directory: str) -> None:
+    path = os.path.join(directory, "verified.json")
+    async with TwitterStandIn(latency=LATENCY) as stand_in:
+        loop = asyncio.get_running_loop()
+
+        def create() -> Twitter:
+            return Twitter(**CREDENTIALS, api_url=stand_in.url, verified_path=path)
+
+        def eager() -> None:
+            # the client and the verification of the credentials of the old startup.
+            create().verify(ttl=0)
+
+        def cached() -> None:
+            create().verify()
+
+        rows = [
+            ("eager startup", await loop.run_in_executor(None, timed, eager)),
+            ("lazy startup", timed(create)),
+            ("verify, cached", await loop.run_in_executor(None, timed, cached)),
+        ]
+        for name, seconds in rows:
+            print(f"{name:<16} {seconds * 1e3:>10.3f} ms")
+        print(f"{stand_in.verifications} verifications sent")
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(measure(directory))
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+| The following script measures the cost of the voice activity detection and how long a recording
+| lasts with it, compared to the fixed two seconds, for words of different lengths.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import numpy as np
+import time
+
+from deepwordle.audio import (
+    VoiceActivityDetector,
+)
+
+RATE = 44100
+FRAMES_PER_BUFFER = 1024
+FIXED_SECONDS = 2.0
+LEADING_SECONDS = 0.2
+WORD_SECONDS = (0.3, 0.5, 0.8)
+REPEAT = 50
+
+
+def utterance(seconds: float) -> np.ndarray:
+    rng = np.random.default_rng(0)
+    time = np.arange(int(RATE * seconds)) / RATE
+    word = 4000 * np.sin(2 * np.pi * 160 * time)
+    samples = np.concatenate(
+        (np.zeros(int(RATE * LEADING_SECONDS)), word, np.zeros(RATE * 3))
+    )
+    return (samples + rng.normal(0, 60, len(samples))).astype(np.int16)
+
+
+def record(samples: np.ndarray) -> VoiceActivityDetector:
+    detector = VoiceActivityDetector(RATE, max_seconds=FIXED_SECONDS)
+    for start in range(0, len(samples), FRAMES_PER_BUFFER):
+        if detector.feed(samples[start : start + FRAMES_PER_BUFFER]):
+            break
+    return detector
+
+
+def main() -> int:
+    for seconds in WORD_SECONDS:
+        samples = utterance(seconds)
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            detector = record(samples)
+        elapsed = (time.perf_counter() - start) / REPEAT
+        recorded = detector.samples / RATE
+        print(
+            f"{f'{seconds:.1f} s word':<16} recorded {recorded:>5.2f} s "
+            f"instead of {FIXED_SECONDS:.2f} s, "
+            f"{elapsed / recorded * 1e6:>7.1f} us per second of audio"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    main()
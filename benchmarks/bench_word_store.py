@@ -0,0 +1,83 @@
+"""
+| The following script compares the word store against the plain lists built by `read_from_file`.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import tempfile
+import timeit
+
+from deepwordle.components.utils import (
+    read_from_file,
+)
+from deepwordle.core import (
+    WordStore,
+)
+
+WORDS = ("aback", "react", "zonal", "zzzzz", "aahed", "xylyl")
+
+
+def load_lists():
+    return read_from_file("wordle-guesses.txt"), read_from_file("wordle-answers.txt")
+
+
+def report(name: str, seconds: float, number: int) -> None:
+    print(f"{name:<32} {seconds / number * 1e6:>12.3f} us")
+
+
+def main(number: int = 2000) -> int:
+    guesses_list, answers_list = load_lists()
+    with tempfile.TemporaryDirectory() as cache_dir:
+        report(
+            "word store: first build",
+            timeit.timeit(
+                lambda: WordStore.open(cache_dir=cache_dir).close(), number=1
+            ),
+            1,
+        )
+        report("lists: startup", timeit.timeit(load_lists, number=50), 50)
+        report(
+            "word store: startup",
+            timeit.timeit(
+                lambda: WordStore.open(cache_dir=cache_dir).close(), number=number
+            ),
+            number,
+        )
+        word_store = WordStore.open(cache_dir=cache_dir)
+        report(
+            "lists: membership",
+            timeit.timeit(
+                lambda: [
+                    word not in guesses_list and word not in answers_list
+                    for word in WORDS
+                ],
+                number=number,
+            ),
+            number * len(WORDS),
+        )
+        report(
+            "word store: membership",
+            timeit.timeit(
+                lambda: [word not in word_store for word in WORDS], number=number
+            ),
+            number * len(WORDS),
+        )
+        report(
+            "word store: rank",
+            timeit.timeit(
+                lambda: [word_store.rank(word) for word in WORDS[:3]], number=number
+            ),
+            number * 3,
+        )
+        word_store.close()
+    return 0
+
+
+if __name__ == "__main__":
+    main()
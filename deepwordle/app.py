@@ -10,9 +10,11 @@
 .. _mail: eng.mahmoudharmouch@gmail.com
 
 """
+import argparse
 import asyncio
 import nest_asyncio
-import random
+import os
+import sys
 from textual import (
     events,
 )
@@ -29,23 +31,72 @@ from textual.widgets import (
     Footer,
     Header,
 )
+import time
 from typing import (
+    Any,
     Optional,
+    Sequence,
+    Tuple,
 )
 
-from deepwordle.audio_record import (
-    AudioRecorder,
+from deepwordle.audio import (
+    AudioCapture,
+    VoiceActivityDetector,
+)
+from deepwordle.audio.preprocess import (
+    COMPRESS,
+    Preprocessor,
+)
+from deepwordle.audio.vad import (
+    TRAILING_SILENCE,
 )
 from deepwordle.components import (
     CUBES,
     LETTERS,
     LettersGrid,
     MessagePanel,
-    add_new_letter,
     get_day_index,
-    read_from_file,
-    remove_letter,
-    update_letters_state,
+)
+from deepwordle.components.glyphs import (
+    GLYPH_CACHE,
+)
+from deepwordle.core import (
+    WordStore,
+)
+from deepwordle.core.codec import (
+    INVALID,
+    encode,
+)
+from deepwordle.core.game_state import (
+    GameState,
+)
+from deepwordle.core.matcher import (
+    WordMatcher,
+)
+from deepwordle.core.solver import (
+    Solver,
+)
+from deepwordle.core.spelling import (
+    MAX_GAP,
+    spelled_word,
+)
+from deepwordle.outbox import (
+    Outbox,
+)
+from deepwordle.recognizers import (
+    BACKENDS,
+    DEFAULT_BACKEND,
+    create_recognizer,
+)
+from deepwordle.resilience import (
+    ResilientRecognizer,
+)
+from deepwordle.streaming import (
+    StreamingRecognizer,
+    StreamResult,
+)
+from deepwordle.tracing import (
+    Tracer,
 )
 from deepwordle.transcribe import (
     Recognizer,
@@ -56,10 +107,26 @@ from deepwordle.twitter import (
 
 nest_asyncio.apply()
 
+# spelling a word letter by letter takes longer than saying it.
+SPELLING_DURATION = 4
+# a live recording stops on the first final word, this is only its upper bound.
+STREAMING_DURATION = 5
+# a file the latency histograms are written to on quit, Prometheus text if it ends with `.prom`.
+TRACE_PATH = os.environ.get("DEEPWORDLE_TRACE")
+
 
 class MainApp(App):
     _result: Reactive[bool] = Reactive(False)
     _end: Reactive[bool] = Reactive(False)
+    # the name of the speech recognizer backend, set by `main` before the app runs.
+    recognizer_backend: str = DEFAULT_BACKEND
+    # whether a slow recognition is doubled by a second request, set by `main` as well.
+    hedge: bool = False
+    # whether the recordings are uploaded as FLAC rather than WAV, set by `main` as well.
+    compress: bool = False
+    # whether the app quits on its first frame, for `--startup-profile`, and when it was drawn.
+    startup_profile: bool = False
+    first_frame_at: Optional[float] = None
 
     @property
     def result(self) -> Reactive[bool]:
@@ -110,23 +177,32 @@ class MainApp(App):
         await self.bind("q", "quit", "Quit")
         await self.bind("t", "tweet", "Tweet")
         await self.bind("r", "None", "Record")
+        await self.bind("h", "hint", "Hint")
+        await self.bind("s", "spell", "Spell")
+        await self.bind("l", "live", "Live")
+        await self.bind("p", "latency", "Latency")
 
     def on_key(self, event: events.Key) -> None:
-        if self.letters_grid.letters_count == 5 * 6 - 1:
-            self.end = True
         if not self.result and not self.end:
-            self.message.content = "Press `r` to start recording audio..."
-            if event.key == "r":
-                self.process_recording(duration=2)
+            # the capture runs in the background, the keys still work meanwhile.
+            if not self.recording:
+                self.message.content = "Press `r` to start recording audio..."
+                if event.key == "r":
+                    self.tracer.begin()
+                    if self.streaming and not self.spelling:
+                        recording = self.process_stream(duration=STREAMING_DURATION)
+                    else:
+                        recording = self.process_recording(
+                            duration=SPELLING_DURATION if self.spelling else 2
+                        )
+                    self.record_task = asyncio.get_running_loop().create_task(recording)
 
             if event.key == "enter":
                 self.result = self.check_guess()
                 return
 
             elif event.key == "ctrl+h":
-                self.letters_grid.letters_count = remove_letter(
-                    self.letters_grid.letters, self.letters_grid.letters_count
-                )
+                self.letters_grid.remove_letter()
                 return
         else:
             return
@@ -140,53 +216,208 @@ class MainApp(App):
             self.message.content = f"The answer is: {self.secret}"
 
     def check_guess(self) -> bool:
-        current_letters = self.letters_grid.current_letters
-        current_word = "".join(
-            map(lambda letter: letter.character, current_letters)
-        ).lower()
-        if len(current_word) < 5:
+        game_state = self.letters_grid.game_state
+        current_code = encode(game_state.current_word())
+        if current_code == INVALID:
             self.message.content = "Not enough letters"
             return False
-        if (
-            current_word not in self.guesses_list
-            and current_word not in self.answers_list
-        ):
+        if current_code not in self.word_store:
             self.message.content = "Not in word list"
             return False
-        result = self.letters_grid.check_guess(self.secret)
-        return result
-
-    def process_recording(self, duration=2):
-        self.message.content = f"Recording audio for {duration} seconds..."
-        self.audio_recorder.record(duration)
-        self.message.content = "Transcribing audio data..."
-        result = self.loop.run_until_complete(self.recognizer.recognize())
-        words = result["results"]["channels"][0]["alternatives"][0]["words"]
-        word = ""
-        if len(words) > 0:
-            word = words[0]["word"]
-            if len(word) == 5:
-                self.message.content = (
-                    f"You said {word}.\nPress:\n  ↵ to submit your word."
+        pattern = self.letters_grid.check_guess()
+        # narrow down the candidates of the hint engine with the feedback of this row.
+        self.solver.update(current_code, pattern)
+        if game_state.over and not game_state.won:
+            self.end = True
+        return game_state.won
+
+    def action_spell(self) -> None:
+        self.spelling = not self.spelling
+        if self.spelling:
+            self.message.content = "Spelling mode: press `r` and spell your word,"
+            self.message.content += (
+                "\ne.g. `R E A C T` or `romeo echo alfa charlie tango`."
+            )
+        else:
+            self.message.content = "Press `r` to start recording audio..."
+
+    def action_live(self) -> None:
+        if not isinstance(self.recognizer.backend, Recognizer):
+            self.message.content = "Live mode needs the deepgram recognizer."
+            return
+        self.streaming = not self.streaming
+        if self.streaming:
+            self.message.content = "Live mode: the recording stops as soon as"
+            self.message.content += "\na word is heard."
+        else:
+            self.message.content = "Press `r` to start recording audio..."
+
+    async def action_hint(self) -> None:
+        if self.result or self.end:
+            return
+        if self.hint_task is not None and not self.hint_task.done():
+            return
+        self.show_latency = False
+        self.stats.content = "Ranking the next guesses..."
+        self.hint_task = asyncio.get_running_loop().create_task(self.show_hints())
+
+    async def show_hints(self, top_k: int = 5) -> None:
+        """
+        Rank the next guesses in a background thread, so the UI never stalls, then show
+        the best ones in the stats panel.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            hints = await loop.run_in_executor(None, self.solver.rank_guesses, top_k)
+        except Exception as error:
+            self.stats.content = f"Hints are unavailable:\n{error}"
+            return
+        content = f"Hints: {self.solver.candidates_count} possible answers\n"
+        for word, entropy in hints:
+            content += f"\n  {word.upper()}  {entropy:.2f} bits"
+        self.stats.content = content
+
+    def action_latency(self) -> None:
+        self.show_latency = not self.show_latency
+        if self.show_latency:
+            self.stats.content = self.latency_report()
+        else:
+            self.stats.content = "Press `h` to get hints."
+
+    def latency_report(self) -> str:
+        """
+        A method that describes where the time of the voice guesses goes, stage by stage.
+        """
+        if not self.tracer.stages():
+            return "Latency: no guess recorded yet."
+        return f"Latency of the voice guesses:\n\n{self.tracer.format()}"
+
+    def end_trace(self) -> None:
+        self.tracer.end()
+        if self.show_latency:
+            self.stats.content = self.latency_report()
+
+    @property
+    def recording(self) -> bool:
+        return self.record_task is not None and not self.record_task.done()
+
+    async def process_recording(self, duration=2):
+        self.message.content = f"Recording audio, {duration} seconds at most..."
+        # stop on the trailing silence of the word, a short word takes well under a second.
+        self.vad.max_seconds = duration
+        # the letters of a spelled word are said up to MAX_GAP seconds apart.
+        self.vad.trailing_silence = MAX_GAP if self.spelling else TRAILING_SILENCE
+        try:
+            with self.tracer.stage("record"):
+                samples = await self.audio_capture.record(duration, self.vad)
+            # trimmed and resampled to 16 kHz, the upload is a fraction of the recording.
+            with self.tracer.stage("preprocess"):
+                audio, report = self.preprocessor.process(
+                    samples, self.audio_capture.rate
                 )
-                self.message.content += "\n  ← to remove your letters."
-                self.construct_letters_from_word(word)
-            else:
-                self.message.content = (
-                    f"You said `{word}` which is not a five letters word."
+            self.message.content = f"Transcribing audio data...\n{report.format()}"
+            with self.tracer.stage("recognize"):
+                result = await self.recognizer.recognize(
+                    audio, self.preprocessor.mimetype
                 )
-                self.message.content += "\nPress `r` and try again."
+                words = result["results"]["channels"][0]["alternatives"][0]["words"]
+        except Exception as error:
+            self.message.content = f"Recording failed:\n{error}"
+            self.message.content += "\nPress `r` and try again."
+            return
+        self.show_word(words)
+        self.end_trace()
+
+    def show_interim(self, result: StreamResult) -> None:
+        if result.transcript:
+            self.message.content = f"Listening... `{result.transcript}`"
+
+    async def process_stream(self, duration=STREAMING_DURATION):
+        """
+        Stream the microphone to deepgram while recording, and stop as soon as a final
+        result holds a word, `duration` seconds at most.
+        """
+        self.message.content = "Listening..."
+        self.audio_capture.start()
+        timer = asyncio.get_running_loop().call_later(duration, self.audio_capture.stop)
+        try:
+            # recording and recognition overlap, they make up a single stage.
+            with self.tracer.stage("stream"):
+                result = await self.streaming_recognizer.transcribe(
+                    self.audio_capture.chunks(), on_result=self.show_interim
+                )
+        except Exception as error:
+            self.message.content = f"Recording failed:\n{error}"
+            self.message.content += "\nPress `r` and try again."
+            return
+        finally:
+            timer.cancel()
+            self.audio_capture.stop()
+        self.show_word(result.words if result is not None else [])
+        self.end_trace()
+
+    def show_word(self, words) -> None:
+        with self.tracer.stage("match"):
+            heard, word = self.match_word(words)
+        if word is not None:
+            self.message.content = f"You said {word}."
+            if word != heard.lower():
+                self.message.content += f" (heard `{heard}`)"
+            self.message.content += "\nPress:\n  ↵ to submit your word."
+            self.message.content += "\n  ← to remove your letters."
+            with self.tracer.stage("render"):
+                self.construct_letters_from_word(word)
         else:
             self.message.content = (
-                f"You said `{word}` which is not a five letters word."
+                f"You said `{heard}` which is not close to any valid word."
             )
             self.message.content += "\nPress `r` and try again."
 
+    def match_word(self, words) -> Tuple[str, Optional[str]]:
+        """
+        A method that returns what was heard and the valid guess it maps to, if any.
+        """
+        heard = words[0]["word"] if words else ""
+        word = None
+        if self.spelling:
+            # join the letters spelled out, e.g. "are e alpha see tee" to "react".
+            heard = " ".join(item["word"] for item in words)
+            word = spelled_word(words, self.word_store)
+        # map what deepgram heard to the closest valid guess, e.g. "reakt" to "react".
+        if word is None and words:
+            word = self.word_matcher.match(words[0]["word"])
+        if word is None and len(words) > 1:
+            heard = "".join(item["word"] for item in words)
+            word = self.word_matcher.match(heard)
+        return heard, word
+
     def construct_letters_from_word(self, word=""):
         for letter in word:
-            self.letters_grid.letters_count = add_new_letter(
-                self.letters_grid.letters, self.letters_grid.letters_count, letter
-            )
+            self.letters_grid.add_letter(letter)
+
+    async def action_quit(self) -> None:
+        self.log(f"recognizer session: {self.recognizer_stats()}")
+        self.log(f"latency of the voice guesses:\n{self.tracer.format()}")
+        self.log(f"glyph cache: {GLYPH_CACHE.stats.format()}")
+        if TRACE_PATH:
+            self.tracer.export(TRACE_PATH)
+        self.warm_task.cancel()
+        if self.verify_task is not None:
+            self.verify_task.cancel()
+        await self.recognizer.close()
+        # the posts not sent yet stay in the journal, for the next session.
+        await self.outbox.stop()
+        await super().action_quit()
+
+    def recognizer_stats(self) -> str:
+        """
+        A method that describes the retries and the hedged requests of the recognizer, its
+        connections and the latencies of its cold and warm requests.
+        """
+        stats = self.recognizer.stats.format()
+        if isinstance(self.recognizer.backend, Recognizer):
+            return f"{stats}\n{self.recognizer.backend.stats.format()}"
+        return f"{stats}\nno connection, the recognizer runs locally"
 
     def action_tweet(self) -> None:
         if self.result:
@@ -202,49 +433,181 @@ class MainApp(App):
             tweet = result.format(
                 index=self.index, numerator=numerator, status=status, footer=footer
             )
-            # self.message.content = tweet
-            self.message.content = "Tweeting your result...\n"
-            self.twitter.text = tweet
-            self.twitter.post_tweet()
-            # self.message.content = self.twitter.text
+            twitter = self.twitter_client()
+            missing = twitter.missing_credentials()
+            if missing:
+                self.message.content = (
+                    f"Please provide a valid secret for: {', '.join(missing)}"
+                )
+                return
+            # the credentials are verified in the background, once a day at most.
+            if self.verify_task is None:
+                loop = asyncio.get_running_loop()
+                self.verify_task = loop.create_task(self.verify_twitter())
+            # posted in the background, the outbox reports its status to the message panel.
+            self.outbox.put(tweet)
+
+    def twitter_client(self) -> Twitter:
+        """
+        A method that returns the twitter client, created on the first tweet rather than on
+        startup.
+        """
+        if self.twitter is None:
+            self.twitter = Twitter()
+        return self.twitter
+
+    def send_tweet(self, text: str) -> Any:
+        return self.twitter_client().send(text)
+
+    async def verify_twitter(self) -> None:
+        """
+        A method that verifies the twitter credentials in a thread, a rejection is shown in
+        the message panel and the next tweet verifies them again.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self.twitter_client().verify)
+        except Exception as error:
+            self.log(f"twitter verification failed: {error}")
+            self.message.content = f"Twitter: {error}"
+            self.verify_task = None
+
+    def show_outbox_status(self, status: str) -> None:
+        self.message.content = status
 
     async def on_mount(self) -> None:
         view = await self.push_view(DockView())
         header = Header(tall=False)
         footer = Footer()
-        # initialize twitter api
-        self.twitter = Twitter()
-        # initialize deepgram api
-        self.recognizer = Recognizer()
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        # initialize
-        self.audio_recorder = AudioRecorder()
+        # the twitter client is created, and its credentials verified, on the first tweet:
+        # the startup makes no network request.
+        self.twitter: Optional[Twitter] = None
+        self.verify_task: Optional[asyncio.Task] = None
+        # microphone capture in callback mode, the UI stays live while recording.
+        self.audio_capture = AudioCapture()
+        self.vad = VoiceActivityDetector(rate=self.audio_capture.rate)
+        # live transcription, the samples are sent while they are captured.
+        self.streaming_recognizer = StreamingRecognizer(rate=self.audio_capture.rate)
+        self.record_task: Optional[asyncio.Task] = None
         # day index
         self.index = get_day_index()
         # self.result = True
-        # read files
-        self.guesses_list = read_from_file("wordle-guesses.txt")
-        self.answers_list = read_from_file("wordle-answers.txt")
+        # map the indexed word lists
+        self.word_store = WordStore.open()
+        # initialize the speech recognizer, deepgram or the local one, and warm it up in
+        # the background: the connection is opened, or the model loaded, before the first guess.
+        # a recognition has a deadline, its transient failures are retried.
+        self.recognizer = ResilientRecognizer(
+            create_recognizer(self.recognizer_backend, self.word_store),
+            hedge=self.hedge,
+        )
+        self.warm_task = asyncio.get_running_loop().create_task(self.recognizer.warm())
+        # deepgram is the only backend reading FLAC, the local one is sent WAV files anyway.
+        self.preprocessor = Preprocessor(
+            compress=self.compress and isinstance(self.recognizer.backend, Recognizer)
+        )
         # secret word to guess
-        self.secret = random.choice(self.answers_list)
+        self.secret = self.word_store.random_answer()
         self.message = MessagePanel("Press `r` to start recording audio...")
-        self.stats = MessagePanel("Stats: Coming Soon...")
+        # the results are tweeted from a journaled outbox, the posts left by the last
+        # session are sent first.
+        self.outbox = Outbox(self.send_tweet, on_status=self.show_outbox_status)
+        self.outbox.start()
+        self.stats = MessagePanel("Press `h` to get hints.")
+        # phonetic and trigram indices mapping transcripts to valid guesses.
+        self.word_matcher = WordMatcher(self.word_store)
+        # entropy-ranking engine, the pattern matrix is mapped on the first hint.
+        self.solver = Solver(self.word_store)
+        self.hint_task: Optional[asyncio.Task] = None
+        # the per-stage latency of the voice guesses, shown in the stats panel with `p`.
+        self.tracer = Tracer()
+        self.show_latency = False
+        # whether the recordings are spelled out letter by letter.
+        self.spelling = False
+        # whether the recordings are streamed and stop on the first word heard, toggled
+        # with `l`, deepgram is the only backend with a live endpoint.
+        self.streaming = False
         letters_grid = DockView()
-        self.letters_grid = LettersGrid()
+        self.letters_grid = LettersGrid(GameState(self.secret))
         await view.dock(header, edge="top")
         await letters_grid.dock(self.letters_grid, size=36, z=0, edge="top")
         await view.dock(footer, edge="bottom")
         await view.dock(self.stats, edge="left", size=40)
         await view.dock(self.message, edge="right", size=40)
         await view.dock(letters_grid, edge="left", z=-10)
+        self.mounted = True
+
+    def refresh(self, repaint: bool = True, layout: bool = False) -> None:
+        super().refresh(repaint, layout)
+        # the first frame is the first one drawn once the widgets are mounted.
+        if (
+            self.startup_profile
+            and MainApp.first_frame_at is None
+            and getattr(self, "mounted", False)
+        ):
+            MainApp.first_frame_at = time.perf_counter()
+            loop = asyncio.get_running_loop()
+            self.quit_task = loop.create_task(self.action_quit())
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == "simulate":
+        from deepwordle.simulate import (
+            main as simulate,
+        )
+
+        return simulate(argv[1:])
+    if argv and argv[0] == "benchmark":
+        from deepwordle.recognizers import (
+            main as benchmark,
+        )
 
+        return benchmark(argv[1:])
+    parser = argparse.ArgumentParser(prog="deepwordle")
+    parser.add_argument(
+        "--recognizer",
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help="the speech recognizer, DEEPWORDLE_RECOGNIZER by default",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="send a second request when a recognition is slower than usual",
+    )
+    parser.add_argument(
+        "--compress",
+        action="store_true",
+        default=COMPRESS,
+        help="upload the recordings as FLAC rather than WAV, with the deepgram recognizer, "
+        "DEEPWORDLE_COMPRESS by default",
+    )
+    parser.add_argument(
+        "--startup-profile",
+        action="store_true",
+        help="report the import time of every package and the time to the first frame",
+    )
+    args = parser.parse_args(argv)
+    MainApp.recognizer_backend = args.recognizer
+    MainApp.hedge = args.hedge
+    MainApp.compress = args.compress
+    if args.startup_profile:
+        from deepwordle.startup import (
+            profile_imports,
+        )
 
-def main(argv=None) -> int:
+        profile = profile_imports()
+        MainApp.startup_profile = True
+    started_at = time.perf_counter()
     try:
         MainApp.run(title="DeepWordle", log="textual.log", log_verbosity=2)
     except KeyboardInterrupt:
         return -1
+    if args.startup_profile:
+        if MainApp.first_frame_at is not None:
+            profile.first_frame = MainApp.first_frame_at - started_at
+        print(profile.format())
     return 0
 
 
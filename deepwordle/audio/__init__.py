@@ -0,0 +1,24 @@
+"""
+| Top-level package for audio.
+
+| ``audio`` holds the capture side of the game: the microphone, the buffers the samples go through
+| and the processing they get before being transcribed.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from deepwordle.audio.capture import (
+    AudioCapture,
+)
+from deepwordle.audio.ring_buffer import (
+    RingBuffer,
+)
+from deepwordle.audio.vad import (
+    VoiceActivityDetector,
+)
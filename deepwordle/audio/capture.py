@@ -0,0 +1,242 @@
+"""
+| The following script implements the non-blocking microphone capture engine.
+
+| PyAudio runs the stream in callback mode: PortAudio calls `_callback` from its own thread with every
+| buffer of frames, the callback copies it into a preallocated ring buffer and wakes the asyncio loop.
+| Nothing blocks the loop, so keystrokes, repaints and the message panel stay live while the audio is
+| being captured, and the samples are consumed as awaitable chunks.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import asyncio
+from attrs import (
+    define,
+    field,
+)
+import numpy as np
+from typing import (
+    Any,
+    AsyncIterator,
+    Optional,
+    Tuple,
+)
+
+from deepwordle.audio.ring_buffer import (
+    RingBuffer,
+)
+from deepwordle.audio.vad import (
+    VoiceActivityDetector,
+)
+from deepwordle.audio.wav import (
+    SAMPLE_WIDTH,
+    WavBuffer,
+)
+
+# the value of `pyaudio.paContinue`, returned by the callback to keep the stream running.
+PA_CONTINUE = 0
+# the number of seconds of audio the ring buffer holds.
+BUFFER_SECONDS = 10
+# the sample rate of the microphone.
+RATE = 44100
+
+
+@define
+class AudioCapture:
+    """
+    A brief encapsulation of a microphone stream in callback mode.
+
+    Attrs:
+        rate: An integer indicating how many samples per second: frequency.
+        channels: An integer indicating how many channels a microphone has.
+        frames_per_buffer: An integer indicating the number of frames per callback.
+        py_audio: pyaudio instance, created on the first start.
+        ring: the ring buffer the callback writes the samples into.
+        wav: the preallocated WAV file the recordings are written into.
+        stream: the PyAudio stream, while capturing.
+        loop: the event loop to wake up when samples arrive.
+        ready: set by the callback when samples are available or the capture stopped.
+    """
+
+    _rate: int = field(default=RATE)
+    _channels: int = field(default=1)
+    _frames_per_buffer: int = field(default=1024)
+    _py_audio: Any = field(default=None)
+    _ring: RingBuffer = field(init=False, repr=False)
+    _wav: WavBuffer = field(init=False, repr=False)
+    _stream: Any = field(init=False, default=None, repr=False)
+    _loop: Optional[asyncio.AbstractEventLoop] = field(
+        init=False, default=None, repr=False
+    )
+    _ready: Optional[asyncio.Event] = field(init=False, default=None, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._ring = RingBuffer(self._rate * self._channels * BUFFER_SECONDS)
+        self._wav = WavBuffer(
+            self._rate * self._channels * BUFFER_SECONDS, self._rate, self._channels
+        )
+
+    @property
+    def rate(self) -> int:
+        """
+        A getter method that returns the value of the `rate` attribute.
+        :param self: Instance of the class.
+        :return: An integer that represents the value of the `rate` attribute.
+        """
+        if not hasattr(self, "_rate"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named rate."
+            )
+        return self._rate
+
+    @property
+    def channels(self) -> int:
+        """
+        A getter method that returns the value of the `channels` attribute.
+        :param self: Instance of the class.
+        :return: An integer that represents the value of the `channels` attribute.
+        """
+        if not hasattr(self, "_channels"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named channels."
+            )
+        return self._channels
+
+    @property
+    def ring(self) -> RingBuffer:
+        """
+        A getter method that returns the value of the `ring` attribute.
+        :param self: Instance of the class.
+        :return: A ring buffer that represents the value of the `ring` attribute.
+        """
+        return self._ring
+
+    @property
+    def capturing(self) -> bool:
+        return self._stream is not None
+
+    def _callback(
+        self, in_data: bytes, frame_count: int, time_info: Any, status: int
+    ) -> Tuple[None, int]:
+        """
+        A helper method called by PortAudio, in its own thread, with every buffer of frames.
+        It must return quickly: it copies the frames and schedules the wake up of the loop.
+        """
+        self._ring.write(in_data)
+        if self._loop is not None and self._ready is not None:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        return None, PA_CONTINUE
+
+    def start(self) -> None:
+        """
+        A method that opens the microphone stream, it has to be called from the event loop.
+        """
+        if self.capturing:
+            return
+        if self._py_audio is None:
+            import pyaudio  # type: ignore
+
+            self._py_audio = pyaudio.PyAudio()
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._ring.clear()
+        self._stream = self._py_audio.open(
+            format=self._py_audio.get_format_from_width(SAMPLE_WIDTH),
+            channels=self._channels,
+            rate=self._rate,
+            input=True,
+            frames_per_buffer=self._frames_per_buffer,
+            stream_callback=self._callback,
+        )
+        self._stream.start_stream()
+
+    def stop(self) -> None:
+        """
+        A method that closes the microphone stream. The samples already captured can still
+        be read.
+        """
+        stream, self._stream = self._stream, None
+        if stream is not None:
+            stream.stop_stream()
+            stream.close()
+        if self._ready is not None:
+            self._ready.set()
+
+    def close(self) -> None:
+        self.stop()
+        if self._py_audio is not None:
+            self._py_audio.terminate()
+            self._py_audio = None
+
+    async def chunks(self) -> AsyncIterator[np.ndarray]:
+        """
+        A method that yields the captured samples as they arrive, until the capture stops
+        and the ring buffer is drained.
+        """
+        while self._ready is not None:
+            if self._ring.available:
+                yield self._ring.read()
+            elif not self.capturing:
+                return
+            else:
+                await self._ready.wait()
+                self._ready.clear()
+
+    async def record(
+        self, duration: float, vad: Optional[VoiceActivityDetector] = None
+    ) -> np.ndarray:
+        """
+        A method that captures `duration` seconds of audio without blocking the event loop.
+        With a voice activity detector, the capture stops as soon as the utterance is over
+        and `duration` is only its maximum length. The samples are a view of the WAV buffer,
+        overwritten by the next recording.
+        """
+        size = int(self._rate * duration) * self._channels
+        if size > self._wav.capacity:
+            self._wav = WavBuffer(size, self._rate, self._channels)
+        samples = self._wav.samples
+        count = 0
+        if vad is not None:
+            vad.reset()
+        self.start()
+        chunks = self.chunks()
+        try:
+            async for chunk in chunks:
+                chunk = chunk[: size - count]
+                samples[count : count + len(chunk)] = chunk
+                count += len(chunk)
+                if count == size or (vad is not None and vad.feed(chunk)):
+                    break
+        finally:
+            self.stop()
+            await chunks.aclose()
+        return samples[:count]
+
+    async def record_wav(
+        self, duration: float, vad: Optional[VoiceActivityDetector] = None
+    ) -> memoryview:
+        """
+        A method that records like `record` and returns the recording as a WAV file in
+        memory, a view of the buffer the samples were captured into.
+        """
+        samples = await self.record(duration, vad)
+        return self._wav.view(len(samples))
+
+
+def main() -> int:
+    audio_capture = AudioCapture()
+    samples = asyncio.run(audio_capture.record(2))
+    audio_capture.close()
+    print(f"{len(samples)} samples, peak {np.abs(samples).max(initial=0)}")
+    print(audio_capture.ring)
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+"""
+| The following script implements a small lossless FLAC encoder for mono int16 recordings.
+
+| Speech is smooth: a sample is well predicted by a polynomial through the few previous ones, so the
+| residuals of the prediction are small and cost a few bits each once Rice coded. For every block of
+| samples, the encoder computes the residuals of the five fixed FLAC predictors at once with
+| `np.diff`, keeps the order and the Rice partitioning needing the fewest bits and packs the bits of
+| the whole frame with a few NumPy operations. A recording shrinks to about half of its WAV size.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import hashlib
+import numpy as np
+from typing import (
+    List,
+    Tuple,
+)
+
+BLOCK_SIZE = 4096
+BITS_PER_SAMPLE = 16
+MAX_ORDER = 4
+MAX_PARTITION_ORDER = 4
+# the largest Rice parameter of the 4 bits coding method, 15 is the escape code.
+MAX_RICE_PARAMETER = 14
+# the block size code of a frame whose size, minus one, follows the header on 16 bits.
+BLOCK_SIZE_16_BITS = 0b0111
+BLOCK_SIZE_CODES = {256: 0b1000, 512: 0b1001, 1024: 0b1010, 2048: 0b1011, 4096: 0b1100}
+
+
+def _crc_table(polynomial: int, width: int) -> List[int]:
+    table = []
+    top, mask = 1 << (width - 1), (1 << width) - 1
+    for byte in range(256):
+        crc = byte << (width - 8)
+        for _ in range(8):
+            crc = ((crc << 1) ^ polynomial) if crc & top else crc << 1
+        table.append(crc & mask)
+    return table
+
+
+CRC8_TABLE = _crc_table(0x07, 8)
+CRC16_TABLE = _crc_table(0x8005, 16)
+
+
+def crc8(data: bytes) -> int:
+    crc = 0
+    for byte in data:
+        crc = CRC8_TABLE[crc ^ byte]
+    return crc
+
+
+def crc16(data: bytes) -> int:
+    crc = 0
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFF) ^ CRC16_TABLE[(crc >> 8) ^ byte]
+    return crc
+
+
+def pack_bits(values: np.ndarray, widths: np.ndarray) -> bytes:
+    """
+    A function that writes every value on its width in bits, most significant bit first,
+    and pads the stream with zeros up to a whole byte.
+    """
+    values = np.asarray(values, dtype=np.uint64)
+    widths = np.asarray(widths, dtype=np.int64)
+    owners = np.repeat(np.arange(len(values)), widths)
+    offsets = np.arange(len(owners)) - np.repeat(np.cumsum(widths) - widths, widths)
+    # unary codes are a 1 on many bits, the shift has to stay below 64.
+    shifts = np.minimum(widths[owners] - 1 - offsets, 63).astype(np.uint64)
+    bits = (values[owners] >> shifts) & np.uint64(1)
+    return np.packbits(bits.astype(np.uint8)).tobytes()
+
+
+def utf8_number(number: int) -> bytes:
+    """
+    A function that encodes a frame number with the extended UTF-8 scheme of FLAC.
+    """
+    if number < 0x80:
+        return bytes([number])
+    size = 2
+    while number >= 1 << (5 * size + 1):
+        size += 1
+    tail = [0x80 | (number >> (6 * index)) & 0x3F for index in range(size - 1)]
+    head = (0xFF << (8 - size)) & 0xFF | number >> (6 * (size - 1))
+    return bytes([head] + tail[::-1])
+
+
+def rice_partitions(
+    folded: np.ndarray, size: int, order: int
+) -> Tuple[int, int, np.ndarray, np.ndarray]:
+    """
+    A function that returns the bits taken by the folded residuals of a block, with the
+    best partition order, the lengths of its partitions and their Rice parameters. The
+    sums of the finest partitions are computed once, in one pass, and merged pairwise for
+    the coarser orders.
+    """
+    partition_order = 0
+    while (
+        partition_order < MAX_PARTITION_ORDER
+        and size % (2 << partition_order) == 0
+        and size >> (partition_order + 1) > order
+    ):
+        partition_order += 1
+    lengths = np.full(1 << partition_order, size >> partition_order, dtype=np.int64)
+    # the first partition holds the warm-up samples, not their residuals.
+    lengths[0] -= order
+    starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+    parameters = np.arange(MAX_RICE_PARAMETER + 1, dtype=np.uint64)
+    sums = np.add.reduceat(folded[None, :] >> parameters[:, None], starts, axis=1)
+    sums = sums.astype(np.int64)
+    best = None
+    while True:
+        costs = sums + (parameters[:, None].astype(np.int64) + 1) * lengths
+        chosen = np.argmin(costs, axis=0)
+        bits = int(costs[chosen, np.arange(len(lengths))].sum()) + 4 * len(lengths)
+        if best is None or bits < best[0]:
+            best = (bits, partition_order, lengths, chosen.astype(np.uint64))
+        if not partition_order:
+            return best
+        partition_order -= 1
+        sums = sums.reshape(len(parameters), -1, 2).sum(axis=2)
+        lengths = lengths.reshape(-1, 2).sum(axis=1)
+
+
+def encode_subframe(block: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    A function that returns the values and the widths in bits of the smallest fixed
+    predictor subframe of a block of samples.
+    """
+    size = len(block)
+    samples = block.astype(np.int64)
+    if np.all(samples == samples[0]):
+        # a CONSTANT subframe, e.g. digital silence.
+        return (
+            np.array([0, samples[0] & 0xFFFF], dtype=np.uint64),
+            np.array([8, BITS_PER_SAMPLE]),
+        )
+    best = None
+    for order in range(min(MAX_ORDER, size - 1) + 1):
+        residuals = np.diff(samples, n=order) if order else samples
+        # zigzag folding: 0, -1, 1, -2, 2... to 0, 1, 2, 3, 4...
+        folded = np.where(residuals >= 0, residuals << 1, ((-residuals) << 1) - 1)
+        bits, partition_order, lengths, parameters = rice_partitions(
+            folded.astype(np.uint64), size, order
+        )
+        bits += order * BITS_PER_SAMPLE
+        if best is None or bits < best[0]:
+            best = (bits, order, partition_order, lengths, parameters, folded)
+    _, order, partition_order, lengths, parameters, folded = best
+    folded = folded.astype(np.uint64)
+    # a zero bit, the FIXED type holding the order and no wasted bits.
+    values = [(0b001000 | order) << 1, *(samples[:order] & 0xFFFF), 0, partition_order]
+    widths = [8, *([BITS_PER_SAMPLE] * order), 2, 4]
+    value_parts, width_parts = [np.array(values, dtype=np.uint64)], [np.array(widths)]
+    for partition, parameter in zip(
+        np.split(folded, np.cumsum(lengths)[:-1]), parameters
+    ):
+        codes = np.empty(2 * len(partition) + 1, dtype=np.uint64)
+        code_widths = np.empty(2 * len(partition) + 1, dtype=np.int64)
+        codes[0], code_widths[0] = parameter, 4
+        # a unary quotient, zeros ended by a one, followed by the low bits.
+        codes[1::2] = 1
+        code_widths[1::2] = (partition >> parameter).astype(np.int64) + 1
+        codes[2::2] = partition & ((np.uint64(1) << parameter) - np.uint64(1))
+        code_widths[2::2] = int(parameter)
+        value_parts.append(codes)
+        width_parts.append(code_widths)
+    return np.concatenate(value_parts), np.concatenate(width_parts)
+
+
+def encode_frame(block: np.ndarray, number: int) -> bytes:
+    """
+    A function that encodes a block of samples as a frame, header and footer included.
+    """
+    size = len(block)
+    size_code = BLOCK_SIZE_CODES.get(size, BLOCK_SIZE_16_BITS)
+    # sync code, fixed block size, sample rate from STREAMINFO, mono, 16 bits per sample.
+    header = pack_bits(
+        [0b11111111111110, 0, 0, size_code, 0b0000, 0b0000, 0b100, 0],
+        [14, 1, 1, 4, 4, 4, 3, 1],
+    )
+    header += utf8_number(number)
+    if size_code == BLOCK_SIZE_16_BITS:
+        header += (size - 1).to_bytes(2, "big")
+    header += bytes([crc8(header)])
+    values, widths = encode_subframe(block)
+    frame = header + pack_bits(values, widths)
+    return frame + crc16(frame).to_bytes(2, "big")
+
+
+def encode_flac(samples: np.ndarray, rate: int, block_size: int = BLOCK_SIZE) -> bytes:
+    """
+    A function that encodes mono int16 samples as a FLAC file.
+    """
+    samples = np.asarray(samples, dtype=np.int16)
+    frames = [
+        encode_frame(samples[start : start + block_size], index)
+        for index, start in enumerate(range(0, len(samples), block_size))
+    ]
+    last_size = len(samples) % block_size or block_size
+    streaminfo = pack_bits(
+        [
+            block_size,
+            block_size,
+            min(map(len, frames), default=0),
+            max(map(len, frames), default=0),
+            rate,
+            0,
+            BITS_PER_SAMPLE - 1,
+            len(samples) >> 4,
+            len(samples) & 0xF,
+        ],
+        [16, 16, 24, 24, 20, 3, 5, 32, 4],
+    )
+    if len(frames) == 1:
+        # a single frame shorter than the block size.
+        streaminfo = last_size.to_bytes(2, "big") * 2 + streaminfo[4:]
+    streaminfo += hashlib.md5(samples.astype("<i2").tobytes()).digest()
+    # the last metadata block, of type STREAMINFO, 34 bytes long.
+    return b"fLaC" + bytes([0x80, 0, 0, 34]) + streaminfo + b"".join(frames)
@@ -0,0 +1,241 @@
+"""
+| The following script implements the preprocessing of the recordings before they are uploaded.
+
+| A recording is captured at 44.1 kHz, about 88 KB per second, while the recognizer works on 16 kHz
+| speech and does not need the silence around the word. Before the upload, the silence is trimmed with
+| the voice activity detector, the samples are resampled to 16 kHz with a polyphase filter, the
+| outputs of each phase being a single matrix product over a strided view of the input, and they are
+| optionally encoded as FLAC. The bytes and the upload time saved are reported for every recording.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from attrs import (
+    define,
+    field,
+)
+from math import gcd
+import numpy as np
+import os
+import time
+from typing import (
+    Dict,
+    Tuple,
+    Union,
+)
+
+from deepwordle.audio.flac import (
+    encode_flac,
+)
+from deepwordle.audio.vad import (
+    endpoints,
+)
+from deepwordle.audio.wav import (
+    HEADER_SIZE,
+    SAMPLE_WIDTH,
+    wav_bytes,
+)
+
+TARGET_RATE = 16000
+# whether the recordings are uploaded as FLAC, the `--compress` option of the game.
+COMPRESS = os.environ.get("DEEPWORDLE_COMPRESS", "") not in ("", "0")
+# the seconds of audio kept around the speech, so the first and last sounds are not clipped.
+TRIM_PADDING = 0.1
+# the zero crossings of the windowed sinc on each side, the length of the filter.
+ZERO_CROSSINGS = 16
+KAISER_BETA = 8.0
+# the uplink the time saved is estimated with, 1 Mbit/s.
+UPLINK_BYTES_PER_SECOND = 125_000
+
+_banks: Dict[Tuple[int, int], np.ndarray] = {}
+
+
+def polyphase_bank(up: int, down: int) -> np.ndarray:
+    """
+    A function that designs the low-pass filter of a resampling by `up / down`, a Kaiser
+    windowed sinc, and splits it into its `up` phases: row `p` holds the taps applied,
+    oldest input sample first, when an output sample falls on the phase `p` of the input.
+    """
+    if (up, down) not in _banks:
+        factor = max(up, down)
+        half = ZERO_CROSSINGS * factor
+        taps = np.arange(-half, half + 1)
+        kernel = np.sinc(taps / factor) / factor * up
+        kernel *= np.kaiser(len(kernel), KAISER_BETA)
+        size = -(-len(kernel) // up) * up
+        kernel = np.concatenate((kernel, np.zeros(size - len(kernel))))
+        _banks[up, down] = kernel.reshape(-1, up).T[:, ::-1].astype(np.float32)
+    return _banks[up, down]
+
+
+def resample(
+    samples: np.ndarray, rate: int, target_rate: int = TARGET_RATE
+) -> np.ndarray:
+    """
+    A function that resamples int16 samples from `rate` to `target_rate`.
+
+    The output samples `n = q * up + r` share the same phase for a given `r`, and the
+    inputs they depend on start every `down` samples: for each phase, the windows of
+    input are a strided view of the samples and the outputs a single matrix product.
+    """
+    divisor = gcd(rate, target_rate)
+    up, down = target_rate // divisor, rate // divisor
+    if up == down or not len(samples):
+        return samples
+    bank = polyphase_bank(up, down)
+    taps = bank.shape[1]
+    half = ZERO_CROSSINGS * max(up, down)
+    count = -(-len(samples) * up // down)
+    padded = np.zeros(len(samples) + 2 * taps + down, dtype=np.float32)
+    padded[taps : taps + len(samples)] = samples
+    windows = np.lib.stride_tricks.sliding_window_view(padded, taps)
+    output = np.empty(count, dtype=np.float32)
+    for remainder in range(min(up, count)):
+        # the position of the output on the upsampled time line, shifted by the delay
+        # of the filter, gives its phase and the window of input it depends on.
+        position = remainder * down + half
+        first = position // up + 1
+        rows = windows[first::down][: len(range(remainder, count, up))]
+        output[remainder::up] = rows @ bank[position % up]
+    return np.clip(np.rint(output), -32768, 32767).astype(np.int16)
+
+
+def trim(samples: np.ndarray, rate: int, padding: float = TRIM_PADDING) -> np.ndarray:
+    """
+    A function that drops the silence before the first and after the last voiced sample,
+    keeping `padding` seconds around them. Recordings without speech are kept whole.
+    """
+    seconds = len(samples) / rate
+    # a trailing silence as long as the recording: the end is the last voiced sample.
+    bounds = endpoints(samples, rate, trailing_silence=seconds + 1)
+    if bounds is None:
+        return samples
+    margin = int(padding * rate)
+    start, end = bounds
+    return samples[max(start - margin, 0) : min(end + margin, len(samples))]
+
+
+@define
+class PreprocessReport:
+    """
+    A brief encapsulation of what the preprocessing of a recording saved.
+
+    Attrs:
+        input_bytes: the size of the recording as a WAV file.
+        output_bytes: the size of the uploaded file.
+        input_seconds: the duration of the recording.
+        output_seconds: the duration of the uploaded audio.
+        seconds: the time spent preprocessing.
+    """
+
+    input_bytes: int
+    output_bytes: int
+    input_seconds: float
+    output_seconds: float
+    seconds: float
+
+    @property
+    def saved_bytes(self) -> int:
+        return self.input_bytes - self.output_bytes
+
+    def saved_seconds(self, uplink: float = UPLINK_BYTES_PER_SECOND) -> float:
+        """
+        A method that estimates the end-to-end latency saved: the upload time of the bytes
+        saved on an `uplink` bytes per second connection, minus the preprocessing time.
+        """
+        return self.saved_bytes / uplink - self.seconds
+
+    def format(self, uplink: float = UPLINK_BYTES_PER_SECOND) -> str:
+        return (
+            f"{self.output_bytes / 1000:.1f} KB sent instead of "
+            f"{self.input_bytes / 1000:.1f} KB, "
+            f"~{self.saved_seconds(uplink) * 1000:.0f} ms saved"
+        )
+
+
+@define
+class Preprocessor:
+    """
+    A brief encapsulation of the preprocessing applied to the recordings.
+
+    Attrs:
+        target_rate: the sample rate of the uploaded audio.
+        trim_silence: whether the silence around the speech is dropped.
+        compress: whether the audio is uploaded as FLAC instead of WAV.
+        padding: the seconds of audio kept around the speech.
+    """
+
+    _target_rate: int = field(default=TARGET_RATE)
+    _trim_silence: bool = field(default=True)
+    _compress: bool = field(default=False)
+    _padding: float = field(default=TRIM_PADDING)
+
+    @property
+    def compress(self) -> bool:
+        """
+        A getter method that returns the value of the `compress` attribute.
+        :param self: Instance of the class.
+        :return: A boolean that represents the value of the `compress` attribute.
+        """
+        return self._compress
+
+    @compress.setter
+    def compress(self, value: bool) -> None:
+        """
+        A setter method that changes the value of the `compress` attribute.
+        :param value: A boolean that represents the value of the `compress` attribute.
+        :return: None.
+        """
+        setattr(self, "_compress", value)
+
+    @property
+    def mimetype(self) -> str:
+        return "audio/flac" if self._compress else "audio/wav"
+
+    def process(
+        self, samples: np.ndarray, rate: int
+    ) -> Tuple[Union[bytes, memoryview], PreprocessReport]:
+        """
+        A method that turns the mono int16 samples of a recording into the file to upload,
+        along with the report of what was saved.
+        """
+        start = time.perf_counter()
+        output = samples
+        if self._trim_silence:
+            output = trim(output, rate, self._padding)
+        output = resample(output, rate, self._target_rate)
+        if self._compress:
+            data = encode_flac(output, self._target_rate)
+        else:
+            data = wav_bytes(output, self._target_rate)
+        report = PreprocessReport(
+            input_bytes=HEADER_SIZE + len(samples) * SAMPLE_WIDTH,
+            output_bytes=len(data),
+            input_seconds=len(samples) / rate,
+            output_seconds=len(output) / self._target_rate,
+            seconds=time.perf_counter() - start,
+        )
+        return data, report
+
+
+def main() -> int:
+    rate = 44100
+    rng = np.random.default_rng(0)
+    time_line = np.arange(int(rate * 0.5)) / rate
+    word = 6000 * np.sin(2 * np.pi * 220 * time_line) * np.hanning(len(time_line))
+    samples = np.concatenate((np.zeros(rate // 2), word, np.zeros(rate)))
+    samples = (samples + rng.normal(0, 40, len(samples))).astype(np.int16)
+    for compress in (False, True):
+        _, report = Preprocessor(compress=compress).process(samples, rate)
+        print(report.format(), f"({report.seconds * 1000:.1f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
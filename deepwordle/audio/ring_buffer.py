@@ -0,0 +1,118 @@
+"""
+| The following script implements the single-producer, single-consumer ring buffer of samples.
+
+| The samples are stored in a preallocated NumPy array. The producer, the PortAudio callback thread,
+| only ever moves the write counter and the consumer, the asyncio loop, only ever moves the read
+| counter. Both counters grow forever and are turned into positions modulo the capacity, so no lock is
+| needed: each side publishes its counter after copying the samples, and a Python integer assignment
+| is atomic. When the consumer falls behind, the samples that do not fit are dropped and counted.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import numpy as np
+from typing import (
+    Optional,
+    Union,
+)
+
+
+class RingBuffer:
+    """
+    A lock-free ring buffer of samples, for one producer thread and one consumer thread.
+    """
+
+    __slots__ = ("_buffer", "_capacity", "_written", "_read", "_overruns")
+
+    def __init__(self, capacity: int, dtype: np.dtype = np.int16) -> None:
+        if capacity <= 0:
+            raise ValueError("The capacity of a ring buffer must be positive.")
+        self._buffer = np.zeros(capacity, dtype=dtype)
+        self._capacity = capacity
+        self._written = 0
+        self._read = 0
+        self._overruns = 0
+
+    @property
+    def capacity(self) -> int:
+        """
+        A getter method that returns the value of the `capacity` attribute.
+        :param self: Instance of the class.
+        :return: An integer that represents the number of samples the buffer holds.
+        """
+        return self._capacity
+
+    @property
+    def available(self) -> int:
+        """
+        A getter method that returns the number of samples written but not read yet.
+        """
+        return self._written - self._read
+
+    @property
+    def free(self) -> int:
+        """
+        A getter method that returns the number of samples that can be written.
+        """
+        return self._capacity - (self._written - self._read)
+
+    @property
+    def overruns(self) -> int:
+        """
+        A getter method that returns the number of samples dropped because the buffer was full.
+        """
+        return self._overruns
+
+    def write(self, samples: Union[bytes, np.ndarray]) -> int:
+        """
+        A method, for the producer only, that copies samples into the buffer and returns
+        how many of them fit. The rest is dropped.
+        """
+        if not isinstance(samples, np.ndarray):
+            samples = np.frombuffer(samples, dtype=self._buffer.dtype)
+        count = min(len(samples), self._capacity - (self._written - self._read))
+        self._overruns += len(samples) - count
+        start = self._written % self._capacity
+        head = min(count, self._capacity - start)
+        self._buffer[start : start + head] = samples[:head]
+        self._buffer[: count - head] = samples[head:count]
+        # publish the samples only once they are copied.
+        self._written += count
+        return count
+
+    def read(self, count: Optional[int] = None) -> np.ndarray:
+        """
+        A method, for the consumer only, that moves up to `count` samples, all the available
+        ones by default, out of the buffer into a new array.
+        """
+        available = self._written - self._read
+        count = available if count is None else min(count, available)
+        start = self._read % self._capacity
+        head = min(count, self._capacity - start)
+        samples = np.concatenate(
+            (self._buffer[start : start + head], self._buffer[: count - head])
+        )
+        # release the space only once the samples are copied.
+        self._read += count
+        return samples
+
+    def clear(self) -> None:
+        """
+        A method, for the consumer only, that drops all the available samples.
+        """
+        self._read = self._written
+
+    def __len__(self) -> int:
+        return self._written - self._read
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(capacity={self._capacity}, "
+            f"available={self.available}, overruns={self._overruns})"
+        )
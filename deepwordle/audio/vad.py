@@ -0,0 +1,275 @@
+"""
+| The following script implements the energy-based voice activity detection of the recordings.
+
+| A recording used to last a fixed two seconds, however long the word took to say. The detector cuts
+| the captured samples into frames of 20 ms and computes their energy, the root mean square of the
+| samples, with a handful of NumPy operations per chunk. A frame is voiced when its energy is above both
+| an absolute floor and a multiple of the noise floor, an average of the energy of the unvoiced frames.
+| Speech starts after a few voiced frames in a row and the utterance ends after a configurable trailing
+| silence, or after a hard maximum length, so a short word is done in well under a second.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from attrs import (
+    define,
+    field,
+)
+import numpy as np
+from typing import (
+    Optional,
+    Tuple,
+    Union,
+)
+
+FRAME_SECONDS = 0.02
+# the voiced seconds in a row marking the onset of speech, shorter bursts are clicks.
+ONSET_SECONDS = 0.06
+# the unvoiced seconds ending an utterance.
+TRAILING_SILENCE = 0.3
+MAX_SECONDS = 2.0
+# the energy, in int16 units, below which a frame is never voiced: about -40 dBFS.
+MIN_ENERGY = 300.0
+# how many times louder than the noise floor a voiced frame is.
+ENERGY_RATIO = 3.0
+# the weight of the last unvoiced frame in the noise floor.
+NOISE_SMOOTHING = 0.05
+
+
+def frame_energies(samples: np.ndarray, frame_size: int) -> np.ndarray:
+    """
+    A function that computes the root mean square of every complete frame of samples.
+    """
+    count = len(samples) // frame_size
+    frames = samples[: count * frame_size].reshape(count, frame_size)
+    frames = frames.astype(np.float32)
+    return np.sqrt(np.einsum("ij,ij->i", frames, frames) / frame_size)
+
+
+@define
+class VoiceActivityDetector:
+    """
+    A brief encapsulation of the state of the endpointing of an utterance.
+
+    Attrs:
+        rate: An integer indicating how many samples per second: frequency.
+        trailing_silence: the seconds of silence ending an utterance.
+        max_seconds: the seconds after which the utterance ends anyway.
+        onset_seconds: the voiced seconds in a row marking the onset of speech.
+        min_energy: the energy below which a frame is never voiced.
+        energy_ratio: how many times louder than the noise floor a voiced frame is.
+        frame_size: the number of samples of a frame.
+        pending: the samples of the last incomplete frame.
+        pending_count: the number of samples in `pending`.
+        samples: the number of samples fed so far.
+        noise: the noise floor, None until an unvoiced frame is seen.
+        voiced_run: the number of voiced frames in a row.
+        silent_run: the number of unvoiced frames since the last voiced one.
+        speech_start: the index of the first sample of speech, None before the onset.
+        speech_end: the index following the last voiced sample.
+        done: whether the utterance is over.
+    """
+
+    _rate: int = field(default=44100)
+    _trailing_silence: float = field(default=TRAILING_SILENCE)
+    _max_seconds: float = field(default=MAX_SECONDS)
+    _onset_seconds: float = field(default=ONSET_SECONDS)
+    _min_energy: float = field(default=MIN_ENERGY)
+    _energy_ratio: float = field(default=ENERGY_RATIO)
+    _frame_size: int = field(init=False, repr=False)
+    _pending: np.ndarray = field(init=False, repr=False)
+    _pending_count: int = field(init=False, default=0, repr=False)
+    _samples: int = field(init=False, default=0)
+    _noise: Optional[float] = field(init=False, default=None, repr=False)
+    _voiced_run: int = field(init=False, default=0, repr=False)
+    _silent_run: int = field(init=False, default=0, repr=False)
+    _speech_start: Optional[int] = field(init=False, default=None)
+    _speech_end: int = field(init=False, default=0)
+    _done: bool = field(init=False, default=False)
+
+    def __attrs_post_init__(self) -> None:
+        self._frame_size = max(int(self._rate * FRAME_SECONDS), 1)
+        self._pending = np.empty(self._frame_size, dtype=np.int16)
+
+    @property
+    def rate(self) -> int:
+        """
+        A getter method that returns the value of the `rate` attribute.
+        :param self: Instance of the class.
+        :return: An integer that represents the value of the `rate` attribute.
+        """
+        return self._rate
+
+    @property
+    def trailing_silence(self) -> float:
+        """
+        A getter method that returns the value of the `trailing_silence` attribute.
+        :param self: Instance of the class.
+        :return: A float that represents the value of the `trailing_silence` attribute.
+        """
+        return self._trailing_silence
+
+    @trailing_silence.setter
+    def trailing_silence(self, value: float) -> None:
+        """
+        A setter method that changes the value of the `trailing_silence` attribute.
+        :param value: A float that represents the value of the `trailing_silence` attribute.
+        :return: None.
+        """
+        setattr(self, "_trailing_silence", value)
+
+    @property
+    def max_seconds(self) -> float:
+        """
+        A getter method that returns the value of the `max_seconds` attribute.
+        :param self: Instance of the class.
+        :return: A float that represents the value of the `max_seconds` attribute.
+        """
+        return self._max_seconds
+
+    @max_seconds.setter
+    def max_seconds(self, value: float) -> None:
+        """
+        A setter method that changes the value of the `max_seconds` attribute.
+        :param value: A float that represents the value of the `max_seconds` attribute.
+        :return: None.
+        """
+        setattr(self, "_max_seconds", value)
+
+    @property
+    def samples(self) -> int:
+        return self._samples
+
+    @property
+    def speech_start(self) -> Optional[int]:
+        return self._speech_start
+
+    @property
+    def speech_end(self) -> int:
+        return self._speech_end
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def reset(self) -> None:
+        """
+        A method that forgets the previous utterance, the noise floor included.
+        """
+        self._pending_count = 0
+        self._samples = 0
+        self._noise = None
+        self._voiced_run = 0
+        self._silent_run = 0
+        self._speech_start = None
+        self._speech_end = 0
+        self._done = False
+
+    def _is_voiced(self, energy: float) -> bool:
+        threshold = self._min_energy
+        if self._noise is not None:
+            threshold = max(threshold, self._noise * self._energy_ratio)
+        if energy > threshold:
+            return True
+        self._noise = (
+            energy
+            if self._noise is None
+            else self._noise + NOISE_SMOOTHING * (energy - self._noise)
+        )
+        return False
+
+    def feed(self, samples: Union[bytes, np.ndarray]) -> bool:
+        """
+        A method that consumes a chunk of captured samples and returns whether the
+        utterance is over. The samples following the end of the utterance are ignored.
+        """
+        if self._done:
+            return True
+        if not isinstance(samples, np.ndarray):
+            samples = np.frombuffer(samples, dtype=np.int16)
+        size = self._frame_size
+        if self._pending_count:
+            # complete the frame left over by the previous chunk.
+            count = min(size - self._pending_count, len(samples))
+            self._pending[self._pending_count : self._pending_count + count] = samples[
+                :count
+            ]
+            self._pending_count += count
+            samples = samples[count:]
+            if self._pending_count < size:
+                return False
+            self._pending_count = 0
+            energies = np.concatenate(
+                (frame_energies(self._pending, size), frame_energies(samples, size))
+            )
+        else:
+            energies = frame_energies(samples, size)
+        rest = len(samples) % size
+        if rest:
+            self._pending[:rest] = samples[len(samples) - rest :]
+            self._pending_count = rest
+        onset_frames = max(int(round(self._onset_seconds / FRAME_SECONDS)), 1)
+        trailing_frames = max(int(round(self._trailing_silence / FRAME_SECONDS)), 1)
+        max_samples = int(self._max_seconds * self._rate)
+        for energy in energies.tolist():
+            self._samples += size
+            if self._is_voiced(energy):
+                self._voiced_run += 1
+                self._silent_run = 0
+                if self._speech_start is None and self._voiced_run >= onset_frames:
+                    self._speech_start = self._samples - self._voiced_run * size
+                self._speech_end = self._samples
+            else:
+                self._voiced_run = 0
+                self._silent_run += 1
+                if (
+                    self._speech_start is not None
+                    and self._silent_run >= trailing_frames
+                ):
+                    self._done = True
+                    break
+            if self._samples >= max_samples:
+                self._done = True
+                break
+        return self._done
+
+
+def endpoints(
+    samples: np.ndarray, rate: int, **kwargs: float
+) -> Optional[Tuple[int, int]]:
+    """
+    A function that returns the indices of the first and past the last samples of the
+    first utterance of a recording, None if no speech is detected.
+    """
+    kwargs.setdefault("max_seconds", len(samples) / rate)
+    detector = VoiceActivityDetector(rate, **kwargs)
+    detector.feed(samples)
+    if detector.speech_start is None:
+        return None
+    return detector.speech_start, detector.speech_end
+
+
+def main() -> int:
+    rate = 16000
+    rng = np.random.default_rng(0)
+    noise = rng.normal(0, 50, rate).astype(np.int16)
+    time = np.arange(int(rate * 0.4)) / rate
+    tone = (6000 * np.sin(2 * np.pi * 220 * time)).astype(np.int16)
+    samples = np.concatenate((noise[: rate // 4], tone, noise))
+    detector = VoiceActivityDetector(rate)
+    for start in range(0, len(samples), 1024):
+        if detector.feed(samples[start : start + 1024]):
+            break
+    print(detector)
+    print(f"stopped after {detector.samples / rate:.2f} seconds")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
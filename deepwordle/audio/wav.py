@@ -0,0 +1,125 @@
+"""
+| The following script implements the WAV encoding of the captured samples.
+
+| A WAV file is a 44 bytes header followed by the raw samples, so there is no need to go through the
+| disk to build one: the samples are captured straight into a preallocated buffer that keeps room for
+| the header in front of them, the header is packed in place once the length is known, and the whole
+| recording is handed to the recognizer as a `memoryview`, without a single copy.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import numpy as np
+import struct
+from typing import (
+    Optional,
+    Union,
+)
+
+SAMPLE_WIDTH = 2
+HEADER_SIZE = 44
+HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+def write_header(
+    buffer: bytearray, count: int, rate: int, channels: int = 1, offset: int = 0
+) -> None:
+    """
+    A function that packs the header of a WAV file of `count` int16 samples in place.
+    """
+    data_size = count * SAMPLE_WIDTH
+    HEADER.pack_into(
+        buffer,
+        offset,
+        b"RIFF",
+        HEADER_SIZE - 8 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        rate,
+        rate * channels * SAMPLE_WIDTH,
+        channels * SAMPLE_WIDTH,
+        SAMPLE_WIDTH * 8,
+        b"data",
+        data_size,
+    )
+
+
+class WavBuffer:
+    """
+    A preallocated WAV file in memory, the samples are written in place.
+    """
+
+    __slots__ = ("_buffer", "_samples", "_rate", "_channels")
+
+    def __init__(self, capacity: int, rate: int, channels: int = 1) -> None:
+        self._buffer = bytearray(HEADER_SIZE + capacity * SAMPLE_WIDTH)
+        self._samples = np.frombuffer(self._buffer, dtype="<i2", offset=HEADER_SIZE)
+        self._rate = rate
+        self._channels = channels
+
+    @property
+    def capacity(self) -> int:
+        """
+        A getter method that returns the number of samples the buffer holds.
+        """
+        return len(self._samples)
+
+    @property
+    def samples(self) -> np.ndarray:
+        """
+        A getter method that returns the samples of the buffer, a writable view.
+        """
+        return self._samples
+
+    @property
+    def rate(self) -> int:
+        return self._rate
+
+    def view(self, count: Optional[int] = None) -> memoryview:
+        """
+        A method that packs the header for the first `count` samples, all of them by
+        default, and returns the WAV file as a view of the buffer. The view is only valid
+        until the samples are written again.
+        """
+        count = len(self._samples) if count is None else count
+        write_header(self._buffer, count, self._rate, self._channels)
+        return memoryview(self._buffer)[: HEADER_SIZE + count * SAMPLE_WIDTH]
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(capacity={self.capacity}, rate={self._rate}, "
+            f"channels={self._channels})"
+        )
+
+
+def wav_bytes(samples: np.ndarray, rate: int, channels: int = 1) -> memoryview:
+    """
+    A function that encodes int16 samples as a WAV file in memory.
+    """
+    wav_buffer = WavBuffer(len(samples), rate, channels)
+    wav_buffer.samples[:] = samples
+    return wav_buffer.view()
+
+
+def write_wav(
+    path: str, samples: Union[np.ndarray, Buffer], rate: int = 0, channels: int = 1
+) -> None:
+    """
+    A function that writes int16 samples, or an already encoded WAV file, to the disk.
+    It is only used to debug the recordings, they never go through the disk otherwise.
+    """
+    if isinstance(samples, np.ndarray):
+        samples = wav_bytes(samples, rate, channels)
+    with open(path, "wb") as wav_file:
+        wav_file.write(samples)
@@ -21,9 +21,7 @@ from deepwordle.components.message import (
     MessagePanel,
 )
 from deepwordle.components.utils import (
-    add_new_letter,
     get_day_index,
     read_from_file,
-    remove_letter,
     update_letters_state,
 )
@@ -11,18 +11,19 @@
 
 """
 
-WORD_LENGTH = 5
-MAX_ATTEMPTS = 6
-LETTERS = "abcdefghijklmnopqrstuvwxyz"
+from deepwordle.core.constants import (
+    IS_IN_POSITION,
+    IS_IN_WORD,
+    LETTERS,
+    MAX_ATTEMPTS,
+    NOT_IN_WORD,
+    WORD_LENGTH,
+)
 
 DARK = "bold white on rgb(50,57,50)"
 ORANGE = "bold white on rgb(208,178,60)"
 GREEN = "bold white on rgb(66,164,55)"
 
-NOT_IN_WORD = 0
-IS_IN_WORD = 1
-IS_IN_POSITION = 2
-
 LETTER_COLORS = {
     NOT_IN_WORD: DARK,
     IS_IN_WORD: ORANGE,
@@ -0,0 +1,269 @@
+"""
+| The following script implements the cache of the figlet texts the letters and the messages are
+| drawn with.
+
+| Rendering a figlet text loads and parses its font file first, and each of the 30 letters of the grid
+| is rendered again on every repaint. The fonts loaded and the texts rendered are kept in a shared
+| cache instead, the texts keyed by the text, the font and the width, so a repaint is a lookup. Both
+| are bounded, the least recently used entries being evicted first, and the hits and the misses of the
+| texts are counted.
+
+| The first render of a letter would still parse a font file. The letters, in both cases, and the
+| blank are prebuilt in the fonts of the letters and of the messages into an atlas shipped with the
+| package, `data/glyphs.json`, loaded on the first miss. A letter is the same whatever the width once
+| it fits, so the atlas keeps the narrowest width of every glyph, and pyfiglet renders the other texts
+| and the narrower widths. Run this script to build the atlas again: `python -m
+| deepwordle.components.glyphs`.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from attrs import (
+    Factory,
+    define,
+    field,
+)
+from collections import (
+    OrderedDict,
+)
+import json
+import os
+import string
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from pyfiglet import (
+        Figlet,  # type: ignore
+    )
+
+# the number of fonts and of rendered texts kept, 4 fonts and up to 53 glyphs per width are used.
+FONT_CACHE_SIZE = 8
+GLYPH_CACHE_SIZE = 1024
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+ATLAS_FILE = os.path.join(BASE_DIR, "data", "glyphs.json")
+ATLAS_VERSION = 1
+# the fonts of the letters and of the messages, and the texts of the letters, the blank included.
+ATLAS_FONTS = ("mini", "small", "standard", "big")
+ATLAS_TEXTS = ("", " ") + tuple(string.ascii_uppercase + string.ascii_lowercase)
+
+GlyphKey = Tuple[str, str, int]
+# the narrowest width a glyph is rendered at and the glyph, by text, by font name.
+Atlas = Dict[str, Dict[str, Tuple[int, str]]]
+
+
+def build_atlas(
+    fonts: Sequence[str] = ATLAS_FONTS, texts: Sequence[str] = ATLAS_TEXTS
+) -> Atlas:
+    """
+    A function that renders every text in every font and returns the glyphs along with
+    the narrowest width each one is rendered the same at.
+    """
+    from pyfiglet import (  # type: ignore
+        CharNotPrinted,
+        Figlet,
+    )
+
+    atlas: Atlas = {}
+    for font_name in fonts:
+        font = Figlet(font=font_name, width=1000)
+        glyphs = atlas[font_name] = {}
+        for text in texts:
+            font.width = 1000
+            glyph = font.renderText(text).rstrip("\n")
+            width = max(map(len, glyph.splitlines()), default=0) + 1
+            while width > 1:
+                font.width = width - 1
+                try:
+                    if font.renderText(text).rstrip("\n") != glyph:
+                        break
+                except CharNotPrinted:
+                    break
+                width -= 1
+            glyphs[text] = (width, glyph)
+    return atlas
+
+
+def load_atlas(path: str = ATLAS_FILE) -> Atlas:
+    """
+    A function that reads an atlas, an empty one when it is missing or outdated: pyfiglet
+    renders everything then.
+    """
+    try:
+        with open(path) as atlas_file:
+            content: Dict[str, Any] = json.load(atlas_file)
+    except (OSError, ValueError):
+        return {}
+    if content.get("version") != ATLAS_VERSION:
+        return {}
+    return {
+        font_name: {text: (width, glyph) for text, (width, glyph) in glyphs.items()}
+        for font_name, glyphs in content["fonts"].items()
+    }
+
+
+def save_atlas(atlas: Atlas, path: str = ATLAS_FILE) -> None:
+    content = {"version": ATLAS_VERSION, "fonts": atlas}
+    with open(path, "w") as atlas_file:
+        json.dump(content, atlas_file, separators=(",", ":"), sort_keys=True)
+        atlas_file.write("\n")
+
+
+@define
+class GlyphCacheStats:
+    """
+    A brief encapsulation of the lookups of the rendered texts.
+
+    Attrs:
+        hits: the number of texts found in the cache.
+        misses: the number of texts not found in the cache.
+        prebuilt: the number of misses found in the atlas, the others are rendered.
+        evictions: the number of texts evicted to make room for others.
+    """
+
+    hits: int = field(default=0)
+    misses: int = field(default=0)
+    prebuilt: int = field(default=0)
+    evictions: int = field(default=0)
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def format(self) -> str:
+        return (
+            f"{self.hits} hits, {self.misses} misses ({self.hit_ratio:.0%} hits), "
+            f"{self.prebuilt} prebuilt, {self.evictions} evictions"
+        )
+
+
+@define
+class GlyphCache:
+    """
+    A brief encapsulation of the fonts loaded and of the texts rendered with them.
+
+    Attrs:
+        size: the number of rendered texts kept.
+        font_size: the number of fonts kept.
+        atlas_path: the atlas of the prebuilt glyphs, None to render every text.
+        atlas: the prebuilt glyphs, loaded on the first miss.
+        fonts: the fonts loaded, by name, the least recently used first.
+        glyphs: the texts rendered, by text, font name and width, the least recently used first.
+        stats: the lookups of the rendered texts.
+        lock: serializes the lookups, the cache is shared.
+    """
+
+    _size: int = field(default=GLYPH_CACHE_SIZE)
+    _font_size: int = field(default=FONT_CACHE_SIZE)
+    _atlas_path: Optional[str] = field(default=ATLAS_FILE)
+    _atlas: Optional[Atlas] = field(init=False, default=None, repr=False)
+    _fonts: "OrderedDict[str, Figlet]" = field(
+        init=False, factory=OrderedDict, repr=False
+    )
+    _glyphs: "OrderedDict[GlyphKey, str]" = field(
+        init=False, factory=OrderedDict, repr=False
+    )
+    _stats: GlyphCacheStats = field(init=False, factory=GlyphCacheStats)
+    _lock: threading.Lock = field(
+        init=False, default=Factory(threading.Lock), repr=False
+    )
+
+    @property
+    def stats(self) -> GlyphCacheStats:
+        """
+        A getter method that returns the value of the `stats` attribute.
+        :param self: Instance of the class.
+        :return: A GlyphCacheStats object that represents the value of the `stats` attribute.
+        """
+        return self._stats
+
+    def __len__(self) -> int:
+        return len(self._glyphs)
+
+    def atlas(self) -> Atlas:
+        if self._atlas is None:
+            self._atlas = load_atlas(self._atlas_path) if self._atlas_path else {}
+        return self._atlas
+
+    def font(self, font_name: str) -> "Figlet":
+        """
+        A method that returns a font, loaded on its first use. Its width is set by `render`
+        before every rendering, the file does not depend on it.
+        """
+        font = self._fonts.get(font_name)
+        if font is not None:
+            self._fonts.move_to_end(font_name)
+            return font
+        # pyfiglet is imported on the first render, it takes a tenth of a second.
+        from pyfiglet import (
+            Figlet,  # type: ignore
+        )
+
+        font = self._fonts[font_name] = Figlet(font=font_name)
+        while len(self._fonts) > self._font_size:
+            self._fonts.popitem(last=False)
+        return font
+
+    def render(self, text: str, font_name: str, width: int) -> str:
+        """
+        A method that returns a text rendered in a font within `width` columns, without its
+        trailing new lines.
+        """
+        key = (text, font_name, width)
+        with self._lock:
+            glyph = self._glyphs.get(key)
+            if glyph is not None:
+                self._glyphs.move_to_end(key)
+                self._stats.hits += 1
+                return glyph
+            self._stats.misses += 1
+            width_glyph = self.atlas().get(font_name, {}).get(text)
+            if width_glyph is not None and width >= width_glyph[0]:
+                self._stats.prebuilt += 1
+                glyph = width_glyph[1]
+            else:
+                font = self.font(font_name)
+                font.width = width
+                glyph = font.renderText(text).rstrip("\n")
+            self._glyphs[key] = glyph
+            while len(self._glyphs) > self._size:
+                self._glyphs.popitem(last=False)
+                self._stats.evictions += 1
+            return glyph
+
+    def clear(self) -> None:
+        with self._lock:
+            self._fonts.clear()
+            self._glyphs.clear()
+
+
+# the cache shared by every figlet text.
+GLYPH_CACHE = GlyphCache()
+
+
+def main() -> int:
+    atlas = build_atlas()
+    save_atlas(atlas)
+    glyphs = sum(map(len, atlas.values()))
+    print(f"{glyphs} glyphs in {len(atlas)} fonts written to {ATLAS_FILE}")
+    print(f"{os.path.getsize(ATLAS_FILE) / 1024:.1f} KiB")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
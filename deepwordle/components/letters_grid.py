@@ -28,6 +28,7 @@ from textual.widgets import (
     Header,
 )
 from typing import (
+    Iterable,
     List,
     Optional,
     TypeVar,
@@ -41,10 +42,8 @@ from deepwordle.components.constants import (
 from deepwordle.components.letter import (
     Letter,
 )
-from deepwordle.components.utils import (
-    add_new_letter,
-    remove_letter,
-    update_letters_state,
+from deepwordle.core.game_state import (
+    GameState,
 )
 
 L = TypeVar("L", bound=Letter)
@@ -52,44 +51,52 @@ L = TypeVar("L", bound=Letter)
 
 class LettersGrid(GridView):
     """
-    A widget that encapsulates the current_letters, the letters and the the max_letters of the grid.
+    A widget that renders the grid of letters from the state of a game.
     """
 
-    _current_letters: Reactive[List[L]] = Reactive(
-        default=None, layout=False, repaint=True
-    )
+    _game_state: Optional[GameState] = None
     _letters: Reactive[List[L]] = Reactive(default=None, layout=False, repaint=True)
     _max_letters: Reactive[int] = Reactive(
         default=WORD_LENGTH * MAX_ATTEMPTS, layout=False, repaint=True
     )
-    _letters_count: Reactive[int] = Reactive(default=0, layout=False, repaint=True)
+
+    def __init__(
+        self, game_state: Optional[GameState] = None, name: Optional[str] = None
+    ) -> None:
+        super().__init__(name=name)
+        self.game_state = game_state or GameState()
 
     @property
-    def current_letters(self) -> List[L]:
+    def game_state(self) -> GameState:
         """
-        A getter method that returns the value of the `current_letters` attribute.
+        A getter method that returns the value of the `game_state` attribute.
         :param self: Instance of the class.
-        :return: A list of letters that represents the value of the `current_letters` attribute.
+        :return: A game state that represents the value of the `game_state` attribute.
         """
-        if not hasattr(self, "_current_letters"):
+        if self._game_state is None:
             raise AttributeError(
-                f"Your {self.__class__.__name__!r} instance has no attribute named current_letters."
+                f"Your {self.__class__.__name__!r} instance has no attribute named game_state."
             )
-        index: int = 0
-        if self.letters_count is None:
-            self.letters_count = 0
-        index: int = int(self.letters_count / WORD_LENGTH) * WORD_LENGTH
-        self._current_letters = self.letters[index : index + WORD_LENGTH]
-        return self._current_letters
-
-    @current_letters.setter
-    def current_letters(self, value: List[L]) -> None:
-        """
-        A setter method that changes the value of the `current_letters` attribute.
-        :param value: A list of letters that represents the value of the `current_letters` attribute.
+        return self._game_state
+
+    @game_state.setter
+    def game_state(self, value: GameState) -> None:
+        """
+        A setter method that changes the value of the `game_state` attribute.
+        :param value: A game state that represents the value of the `game_state` attribute.
         :return: None.
         """
-        setattr(self, "_current_letters", value)
+        setattr(self, "_game_state", value)
+
+    @property
+    def current_letters(self) -> List[L]:
+        """
+        A getter method that returns the letters of the row being typed.
+        :param self: Instance of the class.
+        :return: A list of letters that represents the current row.
+        """
+        index: int = min(self.game_state.row, MAX_ATTEMPTS - 1) * WORD_LENGTH
+        return self.letters[index : index + WORD_LENGTH]
 
     @property
     def letters(self) -> List[L]:
@@ -138,25 +145,11 @@ class LettersGrid(GridView):
     @property
     def letters_count(self) -> int:
         """
-        A getter method that returns the value of the `letters_count` attribute.
+        A getter method that returns the number of cells filled so far.
         :param self: Instance of the class.
-        :return: An integer that represents the value of the `letters_count` attribute.
-        """
-        if not hasattr(self, "_letters_count"):
-            raise AttributeError(
-                f"Your {self.__class__.__name__!r} instance has no attribute named letters_count."
-            )
-        return self._letters_count
-
-    @letters_count.setter
-    def letters_count(self, value: int) -> None:
+        :return: An integer that represents the cursor of the game state.
         """
-        A setter method that changes the value of the `letters_count` attribute.
-        :param value: An integer that represents the value of the `letters_count` attribute.
-        :return: None.
-        """
-        if value:
-            setattr(self, "_letters_count", value)
+        return self.game_state.cursor
 
     def non_empty_letters(self) -> list[L]:
         """
@@ -164,10 +157,32 @@ class LettersGrid(GridView):
         """
         return [letter for letter in self.letters if letter.character]
 
+    def render_letters(self, cells: Optional[Iterable[int]] = None) -> None:
+        """
+        A method that copies the characters and the states of the given cells, all of them
+        by default, from the game state to the letters. Only those letters get repainted.
+        """
+        if not self.letters:
+            return
+        for index in range(len(self.letters)) if cells is None else cells:
+            letter = self.letters[index]
+            letter.character = self.game_state.character(index)
+            letter.state = self.game_state.state(index)
+
+    def add_letter(self, character: str) -> bool:
+        diff = self.game_state.insert(character)
+        self.render_letters(diff)
+        return bool(diff)
+
+    def remove_letter(self) -> bool:
+        diff = self.game_state.delete()
+        self.render_letters(diff)
+        return bool(diff)
+
     async def on_mount(self) -> None:
         # Make all the letters
         self.letters = [Letter("") for _ in range(WORD_LENGTH * MAX_ATTEMPTS)]
-        self.letters_count = 0
+        self.render_letters()
         # Set basic grid settings
         # center of the DockView
         self.grid.set_align("center", "center")
@@ -179,21 +194,16 @@ class LettersGrid(GridView):
         # Place out widgets in to the layout
         self.grid.place(*self.letters)
 
-    def check_guess(self, answer: str) -> Optional[bool]:
+    def check_guess(self) -> Optional[int]:
+        """
+        A method that submits the current row and returns its feedback pattern, or None if
+        the row is not full.
+        """
         self.log("Checking for solution...")
-        for letter in self.current_letters:
-            if letter.character == "":
-                return False
-        current_guess = "".join(
-            map(lambda letter: letter.character, self.current_letters)
-        ).lower()
-        # update the state of the letters on the grid.
-        # in python, a list is passed by reference
-        _ = update_letters_state(self.current_letters, answer.upper())
-        # check if we reach the last row of the grid.
-        if self.letters_count and self.letters_count < self.max_letters - 1:
-            self.letters_count += 1
-        return current_guess == answer
+        pattern = self.game_state.submit()
+        if pattern is not None:
+            self.render_letters(self.game_state.row_cells(self.game_state.row - 1))
+        return pattern
 
 
 if __name__ == "__main__":
@@ -208,19 +218,14 @@ if __name__ == "__main__":
         def on_key(self, event: events.Key) -> None:
             if not self.result:
                 if event.key == "enter":
-                    self.result = self.letters_grid.check_guess("react")
+                    self.letters_grid.check_guess()
+                    self.result = self.letters_grid.game_state.won
                     return
                 elif event.key in LETTERS:
-                    self.letters_grid.letters_count = add_new_letter(
-                        self.letters_grid.letters,
-                        self.letters_grid.letters_count,
-                        event.key,
-                    )
+                    self.letters_grid.add_letter(event.key)
                     return
                 elif event.key == "ctrl+h":
-                    self.letters_grid.letters_count = remove_letter(
-                        self.letters_grid.letters, self.letters_grid.letters_count
-                    )
+                    self.letters_grid.remove_letter()
                     return
             else:
                 return
@@ -229,7 +234,7 @@ if __name__ == "__main__":
             view = await self.push_view(DockView(name="letters"))
             footer = Footer()
             header = Header(tall=False, clock=False)
-            self.letters_grid = LettersGrid()
+            self.letters_grid = LettersGrid(GameState("react"))
             await view.dock(self.letters_grid, edge="left", name="grid letters")
             await view.dock(header, edge="top")
             await view.dock(footer, edge="bottom")
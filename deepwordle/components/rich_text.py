@@ -18,9 +18,6 @@ from attrs import (
     frozen,
     validators,
 )
-from pyfiglet import (
-    Figlet,  # type: ignore
-)
 from rich.console import (
     Console,
     ConsoleOptions,
@@ -33,6 +30,10 @@ from typing import (
     Optional,
 )
 
+from deepwordle.components.glyphs import (
+    GLYPH_CACHE,
+)
+
 
 @frozen
 @attr.s(auto_attribs=True, slots=True, init=False, repr=False)
@@ -94,8 +95,9 @@ class FigletText:
         if min(options.max_width / 2, options.max_height) < 4:
             yield Text(self.text, style="bold")
         else:
-            font = Figlet(font=self.font_name, width=options.max_width)
-            yield Text(font.renderText(self.text).rstrip("\n"), style="bold")
+            # the fonts and the rendered texts are cached, a repaint is a lookup.
+            glyph = GLYPH_CACHE.render(self.text, self.font_name, options.max_width)
+            yield Text(glyph, style="bold")
 
     def __repr__(self) -> str:
         """
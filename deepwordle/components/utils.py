@@ -23,7 +23,6 @@ from deepwordle.components.constants import (
     IS_IN_POSITION,
     IS_IN_WORD,
     NOT_IN_WORD,
-    WORD_LENGTH,
 )
 from deepwordle.components.letter import (
     Letter,
@@ -32,7 +31,6 @@ from deepwordle.components.letter import (
 L = TypeVar("L", bound=Letter)
 INIT_DATE = datetime.date(2021, 6, 19)
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-print(BASE_DIR)
 
 
 def update_letters_state(current_guess_letters: List[L], answer: str) -> List[L]:
@@ -70,45 +68,6 @@ def update_letters_state(current_guess_letters: List[L], answer: str) -> List[L]
     return current_guess_letters
 
 
-def add_new_letter(letters: List[L], letters_count: int, character: str) -> int:
-    """
-    A helper method to check if the user has entered a 5 letter long word.
-    If so, return. the current keep track of all letters.
-    if it is divisable by 5 then return.
-    else increase the current count of letters being entered.
-    """
-    for i, letter in enumerate(letters):
-        if letter.character and i == letters_count:
-            _, remainder = divmod(letters_count, WORD_LENGTH)
-            if remainder == WORD_LENGTH - 1:
-                # the user didn't enter a 5 letter long word
-                return
-            letters_count += 1
-    # add the new character to grid
-    if letters_count is not None:
-        letters[letters_count].character = character.upper()
-    return letters_count
-
-
-def remove_letter(letters: List[L], letters_count: int) -> int:
-    """
-    A helper method to check if the user has entered a backspace letter.
-    the letters_count keep track of all letters.
-    if the letters_count is divisable by 5 then return.
-    """
-    for i, letter in enumerate(letters):
-        if not letter.character and i == letters_count:
-            _, remainder = divmod(letters_count, WORD_LENGTH)
-            if remainder == 0:
-                # the user can't remove if no letter entered, return.
-                return
-            letters_count -= 1
-    # remove the letter by changing its character
-    if letters_count is not None and letters[letters_count].character != "":
-        letters[letters_count].character = ""
-    return letters_count
-
-
 def get_day_index() -> int:
     today = datetime.date.today()
     return abs((today - INIT_DATE).days)
@@ -133,4 +92,3 @@ if __name__ == "__main__":
         letters.append(Letter(letter))
     new_letters = update_letters_state(letters, "react")
     list(map(print, new_letters))
-    add_new_letter
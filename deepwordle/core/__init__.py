@@ -0,0 +1,23 @@
+"""
+| Top-level package for core.
+
+| ``core`` holds the widget-free game logic: word lists, scoring and solving.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from deepwordle.core.codec import (
+    PackedWords,
+    decode,
+    encode,
+)
+from deepwordle.core.word_store import (
+    WordStore,
+    get_cache_dir,
+)
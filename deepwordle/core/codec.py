@@ -0,0 +1,233 @@
+"""
+| The following script implements the packed integer encoding of the five letters words.
+
+| Every letter is stored on 5 bits, `a` being 1 and `z` being 26, the first letter taking the most
+| significant bits. A word therefore fits in 25 bits, 0 is never a valid word and sorting the codes
+| sorts the words alphabetically. Whole dictionaries are stored as `array('I')` buffers that can be
+| shared with NumPy without any copy.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from array import (
+    array,
+)
+from bisect import (
+    bisect_left,
+)
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Union,
+)
+
+from deepwordle.core.constants import (
+    WORD_LENGTH,
+)
+
+BITS_PER_LETTER = 5
+LETTER_MASK = (1 << BITS_PER_LETTER) - 1
+INVALID = 0
+# the shift of each letter, the first letter being the most significant one.
+_SHIFTS = tuple(
+    BITS_PER_LETTER * (WORD_LENGTH - 1 - position) for position in range(WORD_LENGTH)
+)
+
+
+def encode(word: Iterable[str]) -> int:
+    """
+    A function that packs a five letters word into an integer. The word can be a string or
+    any iterable of characters, such as the characters of the `Letter` widgets of a row.
+    Letters are case insensitive. Returns `INVALID` for anything that is not a word.
+    """
+    code = 0
+    length = 0
+    for character in word:
+        if len(character) != 1:
+            return INVALID
+        # lowercase ascii letters are mapped to 1..26, uppercase ones as well.
+        value = (ord(character) | 32) - 96
+        if not 0 < value < 27:
+            return INVALID
+        code = code << BITS_PER_LETTER | value
+        length += 1
+    return code if length == WORD_LENGTH else INVALID
+
+
+def decode(code: int) -> str:
+    """
+    A function that unpacks an integer built by `encode` into a lowercase word.
+    """
+    return "".join(chr(96 + (code >> shift & LETTER_MASK)) for shift in _SHIFTS)
+
+
+def letter_at(code: int, position: int) -> int:
+    """
+    A function that extracts the letter at a given position, 1 for `a` through 26 for `z`.
+    """
+    return code >> _SHIFTS[position] & LETTER_MASK
+
+
+def letters(code: int) -> bytes:
+    """
+    A function that extracts all the letters of a packed word, 1 for `a` through 26 for `z`.
+    """
+    return bytes(code >> shift & LETTER_MASK for shift in _SHIFTS)
+
+
+def encode_all(words: Iterable[str]) -> "array[int]":
+    """
+    A function that packs a list of words into an `array('I')`.
+    """
+    codes = array("I")
+    for word in words:
+        code = encode(word)
+        if code == INVALID:
+            raise ValueError(f"{word!r} is not a {WORD_LENGTH} letters word.")
+        codes.append(code)
+    return codes
+
+
+def decode_all(codes: Iterable[int]) -> List[str]:
+    """
+    A function that unpacks a buffer of codes into a list of words.
+    """
+    return [decode(code) for code in codes]
+
+
+def as_numpy(codes: Any) -> Any:
+    """
+    A function that views any buffer of codes as a NumPy `uint32` array without copying it.
+    """
+    import numpy as np
+
+    return np.frombuffer(codes, dtype=np.uint32)
+
+
+def unpack_letters(codes: Any) -> Any:
+    """
+    A function that extracts the letters of many packed words at once, returning a NumPy
+    `uint8` array of shape (number of words, WORD_LENGTH).
+    """
+    import numpy as np
+
+    codes = np.asarray(codes, dtype=np.uint32)
+    shifts = np.array(_SHIFTS, dtype=np.uint32)
+    return ((codes[..., None] >> shifts) & LETTER_MASK).astype(np.uint8)
+
+
+class PackedWords(Sequence[int]):
+    """
+    A sorted, duplicate free dictionary of packed words stored in an `array('I')`.
+    Membership is a binary search over the codes, 4 bytes per word.
+    """
+
+    __slots__ = ("_codes",)
+
+    def __init__(self, words: Iterable[Union[str, int]] = ()) -> None:
+        codes = sorted(
+            {word if isinstance(word, int) else encode(word) for word in words}
+        )
+        if codes and codes[0] == INVALID:
+            raise ValueError("Only five letters words can be packed.")
+        self._codes = array("I", codes)
+
+    @classmethod
+    def from_buffer(cls, codes: Iterable[int]) -> "PackedWords":
+        """
+        A method that wraps a buffer of codes that is already sorted and duplicate free.
+        """
+        packed_words = cls.__new__(cls)
+        packed_words._codes = array("I", codes)
+        return packed_words
+
+    @property
+    def codes(self) -> "array[int]":
+        """
+        A getter method that returns the value of the `codes` attribute.
+        :param self: Instance of the class.
+        :return: An array of unsigned integers that represents the packed words.
+        """
+        return self._codes
+
+    def __len__(self) -> int:
+        return len(self._codes)
+
+    def __getitem__(self, index: Any) -> Any:
+        return self._codes[index]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._codes)
+
+    def __contains__(self, word: object) -> bool:
+        return self.index_of(word) >= 0  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(words={len(self)}, bytes={self.nbytes})"
+
+    @property
+    def nbytes(self) -> int:
+        """
+        A getter method that returns the size of the packed buffer in bytes.
+        """
+        return self._codes.itemsize * len(self._codes)
+
+    def index_of(self, word: Union[str, int]) -> int:
+        """
+        A method that returns the alphabetical position of a word, -1 if it is missing.
+        """
+        code = word if isinstance(word, int) else encode(word)
+        index = bisect_left(self._codes, code)
+        if index < len(self._codes) and self._codes[index] == code:
+            return index
+        return -1
+
+    def word(self, index: int) -> str:
+        """
+        A method that returns the decoded word at a given position.
+        """
+        return decode(self._codes[index])
+
+    def words(self) -> List[str]:
+        """
+        A method that returns all the decoded words.
+        """
+        return decode_all(self._codes)
+
+    def column(self, position: int) -> bytes:
+        """
+        A method that returns the letters found at a given position for every word.
+        """
+        shift = _SHIFTS[position]
+        return bytes(code >> shift & LETTER_MASK for code in self._codes)
+
+    def as_numpy(self) -> Any:
+        """
+        A method that views the packed words as a NumPy `uint32` array.
+        """
+        return as_numpy(self._codes)
+
+
+def main() -> int:
+    code = encode("react")
+    assert decode(code) == "react" and code == encode("REACT")
+    assert letter_at(code, 0) == 18 and letters(code) == bytes((18, 5, 1, 3, 20))
+    assert encode("reacts") == INVALID and encode("re4ct") == INVALID
+    packed_words = PackedWords(["react", "aback", "zonal", "react"])
+    print(packed_words, packed_words.words())
+    assert "zonal" in packed_words and "zzzzz" not in packed_words
+    assert packed_words.column(0) == bytes((1, 18, 26))
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+| The following script contains the game constants shared by the core and the components.
+
+| This program and the accompanying materials are made available under the
+| terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+WORD_LENGTH = 5
+MAX_ATTEMPTS = 6
+LETTERS = "abcdefghijklmnopqrstuvwxyz"
+
+NOT_IN_WORD = 0
+IS_IN_WORD = 1
+IS_IN_POSITION = 2
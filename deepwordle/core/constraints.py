@@ -0,0 +1,262 @@
+"""
+| The following script implements the bitset constraint engine over the answers list.
+
+| Every answer is a bit of a Python integer. The engine precomputes, for every position and letter,
+| the set of answers having that letter at that position, and for every letter and count, the set of
+| answers containing that letter exactly that many times. The feedback of a row is then applied with
+| a handful of AND operations over those bitsets, i.e. O(answers / 64) machine word operations.
+
+| The feedback follows `update_letters_state`: the letters are scored left to right with a counter of
+| the answer letters, so for each guessed letter the engine finds which counts of that letter in the
+| answer reproduce the states that were shown, instead of assuming the usual wordle rules.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from attrs import (
+    define,
+    field,
+)
+import numpy as np
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from deepwordle.core.codec import (
+    encode,
+    letters,
+    unpack_letters,
+)
+from deepwordle.core.constants import (
+    IS_IN_POSITION,
+    IS_IN_WORD,
+    NOT_IN_WORD,
+    WORD_LENGTH,
+)
+from deepwordle.core.patterns import (
+    pattern_to_states,
+)
+from deepwordle.core.word_store import (
+    WordStore,
+)
+
+ALPHABET_SIZE = 27
+Tables = Tuple[List[List[int]], List[List[int]]]
+
+_tables: Dict[bytes, Tables] = {}
+
+
+def _to_bits(mask: np.ndarray) -> int:
+    """
+    A helper function that turns an array of booleans into an integer bitset.
+    """
+    return int.from_bytes(np.packbits(mask, bitorder="little").tobytes(), "little")
+
+
+def build_tables(answer_codes: Sequence[int]) -> Tables:
+    """
+    A function that builds the position bitsets, indexed by [position][letter], and the
+    count bitsets, indexed by [letter][count], of a list of packed answers.
+    """
+    answer_letters = unpack_letters(np.asarray(answer_codes, dtype=np.uint32))
+    answer_letters = answer_letters.reshape(-1, WORD_LENGTH)
+    alphabet = np.arange(ALPHABET_SIZE, dtype=np.uint8)
+    position_bits = [
+        [_to_bits(answer_letters[:, position] == letter) for letter in alphabet]
+        for position in range(WORD_LENGTH)
+    ]
+    counts = (answer_letters[:, :, None] == alphabet).sum(axis=1)
+    count_bits = [
+        [_to_bits(counts[:, letter] == count) for count in range(WORD_LENGTH + 1)]
+        for letter in alphabet
+    ]
+    return position_bits, count_bits
+
+
+def allowed_counts(states: Sequence[int]) -> List[int]:
+    """
+    A function that returns the number of times a letter can appear in the answer, given
+    the states shown at the positions of that letter in the guess, from left to right.
+    It replays the counter of `update_letters_state` for every possible count.
+    """
+    allowed = []
+    # a letter shown in position is in the answer at least that many times.
+    in_position = sum(state == IS_IN_POSITION for state in states)
+    for count in range(in_position, WORD_LENGTH + 1):
+        counter = count
+        for state in states:
+            if state == IS_IN_POSITION:
+                counter -= 1
+            elif counter == 0:
+                if state != NOT_IN_WORD:
+                    break
+            elif state == IS_IN_WORD:
+                counter -= 1
+            else:
+                break
+        else:
+            allowed.append(count)
+    return allowed
+
+
+@define
+class ConstraintEngine:
+    """
+    A brief encapsulation of the answers still consistent with the feedback of the grid.
+
+    Attrs:
+        word_store: the indexed word lists.
+        position_bits: the answers having a given letter at a given position.
+        count_bits: the answers containing a given letter a given number of times.
+        full: the bitset of all the answers.
+        mask: the bitset of the answers still consistent with the feedback.
+        survivors: the positions of the surviving answers, cached until the next update.
+    """
+
+    _word_store: WordStore = field()
+    _position_bits: List[List[int]] = field(init=False, repr=False)
+    _count_bits: List[List[int]] = field(init=False, repr=False)
+    _full: int = field(init=False, repr=False)
+    _mask: int = field(init=False, repr=False)
+    _survivors: Optional[np.ndarray] = field(init=False, default=None, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        answer_codes = self._word_store.answer_codes()
+        key = answer_codes.tobytes()
+        if key not in _tables:
+            _tables[key] = build_tables(answer_codes)
+        self._position_bits, self._count_bits = _tables[key]
+        self._full = (1 << len(answer_codes)) - 1
+        self._mask = self._full
+
+    @property
+    def word_store(self) -> WordStore:
+        """
+        A getter method that returns the value of the `word_store` attribute.
+        :param self: Instance of the class.
+        :return: A word store that represents the value of the `word_store` attribute.
+        """
+        if not hasattr(self, "_word_store"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named word_store."
+            )
+        return self._word_store
+
+    @property
+    def mask(self) -> int:
+        """
+        A getter method that returns the value of the `mask` attribute.
+        :param self: Instance of the class.
+        :return: An integer whose bit i is set if the answer i is still possible.
+        """
+        if not hasattr(self, "_mask"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named mask."
+            )
+        return self._mask
+
+    @property
+    def count(self) -> int:
+        """
+        A getter method that returns the number of answers still possible.
+        :param self: Instance of the class.
+        :return: An integer that represents the number of surviving answers.
+        """
+        return self._mask.bit_count()
+
+    def reset(self) -> None:
+        """
+        A method that makes every answer possible again, for a new game.
+        """
+        self._mask = self._full
+        self._survivors = None
+
+    def row_mask(
+        self, guess: Union[str, int], feedback: Union[int, Sequence[int]]
+    ) -> int:
+        """
+        A method that returns the bitset of the answers that would show `feedback`, a
+        pattern or a sequence of states, for `guess`.
+        """
+        code = guess if isinstance(guess, int) else encode(guess)
+        states = pattern_to_states(feedback) if isinstance(feedback, int) else feedback
+        guess_letters = letters(code)
+        mask = self._full
+        positions: Dict[int, List[int]] = {}
+        for position, (letter, state) in enumerate(zip(guess_letters, states)):
+            if state == IS_IN_POSITION:
+                mask &= self._position_bits[position][letter]
+            else:
+                mask &= ~self._position_bits[position][letter]
+            positions.setdefault(letter, []).append(state)
+        for letter, letter_states in positions.items():
+            count_mask = 0
+            for count in allowed_counts(letter_states):
+                count_mask |= self._count_bits[letter][count]
+            mask &= count_mask
+        return mask
+
+    def update(
+        self, guess: Union[str, int], feedback: Union[int, Sequence[int]]
+    ) -> int:
+        """
+        A method that applies the feedback of a row and returns the number of answers left.
+        """
+        self._mask &= self.row_mask(guess, feedback)
+        self._survivors = None
+        return self.count
+
+    def survivors(self) -> np.ndarray:
+        """
+        A method that returns the positions of the surviving answers in the answers list.
+        The result is cached, so repeated calls between two updates cost nothing.
+        """
+        if self._survivors is None:
+            size = self._word_store.answers_count
+            bits = np.frombuffer(
+                self._mask.to_bytes((size + 7) // 8, "little"), np.uint8
+            )
+            bits = np.unpackbits(bits, count=size, bitorder="little")
+            self._survivors = np.flatnonzero(bits)
+        return self._survivors
+
+    def candidates(self) -> List[str]:
+        """
+        A method that returns the surviving answers.
+        """
+        return [self._word_store.answer(index) for index in self.survivors()]
+
+    def is_possible(self, word: Union[str, int]) -> bool:
+        """
+        A method that checks whether a word can still be the answer.
+        """
+        index = self._word_store.answer_index(word)
+        return index >= 0 and bool(self._mask >> index & 1)
+
+
+def main() -> int:
+    from deepwordle.core.patterns import (
+        feedback_pattern,
+    )
+
+    constraint_engine = ConstraintEngine(WordStore.open())
+    for guess in ("raise", "clout"):
+        print(guess, constraint_engine.update(guess, feedback_pattern(guess, "react")))
+    print(constraint_engine.candidates())
+    assert constraint_engine.is_possible("react")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
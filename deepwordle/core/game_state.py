@@ -0,0 +1,241 @@
+"""
+| The following script implements the widget-free state of a game.
+
+| The grid is held in two fixed `bytearray`s of WORD_LENGTH * MAX_ATTEMPTS cells, one for the
+| characters (0 for an empty cell, the upper case ASCII code otherwise) and one for the states, plus a
+| cursor pointing at the next free cell of the current row. `LettersGrid` renders from it, and the
+| simulator, the hint engine and the tests can play games without building a single widget.
+
+| The bounds of the current row are kept next to the cursor, so inserting, deleting and submitting
+| are O(1). Every edit returns the cells it touched, and only those letters get repainted.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from typing import (
+    Optional,
+    Tuple,
+)
+
+from deepwordle.core.constants import (
+    IS_IN_POSITION,
+    MAX_ATTEMPTS,
+    NOT_IN_WORD,
+    WORD_LENGTH,
+)
+from deepwordle.core.patterns import (
+    ALL_IN_POSITION,
+    feedback_pattern,
+    pattern_to_states,
+)
+
+CELLS_COUNT = WORD_LENGTH * MAX_ATTEMPTS
+EMPTY = 0
+
+# the indices of the cells touched by an edit, empty if the edit was refused.
+Diff = Tuple[int, ...]
+
+
+class GameState:
+    """
+    A brief encapsulation of the secret word, the characters and the states of the grid
+    and the cursor of a game.
+    """
+
+    __slots__ = (
+        "_secret",
+        "_chars",
+        "_states",
+        "_cursor",
+        "_row",
+        "_row_start",
+        "_row_end",
+        "_won",
+    )
+
+    def __init__(self, secret: str = "") -> None:
+        self._chars = bytearray(CELLS_COUNT)
+        self._states = bytearray(CELLS_COUNT)
+        self.reset(secret)
+
+    def reset(self, secret: Optional[str] = None) -> None:
+        """
+        A method that clears the grid for a new game, with a new secret word if given.
+        """
+        if secret is not None:
+            self._secret = secret.lower()
+        self._chars[:] = bytes(CELLS_COUNT)
+        self._states[:] = bytes(CELLS_COUNT)
+        self._cursor = 0
+        self._row = 0
+        self._row_start = 0
+        self._row_end = WORD_LENGTH
+        self._won = False
+
+    @property
+    def secret(self) -> str:
+        """
+        A getter method that returns the value of the `secret` attribute.
+        :param self: Instance of the class.
+        :return: A string that represents the word to guess, in lower case.
+        """
+        return self._secret
+
+    @property
+    def chars(self) -> bytearray:
+        """
+        A getter method that returns the value of the `chars` attribute.
+        :param self: Instance of the class.
+        :return: A bytearray of the upper case ASCII codes of the cells, 0 if empty.
+        """
+        return self._chars
+
+    @property
+    def states(self) -> bytearray:
+        """
+        A getter method that returns the value of the `states` attribute.
+        :param self: Instance of the class.
+        :return: A bytearray of the states of the cells.
+        """
+        return self._states
+
+    @property
+    def cursor(self) -> int:
+        """
+        A getter method that returns the value of the `cursor` attribute.
+        :param self: Instance of the class.
+        :return: An integer that represents the index of the next free cell.
+        """
+        return self._cursor
+
+    @property
+    def row(self) -> int:
+        """
+        A getter method that returns the value of the `row` attribute.
+        :param self: Instance of the class.
+        :return: An integer that represents the index of the row being typed, i.e. the
+            number of guesses submitted so far.
+        """
+        return self._row
+
+    @property
+    def won(self) -> bool:
+        """
+        A getter method that tells whether the secret word was found.
+        """
+        return self._won
+
+    @property
+    def over(self) -> bool:
+        """
+        A getter method that tells whether the game is over, won or out of attempts.
+        """
+        return self._won or self._row == MAX_ATTEMPTS
+
+    def character(self, index: int) -> str:
+        """
+        A method that returns the character of a cell, an empty string if it is empty.
+        """
+        char = self._chars[index]
+        return chr(char) if char != EMPTY else ""
+
+    def state(self, index: int) -> int:
+        return self._states[index]
+
+    def current_word(self) -> str:
+        """
+        A method that returns the characters typed so far in the current row.
+        """
+        return self._chars[self._row_start : self._cursor].decode("ascii")
+
+    def is_row_full(self) -> bool:
+        return self._cursor == self._row_end
+
+    def row_cells(self, row: int) -> range:
+        """
+        A method that returns the indices of the cells of a row.
+        """
+        return range(row * WORD_LENGTH, (row + 1) * WORD_LENGTH)
+
+    def insert(self, character: str) -> Diff:
+        """
+        A method that types a character at the cursor and returns the touched cell. Nothing
+        is touched when the game is over or the current row is already full.
+        """
+        if self._cursor == self._row_end or self.over:
+            return ()
+        index = self._cursor
+        self._chars[index] = ord(character.upper())
+        self._cursor = index + 1
+        return (index,)
+
+    def delete(self) -> Diff:
+        """
+        A method that erases the character before the cursor and returns the touched cell.
+        Nothing is touched when the game is over or the current row is empty.
+        """
+        if self._cursor == self._row_start or self.over:
+            return ()
+        self._cursor -= 1
+        self._chars[self._cursor] = EMPTY
+        return (self._cursor,)
+
+    def submit(self) -> Optional[int]:
+        """
+        A method that scores the current row against the secret word, moves to the next
+        row and returns the feedback pattern, or None if the row is not full yet. Checking
+        that the row is a valid word is left to the caller. The touched cells are the ones
+        of `row_cells(row - 1)`.
+        """
+        if self._cursor != self._row_end or self.over:
+            return None
+        start = self._row_start
+        pattern = feedback_pattern(self.current_word().lower(), self._secret)
+        self._states[start : start + WORD_LENGTH] = bytes(pattern_to_states(pattern))
+        self._row += 1
+        self._row_start = self._row_end
+        self._row_end += WORD_LENGTH
+        self._won = pattern == ALL_IN_POSITION
+        return pattern
+
+    def rows(self) -> Tuple[Tuple[str, Tuple[int, ...]], ...]:
+        """
+        A method that returns the submitted words along with the states of their letters.
+        """
+        return tuple(
+            (
+                self._chars[row * WORD_LENGTH : (row + 1) * WORD_LENGTH].decode(
+                    "ascii"
+                ),
+                tuple(self._states[row * WORD_LENGTH : (row + 1) * WORD_LENGTH]),
+            )
+            for row in range(self._row)
+        )
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(row={self._row}, cursor={self._cursor}, "
+            f"word={self.current_word()!r}, won={self._won})"
+        )
+
+
+def main() -> int:
+    game_state = GameState("react")
+    for guess in ("there", "react"):
+        for character in guess:
+            game_state.insert(character)
+        print(game_state.submit(), game_state)
+    assert game_state.won and game_state.over
+    assert game_state.rows()[1] == ("REACT", (IS_IN_POSITION,) * WORD_LENGTH)
+    assert game_state.character(0) == "T" and game_state.state(1) == NOT_IN_WORD
+    return 0
+
+
+if __name__ == "__main__":
+    main()
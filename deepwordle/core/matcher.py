@@ -0,0 +1,319 @@
+"""
+| The following script implements the fuzzy and phonetic matching of transcripts to valid words.
+
+| Deepgram transcribes what it hears, not what the game expects: "reacts", "reakt" or "rite" are not
+| valid guesses, but the closest valid guess is usually obvious. The matcher keeps two indices over
+| the word lists, built once per process:
+
+| - a phonetic index, from a simplified Metaphone key to the words sharing it, so homophones meet.
+| - a trigram index, from every padded trigram to the ranks of the words containing it, so near
+|   misses of any length get a short list of candidates with a single `np.bincount`.
+
+| The candidates of both indices are then ordered by edit distance, phonetic agreement and whether
+| they can be the answer, so a lookup costs tens of microseconds instead of a scan of the lists.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from attrs import (
+    define,
+    field,
+)
+import numpy as np
+import re
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from deepwordle.core.word_store import (
+    WordStore,
+)
+
+# the number of candidates compared by edit distance.
+CANDIDATES_COUNT = 12
+# sounding alike is worth that many shared trigrams when picking the candidates.
+PHONETIC_BONUS = 3
+# the largest edit distance accepted for a word that does not sound the same.
+MAX_DISTANCE = 2
+
+VOWELS = frozenset("aeiou")
+SOFTENERS = frozenset("eiy")
+SILENT_PREFIXES = ("kn", "gn", "pn", "wr", "ps")
+NON_LETTERS = re.compile("[^a-z]")
+
+Indices = Tuple[List[str], List[str], Dict[str, np.ndarray], Dict[str, np.ndarray]]
+
+_indices: Dict[bytes, Indices] = {}
+
+
+def normalize(token: str) -> str:
+    """
+    A function that lower cases a token and drops everything that is not a letter.
+    """
+    return NON_LETTERS.sub("", token.lower())
+
+
+def phonetic_key(word: str) -> str:
+    """
+    A function that computes a simplified Metaphone key: the consonant sounds of a word,
+    the first vowel kept as `A`, so that words that sound alike share the same key.
+    """
+    word = normalize(word)
+    if word.startswith(SILENT_PREFIXES):
+        word = word[1:]
+    elif word.startswith("x"):
+        word = "s" + word[1:]
+    elif word.startswith("wh"):
+        word = "w" + word[2:]
+    key = []
+    size = len(word)
+    for index, char in enumerate(word):
+        following = word[index + 1] if index + 1 < size else ""
+        previous = word[index - 1] if index else ""
+        if char == previous and char != "c":
+            continue
+        if char in VOWELS:
+            if index == 0:
+                key.append("A")
+        elif char == "b":
+            if not (previous == "m" and following == ""):
+                key.append("B")
+        elif char == "c":
+            if following == "h":
+                key.append("X")
+            elif following in SOFTENERS:
+                key.append("S")
+            else:
+                key.append("K")
+        elif char == "d":
+            if following == "g" and word[index + 2 : index + 3] in SOFTENERS:
+                key.append("J")
+            else:
+                key.append("T")
+        elif char == "g":
+            if following == "h" and word[index + 2 : index + 3] not in VOWELS:
+                continue
+            key.append("J" if following in SOFTENERS else "K")
+        elif char == "h":
+            if following in VOWELS and previous not in "cgpst":
+                key.append("H")
+        elif char == "k":
+            if previous != "c":
+                key.append("K")
+        elif char == "p":
+            key.append("F" if following == "h" else "P")
+        elif char == "q":
+            key.append("K")
+        elif char == "s":
+            key.append("X" if following == "h" else "S")
+        elif char == "t":
+            key.append("0" if following == "h" else "T")
+        elif char == "v":
+            key.append("F")
+        elif char in "wy":
+            if following in VOWELS:
+                key.append(char.upper())
+        elif char == "x":
+            key.append("KS")
+        elif char == "z":
+            key.append("S")
+        else:
+            key.append(char.upper())
+    return "".join(key)
+
+
+def trigrams(word: str) -> List[str]:
+    """
+    A function that returns the trigrams of a word padded with `$`, so that the first
+    and the last letters weigh as much as the others.
+    """
+    padded = f"$${word}$$"
+    return [padded[index : index + 3] for index in range(len(padded) - 2)]
+
+
+def edit_distance(source: str, target: str) -> int:
+    """
+    A function that computes the Levenshtein distance between two words with the
+    bit-parallel algorithm of Myers: a column of the dynamic programming table is held in
+    the bits of two integers, so each letter of the target costs a few integer operations.
+    """
+    size = len(source)
+    if not size:
+        return len(target)
+    masks: Dict[str, int] = {}
+    for index, char in enumerate(source):
+        masks[char] = masks.get(char, 0) | 1 << index
+    full = (1 << size) - 1
+    last = 1 << (size - 1)
+    positive, negative, distance = full, 0, size
+    for char in target:
+        equal = masks.get(char, 0)
+        vertical = equal | negative
+        horizontal = ((((equal & positive) + positive) & full) ^ positive) | equal
+        up = negative | ~(horizontal | positive) & full
+        down = positive & horizontal
+        if up & last:
+            distance += 1
+        elif down & last:
+            distance -= 1
+        up = (up << 1 | 1) & full
+        down = down << 1 & full
+        positive = down | ~(vertical | up) & full
+        negative = up & vertical
+    return distance
+
+
+def build_indices(words: List[str]) -> Indices:
+    """
+    A function that builds the phonetic key of every word, the phonetic index, key to
+    an array of ranks, and the trigram index, trigram to an array of ranks, of a list of
+    words.
+    """
+    keys = [phonetic_key(word) for word in words]
+    phonetic: Dict[str, List[int]] = {}
+    postings: Dict[str, List[int]] = {}
+    for rank, (word, key) in enumerate(zip(words, keys)):
+        phonetic.setdefault(key, []).append(rank)
+        for trigram in set(trigrams(word)):
+            postings.setdefault(trigram, []).append(rank)
+    phonetic_index = {
+        key: np.array(ranks, dtype=np.int32) for key, ranks in phonetic.items()
+    }
+    trigram_index = {
+        trigram: np.array(ranks, dtype=np.int32) for trigram, ranks in postings.items()
+    }
+    return words, keys, phonetic_index, trigram_index
+
+
+@define
+class WordMatcher:
+    """
+    A brief encapsulation of the indices used to map transcripts to valid guesses.
+
+    Attrs:
+        word_store: the indexed word lists.
+        max_distance: the largest edit distance accepted for a word that sounds different.
+        words: the valid words, in rank order.
+        keys: the phonetic key of every word, in rank order.
+        is_answer: whether each word, in rank order, belongs to the answers list.
+        phonetic: the ranks of the words sharing a phonetic key.
+        trigrams: the ranks of the words containing a trigram.
+    """
+
+    _word_store: WordStore = field()
+    _max_distance: int = field(default=MAX_DISTANCE)
+    _words: List[str] = field(init=False, repr=False)
+    _keys: List[str] = field(init=False, repr=False)
+    _is_answer: np.ndarray = field(init=False, repr=False)
+    _phonetic: Dict[str, np.ndarray] = field(init=False, repr=False)
+    _trigrams: Dict[str, np.ndarray] = field(init=False, repr=False)
+
+    def __attrs_post_init__(self) -> None:
+        key = bytes(self._word_store.codes)
+        if key not in _indices:
+            _indices[key] = build_indices(self._word_store.words())
+        self._words, self._keys, self._phonetic, self._trigrams = _indices[key]
+        self._is_answer = np.zeros(len(self._words), dtype=bool)
+        self._is_answer[np.asarray(self._word_store.answer_ranks)] = True
+
+    @property
+    def max_distance(self) -> int:
+        """
+        A getter method that returns the value of the `max_distance` attribute.
+        :param self: Instance of the class.
+        :return: An integer that represents the value of the `max_distance` attribute.
+        """
+        return self._max_distance
+
+    @max_distance.setter
+    def max_distance(self, value: int) -> None:
+        """
+        A setter method that changes the value of the `max_distance` attribute.
+        :param value: An integer that represents the value of the `max_distance` attribute.
+        :return: None.
+        """
+        setattr(self, "_max_distance", value)
+
+    def _candidates(self, token: str, key: str) -> np.ndarray:
+        """
+        A helper method that returns the ranks of the words sharing the most trigrams with
+        a token, sounding alike counting as PHONETIC_BONUS shared trigrams.
+        """
+        scores = np.zeros(len(self._word_store), dtype=np.int32)
+        postings = [
+            self._trigrams[trigram]
+            for trigram in trigrams(token)
+            if trigram in self._trigrams
+        ]
+        if postings:
+            scores += np.bincount(np.concatenate(postings), minlength=len(scores))
+        sounds_alike = self._phonetic.get(key)
+        if sounds_alike is not None:
+            scores[sounds_alike] += PHONETIC_BONUS
+        if len(scores) > CANDIDATES_COUNT:
+            best = np.argpartition(-scores, CANDIDATES_COUNT - 1)[:CANDIDATES_COUNT]
+        else:
+            # a store this small is a shortlist of its own.
+            best = np.arange(len(scores))
+        return best[scores[best] > 0]
+
+    def closest(self, token: str, limit: int = 5) -> List[Tuple[str, int]]:
+        """
+        A method that returns up to `limit` valid guesses close to a transcribed token,
+        along with their edit distance, the best match first.
+        """
+        token = normalize(token)
+        if not token:
+            return []
+        key = phonetic_key(token)
+        ranked = []
+        for rank in self._candidates(token, key).tolist():
+            word = self._words[rank]
+            distance = edit_distance(token, word)
+            sounds_different = self._keys[rank] != key
+            if sounds_different and distance > self._max_distance:
+                continue
+            ranked.append(
+                (
+                    distance,
+                    sounds_different,
+                    not self._is_answer[rank],
+                    word,
+                )
+            )
+        ranked.sort()
+        return [(word, distance) for distance, _, _, word in ranked[:limit]]
+
+    def match(self, token: str) -> Optional[str]:
+        """
+        A method that maps a transcribed token to the closest valid guess, None if no
+        valid guess sounds alike or is close enough.
+        """
+        token = normalize(token)
+        if token in self._word_store:
+            return token
+        closest = self.closest(token, limit=1)
+        return closest[0][0] if closest else None
+
+
+def main() -> int:
+    word_matcher = WordMatcher(WordStore.open())
+    for token in ("react", "reacts", "reakt", "Rite.", "nite", "xylophone"):
+        print(
+            f"{token!r:>12} -> {word_matcher.match(token)!r} {word_matcher.closest(token)}"
+        )
+    assert word_matcher.match("reakt") == "react"
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+"""
+| The following script implements the guess x answer feedback pattern matrix.
+
+| The feedback of a guess against an answer is stored as a base-3 number: every letter is worth
+| `NOT_IN_WORD`, `IS_IN_WORD` or `IS_IN_POSITION` and the first letter is the most significant digit,
+| so a pattern fits in a `uint8` (0-242). The matrix holds the pattern of every valid word, in rank
+| order, against every answer, in the answers list order. It is computed once on all the cores,
+| written to a versioned cache file and memory-mapped read-only afterwards.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from attrs import (
+    define,
+    field,
+)
+from collections import (
+    Counter,
+)
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+import hashlib
+import numpy as np
+import os
+import struct
+from typing import (
+    Any,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from deepwordle.core.constants import (
+    IS_IN_POSITION,
+    IS_IN_WORD,
+    NOT_IN_WORD,
+    WORD_LENGTH,
+)
+from deepwordle.core.scorer import (
+    Words,
+    score_many,
+    to_letters,
+)
+from deepwordle.core.word_store import (
+    WordStore,
+    get_cache_dir,
+    write_atomically,
+)
+
+PATTERNS_COUNT = 3**WORD_LENGTH
+ALL_IN_POSITION = PATTERNS_COUNT - 1
+MATRIX_FILE_NAME = "patterns.bin"
+
+MAGIC = b"DWPM"
+FORMAT_VERSION = 1
+# magic, version, padding, rows (guesses), columns (answers), then a digest of the words.
+HEADER = struct.Struct("<4sHHII16s")
+ROWS_PER_TASK = 1024
+
+_guesses: np.ndarray = np.empty((0, WORD_LENGTH), dtype=np.uint8)
+_answers: np.ndarray = np.empty((0, WORD_LENGTH), dtype=np.uint8)
+
+
+def feedback_pattern(guess: str, answer: str) -> int:
+    """
+    A function that computes the feedback of a guess against an answer, exactly like
+    `update_letters_state` does it on the `Letter` widgets, as a base-3 pattern.
+    """
+    if guess == answer:
+        return ALL_IN_POSITION
+    counter_dict = Counter(answer)
+    pattern = 0
+    for position, character in enumerate(guess):
+        if answer[position] == character:
+            counter_dict[character] -= 1
+            state = IS_IN_POSITION
+        elif counter_dict.get(character, 0) == 0:
+            state = NOT_IN_WORD
+        else:
+            counter_dict[character] -= 1
+            state = IS_IN_WORD
+        pattern = pattern * 3 + state
+    return pattern
+
+
+def pattern_to_states(pattern: int) -> Tuple[int, ...]:
+    """
+    A function that splits a pattern into the state of each letter.
+    """
+    states = []
+    for _ in range(WORD_LENGTH):
+        pattern, state = divmod(pattern, 3)
+        states.append(state)
+    return tuple(reversed(states))
+
+
+def states_to_pattern(states: Sequence[int]) -> int:
+    """
+    A function that builds a pattern from the state of each letter.
+    """
+    pattern = 0
+    for state in states:
+        pattern = pattern * 3 + state
+    return pattern
+
+
+def words_digest(word_store: WordStore) -> bytes:
+    """
+    A function that fingerprints the words and the answers a matrix is computed for.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(word_store.codes)
+    digest.update(word_store.answer_ranks)
+    return digest.digest()
+
+
+def _init_worker(guesses: np.ndarray, answers: np.ndarray) -> None:
+    global _guesses, _answers
+    _guesses, _answers = guesses, answers
+
+
+def _compute_rows(start: int, stop: int) -> Tuple[int, bytes]:
+    """
+    A helper function that computes the rows [start, stop) of the matrix in a worker.
+    """
+    return start, score_many(_guesses[start:stop], _answers).tobytes()
+
+
+def compute_matrix(
+    guesses: Words, answers: Words, processes: Optional[int] = None
+) -> np.ndarray:
+    """
+    A function that computes the patterns of all the guesses against all the answers,
+    splitting the rows across a pool of `processes` workers, one per core by default.
+    Every worker scores its rows with the vectorized scorer.
+    """
+    guesses, answers = to_letters(guesses), to_letters(answers)
+    matrix = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+    tasks = [
+        (start, min(start + ROWS_PER_TASK, len(guesses)))
+        for start in range(0, len(guesses), ROWS_PER_TASK)
+    ]
+    processes = processes or os.cpu_count() or 1
+    if processes == 1 or len(tasks) == 1:
+        _init_worker(guesses, answers)
+        results = [_compute_rows(start, stop) for start, stop in tasks]
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(guesses, answers),
+        ) as executor:
+            results = list(executor.map(_compute_rows, *zip(*tasks)))
+    for start, rows in results:
+        block = np.frombuffer(rows, dtype=np.uint8).reshape(-1, len(answers))
+        matrix[start : start + len(block)] = block
+    return matrix
+
+
+def build_matrix(
+    word_store: WordStore, path: str, processes: Optional[int] = None
+) -> None:
+    """
+    A function that computes the matrix of a word store and writes it to a cache file.
+    """
+    guesses = np.frombuffer(word_store.codes, dtype=np.uint32)
+    answers = np.frombuffer(word_store.answer_codes(), dtype=np.uint32)
+    matrix = compute_matrix(guesses, answers, processes)
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, 0, len(guesses), len(answers), words_digest(word_store)
+    )
+    write_atomically(path, header, matrix)
+
+
+def _read_header(path: str) -> Optional[Tuple[Any, ...]]:
+    try:
+        with open(path, "rb") as file:
+            content = file.read(HEADER.size)
+    except OSError:
+        return None
+    if len(content) != HEADER.size:
+        return None
+    return HEADER.unpack(content)
+
+
+@define
+class PatternMatrix:
+    """
+    A brief encapsulation of the memory-mapped feedback pattern matrix.
+
+    Attrs:
+        path: the path of the cache file.
+        matrix: a read-only uint8 array of shape (words count, answers count).
+    """
+
+    _path: str = field()
+    _matrix: np.ndarray = field(repr=False)
+
+    @property
+    def path(self) -> str:
+        """
+        A getter method that returns the value of the `path` attribute.
+        :param self: Instance of the class.
+        :return: A string that represents the value of the `path` attribute.
+        """
+        if not hasattr(self, "_path"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named path."
+            )
+        return self._path
+
+    @property
+    def matrix(self) -> np.ndarray:
+        """
+        A getter method that returns the value of the `matrix` attribute.
+        :param self: Instance of the class.
+        :return: A read-only array that represents the value of the `matrix` attribute.
+        """
+        if not hasattr(self, "_matrix"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named matrix."
+            )
+        return self._matrix
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self._matrix.shape
+
+    @classmethod
+    def open(
+        cls,
+        word_store: Optional[WordStore] = None,
+        cache_dir: Optional[str] = None,
+        processes: Optional[int] = None,
+    ) -> "PatternMatrix":
+        """
+        A method that maps the matrix stored in the cache directory, computing it first if
+        it is missing, built by another version or built for other word lists.
+        """
+        word_store = word_store or WordStore.open(cache_dir=cache_dir)
+        path = os.path.join(cache_dir or get_cache_dir(), MATRIX_FILE_NAME)
+        expected = (
+            MAGIC,
+            FORMAT_VERSION,
+            0,
+            len(word_store),
+            word_store.answers_count,
+            words_digest(word_store),
+        )
+        size = HEADER.size + len(word_store) * word_store.answers_count
+        if _read_header(path) != expected or os.path.getsize(path) != size:
+            build_matrix(word_store, path, processes)
+        matrix = np.memmap(
+            path,
+            dtype=np.uint8,
+            mode="r",
+            offset=HEADER.size,
+            shape=(len(word_store), word_store.answers_count),
+        )
+        return cls(path, matrix)
+
+    def pattern(self, guess_rank: int, answer_index: int) -> int:
+        """
+        A method that returns the pattern of a guess, given by its rank in the word store,
+        against an answer, given by its position in the answers list.
+        """
+        return int(self._matrix[guess_rank, answer_index])
+
+    def row(self, guess_rank: int) -> np.ndarray:
+        """
+        A method that returns the patterns of a guess against all the answers.
+        """
+        return self._matrix[guess_rank]
+
+
+def main() -> int:
+    assert feedback_pattern("there", "react") == states_to_pattern((1, 0, 1, 1, 0))
+    assert pattern_to_states(feedback_pattern("react", "react")) == (2,) * WORD_LENGTH
+    word_store = WordStore.open()
+    pattern_matrix = PatternMatrix.open(word_store)
+    print(pattern_matrix, pattern_matrix.shape)
+    guess, answer = word_store.rank("there"), word_store.answer_index("react")
+    assert pattern_matrix.pattern(guess, answer) == feedback_pattern("there", "react")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+| The following script implements the widget-free, vectorized batch scorer.
+
+| It computes the same feedback as `update_letters_state`, duplicate letters included, for one guess
+| against N answers or for M guesses against N answers at once. Words are handled as NumPy arrays of
+| letters unpacked from the packed codes, and the results are base-3 patterns, see `patterns`.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import numpy as np
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Union,
+)
+
+from deepwordle.core.codec import (
+    encode_all,
+    unpack_letters,
+)
+from deepwordle.core.constants import (
+    IS_IN_POSITION,
+    WORD_LENGTH,
+)
+
+# the number of guesses scored at once, it bounds the size of the temporary arrays.
+CHUNK_SIZE = 512
+
+Words = Union[str, int, Iterable[str], Iterable[int], np.ndarray]
+
+
+def to_letters(words: Words) -> np.ndarray:
+    """
+    A function that turns a word, a list of words, a list of packed codes or an array of
+    letters into a `uint8` array of letters of shape (number of words, WORD_LENGTH).
+    """
+    if isinstance(words, np.ndarray) and words.ndim == 2:
+        return words.astype(np.uint8, copy=False)
+    if isinstance(words, (str, int)):
+        words = [words]
+    if not isinstance(words, np.ndarray):
+        words = list(words)
+        if words and isinstance(words[0], str):
+            words = encode_all(words)
+    return unpack_letters(words).reshape(-1, WORD_LENGTH)
+
+
+def _score_letters(guesses: np.ndarray, answers: np.ndarray) -> np.ndarray:
+    """
+    A helper function that scores an array of guess letters against an array of answer
+    letters. It walks the positions left to right like `update_letters_state` does: a
+    letter is in position if it matches, otherwise it is in the word as long as the counter
+    of that letter, the number of times it appears in the answer minus the number of times
+    an earlier letter decremented it, is not 0.
+    """
+    guesses = guesses[:, None, :]
+    answers = answers[None, :, :]
+    patterns = np.zeros((guesses.shape[0], answers.shape[1]), dtype=np.uint8)
+    decremented: List[np.ndarray] = []
+    for position in range(WORD_LENGTH):
+        letter = guesses[..., position]
+        counter = (answers == letter[..., None]).sum(axis=-1, dtype=np.int8)
+        for previous in range(position):
+            counter -= (guesses[..., previous] == letter) & decremented[previous]
+        in_position = answers[..., position] == letter
+        in_word = counter != 0
+        patterns *= 3
+        patterns += np.where(in_position, IS_IN_POSITION, in_word).astype(np.uint8)
+        decremented.append(in_position | in_word)
+    return patterns
+
+
+def score(guess: Union[str, int], answers: Words) -> np.ndarray:
+    """
+    A function that scores one guess against N answers, returning N patterns.
+    """
+    return _score_letters(to_letters(guess), to_letters(answers))[0]
+
+
+def score_many(
+    guesses: Words, answers: Words, chunk_size: int = CHUNK_SIZE
+) -> np.ndarray:
+    """
+    A function that scores M guesses against N answers, returning an array of patterns of
+    shape (M, N). The guesses are scored `chunk_size` at a time.
+    """
+    guesses, answers = to_letters(guesses), to_letters(answers)
+    patterns = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+    for start in range(0, len(guesses), chunk_size):
+        patterns[start : start + chunk_size] = _score_letters(
+            guesses[start : start + chunk_size], answers
+        )
+    return patterns
+
+
+def main() -> int:
+    from deepwordle.core.patterns import (
+        feedback_pattern,
+    )
+
+    answers = ["react", "hello", "abbey", "creep"]
+    patterns: Any = score_many(["there", "lolly", "eerie"], answers)
+    print(patterns)
+    for row, guess in zip(patterns, ["there", "lolly", "eerie"]):
+        assert row.tolist() == [feedback_pattern(guess, answer) for answer in answers]
+    assert score("react", answers)[0] == 3**WORD_LENGTH - 1
+    return 0
+
+
+if __name__ == "__main__":
+    main()
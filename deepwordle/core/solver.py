@@ -0,0 +1,204 @@
+"""
+| The following script implements the entropy-ranking engine behind the hint key.
+
+| The solver keeps the answers that are still consistent with the feedback seen so far and ranks the
+| next guesses by their expected information gain over those candidates. The candidates are narrowed
+| incrementally by the bitset constraint engine, one row of feedback at a time, and the rankings are
+| cached per candidate set, so the opening ranking is computed once per process and reused by every
+| game.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from attrs import (
+    Factory,
+    define,
+    field,
+)
+from collections import (
+    OrderedDict,
+)
+import hashlib
+import numpy as np
+import threading
+from typing import (
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from deepwordle.core.constraints import (
+    ConstraintEngine,
+)
+from deepwordle.core.patterns import (
+    PATTERNS_COUNT,
+    PatternMatrix,
+)
+from deepwordle.core.word_store import (
+    WordStore,
+)
+
+# the number of guesses whose partitions are counted at once.
+CHUNK_SIZE = 1024
+# the number of rankings kept in the cache and the number of guesses kept per ranking.
+CACHE_SIZE = 64
+RANKING_SIZE = 64
+
+Hint = Tuple[str, float]
+
+_rankings: "OrderedDict[bytes, Tuple[np.ndarray, np.ndarray]]" = OrderedDict()
+_rankings_lock = threading.Lock()
+
+
+def partition_entropies(matrix: np.ndarray, candidates: np.ndarray) -> np.ndarray:
+    """
+    A function that computes, for every guess of the matrix, the entropy in bits of the
+    partition of the candidates by feedback pattern, i.e. its expected information gain.
+    """
+    entropies = np.empty(matrix.shape[0], dtype=np.float64)
+    size = len(candidates)
+    for start in range(0, matrix.shape[0], CHUNK_SIZE):
+        block = matrix[start : start + CHUNK_SIZE][:, candidates].astype(np.int32)
+        block += np.arange(len(block), dtype=np.int32)[:, None] * PATTERNS_COUNT
+        counts = np.bincount(block.ravel(), minlength=len(block) * PATTERNS_COUNT)
+        counts = counts.reshape(len(block), PATTERNS_COUNT).astype(np.float64)
+        weighted = counts * np.log2(counts, out=np.zeros_like(counts), where=counts > 0)
+        entropies[start : start + len(block)] = np.log2(size) - weighted.sum(1) / size
+    return entropies
+
+
+@define
+class Solver:
+    """
+    A brief encapsulation of the state of the entropy-ranking engine.
+
+    Attrs:
+        word_store: the indexed word lists.
+        pattern_matrix: the feedback pattern matrix, loaded on the first ranking.
+        cache_dir: the directory of the pattern matrix cache file.
+        constraints: the answers still consistent with the feedback seen so far.
+        lock: serializes the updates coming from the UI and from the background worker.
+    """
+
+    _word_store: WordStore = field()
+    _pattern_matrix: Optional[PatternMatrix] = field(default=None)
+    _cache_dir: Optional[str] = field(default=None)
+    _constraints: ConstraintEngine = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, default=Factory(threading.Lock))
+
+    def __attrs_post_init__(self) -> None:
+        self._constraints = ConstraintEngine(self._word_store)
+
+    @property
+    def constraints(self) -> ConstraintEngine:
+        """
+        A getter method that returns the value of the `constraints` attribute.
+        :param self: Instance of the class.
+        :return: A constraint engine that represents the value of the `constraints` attribute.
+        """
+        if not hasattr(self, "_constraints"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named constraints."
+            )
+        return self._constraints
+
+    @property
+    def candidates(self) -> List[str]:
+        """
+        A getter method that returns the answers still consistent with the feedback.
+        :param self: Instance of the class.
+        :return: A list of strings that represents the remaining candidates.
+        """
+        with self._lock:
+            return self._constraints.candidates()
+
+    @property
+    def candidates_count(self) -> int:
+        """
+        A getter method that returns the number of answers still consistent with the feedback.
+        :param self: Instance of the class.
+        :return: An integer that represents the number of remaining candidates.
+        """
+        return self._constraints.count
+
+    def update(self, guess: Union[str, int], pattern: int) -> None:
+        """
+        A method that narrows the candidates with the feedback pattern received for a guess.
+        """
+        with self._lock:
+            self._constraints.update(guess, pattern)
+
+    def reset(self) -> None:
+        """
+        A method that makes every answer a candidate again, for a new game.
+        """
+        with self._lock:
+            self._constraints.reset()
+
+    def load(self) -> PatternMatrix:
+        """
+        A method that maps the pattern matrix, building it first if needed. It can take a
+        few seconds the very first time, so it is meant to run in a background worker.
+        """
+        if self._pattern_matrix is None:
+            self._pattern_matrix = PatternMatrix.open(self._word_store, self._cache_dir)
+        return self._pattern_matrix
+
+    def rank_guesses(self, top_k: int = 5) -> List[Hint]:
+        """
+        A method that returns the `top_k` guesses with the highest expected information
+        gain in bits over the candidates. Ties go to the guesses that can be the answer.
+        """
+        pattern_matrix = self.load()
+        with self._lock:
+            candidates = self._constraints.survivors()
+        if len(candidates) == 0:
+            return []
+        if len(candidates) == 1:
+            return [(self._word_store.answer(int(candidates[0])), 0.0)]
+        key = hashlib.blake2b(
+            pattern_matrix.path.encode() + candidates.tobytes(), digest_size=16
+        ).digest()
+        with _rankings_lock:
+            ranking = _rankings.get(key)
+            if ranking is not None:
+                _rankings.move_to_end(key)
+        if ranking is None:
+            entropies = partition_entropies(pattern_matrix.matrix, candidates)
+            is_candidate = np.zeros(len(entropies), dtype=bool)
+            is_candidate[np.asarray(self._word_store.answer_ranks)[candidates]] = True
+            order = np.lexsort((~is_candidate, -entropies))
+            ranking = (order[:RANKING_SIZE], entropies[order[:RANKING_SIZE]])
+            with _rankings_lock:
+                _rankings[key] = ranking
+                while len(_rankings) > CACHE_SIZE:
+                    _rankings.popitem(last=False)
+        ranks, entropies = ranking
+        return [
+            (self._word_store.word(int(rank)), float(entropy))
+            for rank, entropy in zip(ranks[:top_k], entropies[:top_k])
+        ]
+
+
+def main() -> int:
+    from deepwordle.core.patterns import (
+        feedback_pattern,
+    )
+
+    solver = Solver(WordStore.open())
+    print(solver.rank_guesses())
+    solver.update("raise", feedback_pattern("raise", "react"))
+    print(solver.candidates_count, solver.rank_guesses())
+    assert "react" in solver.candidates
+    return 0
+
+
+if __name__ == "__main__":
+    main()
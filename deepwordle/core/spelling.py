@@ -0,0 +1,154 @@
+"""
+| The following script implements the decoding of spelled-out words from Deepgram transcripts.
+
+| Speaking a whole word is ambiguous, spelling it is not: "R E A C T", "are ee hey see tee" or "romeo
+| echo alfa charlie tango" all come back from Deepgram as a list of words with their start and end
+| times. Every word is mapped to a letter, through the letter names, the NATO alphabet and the digits
+| the recognizer writes instead of letters, and the letters said close enough to each other are
+| joined into candidate words. A long pause or a word that is not a letter ends a candidate.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+)
+
+from deepwordle.core.constants import (
+    WORD_LENGTH,
+)
+from deepwordle.core.matcher import (
+    normalize,
+)
+from deepwordle.core.word_store import (
+    WordStore,
+)
+
+# the longest silence, in seconds, between two letters of the same word.
+MAX_GAP = 1.0
+
+LETTER_NAMES = {
+    "a": ("a", "ay", "aye", "hey", "eh"),
+    "b": ("b", "be", "bee"),
+    "c": ("c", "see", "sea", "cee"),
+    "d": ("d", "dee"),
+    "e": ("e", "ee"),
+    "f": ("f", "ef", "eff"),
+    "g": ("g", "gee", "jee"),
+    "h": ("h", "aitch", "haitch"),
+    "i": ("i", "eye"),
+    "j": ("j", "jay"),
+    "k": ("k", "kay"),
+    "l": ("l", "el", "ell"),
+    "m": ("m", "em"),
+    "n": ("n", "en"),
+    "o": ("o", "oh", "owe"),
+    "p": ("p", "pee", "pea"),
+    "q": ("q", "queue", "cue", "kew"),
+    "r": ("r", "are", "ar", "our"),
+    "s": ("s", "es", "ess"),
+    "t": ("t", "tee", "tea"),
+    "u": ("u", "you", "yew", "ewe"),
+    "v": ("v", "vee"),
+    "w": ("w", "doubleyou", "doubleu"),
+    "x": ("x", "ex"),
+    "y": ("y", "why", "wye"),
+    "z": ("z", "zee", "zed"),
+}
+NATO_ALPHABET = (
+    "alfa alpha bravo charlie delta echo foxtrot golf hotel india juliet juliett kilo lima mike"
+    " november oscar papa quebec romeo sierra tango uniform victor whiskey whisky xray yankee zulu"
+)
+# the digits deepgram writes when it hears a letter name that sounds like a number.
+DIGITS = {"0": "o", "zero": "o", "8": "a", "eight": "a"}
+# letter names said in two words.
+PAIRS = {("double", "you"): "w", ("double", "u"): "w", ("x", "ray"): "x"}
+
+LETTERS: Dict[str, str] = {
+    name: letter for letter, names in LETTER_NAMES.items() for name in names
+}
+LETTERS.update({name: name[0] for name in NATO_ALPHABET.split()})
+LETTERS.update(DIGITS)
+
+
+def to_letter(token: str) -> Optional[str]:
+    """
+    A function that maps a transcribed token to the letter it spells, None if it is not
+    a letter.
+    """
+    return LETTERS.get(normalize(token)) or LETTERS.get(token.strip(" .,"))
+
+
+def spell(words: Sequence[Mapping[str, Any]], max_gap: float = MAX_GAP) -> List[str]:
+    """
+    A function that turns the `words` of a deepgram response into the candidate words
+    they spell. Letters are joined while they are at most `max_gap` seconds apart.
+    """
+    candidates: List[str] = []
+    letters: List[str] = []
+    end: Optional[float] = None
+    index = 0
+    while index < len(words):
+        token = words[index]
+        letter, size = None, 1
+        if index + 1 < len(words):
+            pair = (normalize(token["word"]), normalize(words[index + 1]["word"]))
+            letter = PAIRS.get(pair)
+            size = 2 if letter else 1
+        letter = letter or to_letter(token["word"])
+        start = token.get("start")
+        if letter is None or (
+            end is not None and start is not None and start - end > max_gap
+        ):
+            if letters:
+                candidates.append("".join(letters))
+            letters = []
+        if letter is not None:
+            letters.append(letter)
+        end = words[index + size - 1].get("end")
+        index += size
+    if letters:
+        candidates.append("".join(letters))
+    return candidates
+
+
+def spelled_word(
+    words: Sequence[Mapping[str, Any]],
+    word_store: WordStore,
+    max_gap: float = MAX_GAP,
+) -> Optional[str]:
+    """
+    A function that returns the first valid guess spelled in the `words` of a deepgram
+    response, looking at every five letters window of the longer candidates too.
+    """
+    for candidate in spell(words, max_gap):
+        for start in range(len(candidate) - WORD_LENGTH + 1):
+            word = candidate[start : start + WORD_LENGTH]
+            if word in word_store:
+                return word
+    return None
+
+
+def main() -> int:
+    words = [
+        {"word": word, "start": index * 0.5, "end": index * 0.5 + 0.3}
+        for index, word in enumerate(["are", "e", "alpha", "see", "tea"])
+    ]
+    print(spell(words))
+    assert spelled_word(words, WordStore.open()) == "react"
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,450 @@
+"""
+| The following script implements a compact, memory-mapped index of the word lists.
+
+| The index is built once from `wordle-guesses.txt` and `wordle-answers.txt`, stored in the
+| cache directory and memory-mapped at startup. Membership, answer-flag and rank lookups are
+| answered in O(1) through an open-addressing hash table stored inside the index file.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from array import (
+    array,
+)
+from attrs import (
+    define,
+    field,
+)
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+from typing import (
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from deepwordle.core.codec import (
+    INVALID,
+    PackedWords,
+    decode,
+    encode,
+)
+
+DATA_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "components", "data"
+)
+GUESSES_FILE = os.path.join(DATA_DIR, "wordle-guesses.txt")
+ANSWERS_FILE = os.path.join(DATA_DIR, "wordle-answers.txt")
+INDEX_FILE_NAME = "words.idx"
+
+MAGIC = b"DWWS"
+FORMAT_VERSION = 1
+# magic, version, byte order, words count, answers count, table size, then the
+# size and the modification time of the guesses and the answers source files.
+HEADER = struct.Struct("<4sHHIII4q")
+LITTLE_ENDIAN = 1
+BIG_ENDIAN = 2
+EMPTY_SLOT = INVALID
+HASH_MULTIPLIER = 0x9E3779B1
+
+
+def get_cache_dir() -> str:
+    """
+    A helper function that returns the directory where the generated caches are stored.
+    `DEEPWORDLE_CACHE_DIR` takes precedence over `XDG_CACHE_HOME`.
+    """
+    cache_dir = os.environ.get("DEEPWORDLE_CACHE_DIR")
+    if not cache_dir:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+            os.path.expanduser("~"), ".cache"
+        )
+        cache_dir = os.path.join(cache_home, "deepwordle")
+    return cache_dir
+
+
+def _slot(code: int, shift: int) -> int:
+    """
+    A helper function that returns the home slot of a code in the hash table.
+    """
+    return ((code * HASH_MULTIPLIER) & 0xFFFFFFFF) >> shift
+
+
+def _read_words(path: str) -> List[str]:
+    """
+    A helper function that reads a word list and validates each one of its words.
+    """
+    with open(path, "r") as file:
+        words = [line.strip().lower() for line in file if line.strip()]
+    for word in words:
+        if encode(word) == INVALID:
+            raise ValueError(f"Invalid word {word!r} found in {path!r}.")
+    return words
+
+
+def _fingerprint(paths: Iterable[str]) -> Tuple[int, ...]:
+    """
+    A helper function that returns the size and the modification time of each source file.
+    """
+    fingerprint: List[int] = []
+    for path in paths:
+        stat = os.stat(path)
+        fingerprint.extend((stat.st_size, stat.st_mtime_ns))
+    return tuple(fingerprint)
+
+
+def _byte_order() -> int:
+    return LITTLE_ENDIAN if sys.byteorder == "little" else BIG_ENDIAN
+
+
+def build_index(
+    guesses_path: str = GUESSES_FILE, answers_path: str = ANSWERS_FILE
+) -> bytes:
+    """
+    A function that builds the binary index of both word lists. The layout is:
+
+    * header: see `HEADER`.
+    * words: uint32[words count], every word packed and sorted, so the rank is the position.
+    * answer ids: int32[words count], the position of each word in the answers list or -1.
+    * answers: uint32[answers count], the rank of each answer in the answers list order.
+    * keys: uint32[table size], the hash table of the packed words, 0 is an empty slot.
+    * ranks: uint32[table size], the rank of the word stored in the same slot.
+    """
+    fingerprint = _fingerprint((guesses_path, answers_path))
+    answers = list(dict.fromkeys(_read_words(answers_path)))
+    words = sorted(set(_read_words(guesses_path)).union(answers))
+    codes = array("I", map(encode, words))
+    rank_of = {word: rank for rank, word in enumerate(words)}
+    answer_ids = array("i", [-1]) * len(words)
+    answer_ranks = array("I", [0]) * len(answers)
+    for index, word in enumerate(answers):
+        answer_ids[rank_of[word]] = index
+        answer_ranks[index] = rank_of[word]
+    # a power of two at least twice as big as the number of words keeps the probes short.
+    table_size = 1 << max(4, (2 * len(words) - 1).bit_length())
+    shift = 32 - (table_size.bit_length() - 1)
+    keys = array("I", [EMPTY_SLOT]) * table_size
+    ranks = array("I", [0]) * table_size
+    for rank, code in enumerate(codes):
+        slot = _slot(code, shift)
+        while keys[slot] != EMPTY_SLOT:
+            slot = (slot + 1) & (table_size - 1)
+        keys[slot] = code
+        ranks[slot] = rank
+    header = HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        _byte_order(),
+        len(words),
+        len(answers),
+        table_size,
+        *fingerprint,
+    )
+    return b"".join(
+        (
+            header,
+            codes.tobytes(),
+            answer_ids.tobytes(),
+            answer_ranks.tobytes(),
+            keys.tobytes(),
+            ranks.tobytes(),
+        )
+    )
+
+
+def _is_fresh(buffer: Union[bytes, mmap.mmap], fingerprint: Tuple[int, ...]) -> bool:
+    """
+    A helper function that checks whether an index was built by this version of the
+    builder, on this platform and from the current content of the source files.
+    """
+    if len(buffer) < HEADER.size:
+        return False
+    header = HEADER.unpack_from(buffer)
+    magic, version, byte_order, words_count, answers_count, table_size = header[:6]
+    size = HEADER.size + 4 * (2 * words_count + answers_count + 2 * table_size)
+    return (
+        magic == MAGIC
+        and version == FORMAT_VERSION
+        and byte_order == _byte_order()
+        and len(buffer) == size
+        and header[6:] == fingerprint
+    )
+
+
+def write_atomically(path: str, *chunks: Any) -> None:
+    """
+    A function that writes a file next to its destination then moves it in place, so that
+    concurrent sessions never map a half written file. Chunks are any bytes-like objects.
+    """
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    file_descriptor, temporary_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            for chunk in chunks:
+                file.write(chunk)
+        os.replace(temporary_path, path)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.unlink(temporary_path)
+        raise
+
+
+@define
+class WordStore:
+    """
+    A brief encapsulation of the indexed word lists.
+
+    Attrs:
+        path: the path of the index file, None if the index lives in memory only.
+        buffer: the memory-mapped content of the index file.
+        words: the packed words sorted alphabetically.
+        answer_ids: the position of each word in the answers list, -1 if not an answer.
+        answers: the rank of each answer.
+        keys: the hash table slots.
+        ranks: the rank of the word stored in each hash table slot.
+        shift: the number of bits dropped by the hash function.
+    """
+
+    _path: Optional[str] = field(default=None)
+    _buffer: Union[bytes, mmap.mmap] = field(default=b"", repr=False)
+    _words: memoryview = field(init=False, repr=False)
+    _answer_ids: memoryview = field(init=False, repr=False)
+    _answers: memoryview = field(init=False, repr=False)
+    _keys: memoryview = field(init=False, repr=False)
+    _ranks: memoryview = field(init=False, repr=False)
+    _shift: int = field(init=False, repr=False)
+
+    @property
+    def path(self) -> Optional[str]:
+        """
+        A getter method that returns the value of the `path` attribute.
+        :param self: Instance of the class.
+        :return: A string that represents the value of the `path` attribute.
+        """
+        if not hasattr(self, "_path"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named path."
+            )
+        return self._path
+
+    @property
+    def answers_count(self) -> int:
+        """
+        A getter method that returns the number of answers in the store.
+        :param self: Instance of the class.
+        :return: An integer that represents the number of answers.
+        """
+        return len(self._answers)
+
+    @property
+    def codes(self) -> memoryview:
+        """
+        A getter method that returns the packed words sorted alphabetically, see `codec`.
+        :param self: Instance of the class.
+        :return: A read-only view of unsigned integers over the index.
+        """
+        return self._words
+
+    @property
+    def answer_ranks(self) -> memoryview:
+        """
+        A getter method that returns the rank of each answer in the answers list order.
+        :param self: Instance of the class.
+        :return: A read-only view of unsigned integers over the index.
+        """
+        return self._answers
+
+    def __attrs_post_init__(self) -> None:
+        _, _, _, words_count, answers_count, table_size = HEADER.unpack_from(
+            self._buffer
+        )[:6]
+        view = memoryview(self._buffer)
+        offset = HEADER.size
+        sections = []
+        for fmt, count in (
+            ("I", words_count),
+            ("i", words_count),
+            ("I", answers_count),
+            ("I", table_size),
+            ("I", table_size),
+        ):
+            sections.append(view[offset : offset + 4 * count].cast(fmt))
+            offset += 4 * count
+        (
+            self._words,
+            self._answer_ids,
+            self._answers,
+            self._keys,
+            self._ranks,
+        ) = sections
+        self._shift = 32 - (table_size.bit_length() - 1)
+
+    @classmethod
+    def open(
+        cls,
+        guesses_path: str = GUESSES_FILE,
+        answers_path: str = ANSWERS_FILE,
+        cache_dir: Optional[str] = None,
+    ) -> "WordStore":
+        """
+        A method that maps the index stored in the cache directory, rebuilding it first
+        if it is missing or older than the word lists. If the cache directory is not
+        writable, the index is built and kept in memory.
+        """
+        path = os.path.join(cache_dir or get_cache_dir(), INDEX_FILE_NAME)
+        fingerprint = _fingerprint((guesses_path, answers_path))
+        buffer = _map(path)
+        if buffer is not None and _is_fresh(buffer, fingerprint):
+            return cls(path, buffer)
+        if buffer is not None:
+            buffer.close()
+        content = build_index(guesses_path, answers_path)
+        try:
+            write_atomically(path, content)
+        except OSError:
+            return cls(None, content)
+        return cls(path, _map(path) or content)
+
+    def close(self) -> None:
+        """
+        A method that releases the views and the memory map of the index.
+        """
+        for view in (
+            self._words,
+            self._answer_ids,
+            self._answers,
+            self._keys,
+            self._ranks,
+        ):
+            view.release()
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+
+    def _lookup(self, word: Union[str, int]) -> int:
+        """
+        A helper method that returns the rank of a word, given as a string or as a packed
+        code, or -1 if it is not in the store.
+        """
+        code = word if isinstance(word, int) else encode(word)
+        if code == EMPTY_SLOT:
+            return -1
+        mask = len(self._keys) - 1
+        slot = _slot(code, self._shift)
+        while True:
+            key = self._keys[slot]
+            if key == code:
+                return self._ranks[slot]
+            if key == EMPTY_SLOT:
+                return -1
+            slot = (slot + 1) & mask
+
+    def __contains__(self, word: object) -> bool:
+        return self._lookup(word) >= 0  # type: ignore
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def rank(self, word: Union[str, int]) -> int:
+        """
+        A method that returns the alphabetical rank of a word among all the valid words.
+        """
+        rank = self._lookup(word)
+        if rank < 0:
+            raise KeyError(word)
+        return rank
+
+    def is_answer(self, word: Union[str, int]) -> bool:
+        """
+        A method that checks whether a word belongs to the answers list.
+        """
+        rank = self._lookup(word)
+        return rank >= 0 and self._answer_ids[rank] >= 0
+
+    def answer_index(self, word: Union[str, int]) -> int:
+        """
+        A method that returns the position of a word in the answers list, -1 otherwise.
+        """
+        rank = self._lookup(word)
+        return self._answer_ids[rank] if rank >= 0 else -1
+
+    def word(self, rank: int) -> str:
+        """
+        A method that returns the word of a given rank.
+        """
+        return decode(self._words[rank])
+
+    def answer(self, index: int) -> str:
+        """
+        A method that returns the answer at a given position of the answers list.
+        """
+        return decode(self._words[self._answers[index]])
+
+    def words(self) -> List[str]:
+        """
+        A method that returns all the valid words in rank order.
+        """
+        return [decode(code) for code in self._words]
+
+    def answers(self) -> List[str]:
+        """
+        A method that returns the answers list.
+        """
+        return [decode(self._words[rank]) for rank in self._answers]
+
+    def packed_words(self) -> PackedWords:
+        """
+        A method that copies all the valid words into a `PackedWords` dictionary.
+        """
+        return PackedWords.from_buffer(self._words)
+
+    def answer_codes(self) -> "array[int]":
+        """
+        A method that returns the packed answers in the answers list order.
+        """
+        return array("I", (self._words[rank] for rank in self._answers))
+
+    def random_answer(self) -> str:
+        """
+        A method that picks a random secret word from the answers list.
+        """
+        return self.answer(random.randrange(self.answers_count))
+
+
+def _map(path: str) -> Optional[mmap.mmap]:
+    """
+    A helper function that maps an index file in read-only mode, None if it can't be read.
+    """
+    try:
+        with open(path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+
+
+def main() -> int:
+    word_store = WordStore.open()
+    print(word_store)
+    assert "react" in word_store
+    assert word_store.is_answer("react")
+    assert "aahed" in word_store and not word_store.is_answer("aahed")
+    assert "zzzzz" not in word_store
+    assert word_store.word(word_store.rank("react")) == "react"
+    print(len(word_store), word_store.answers_count, word_store.random_answer())
+    return 0
+
+
+if __name__ == "__main__":
+    main()
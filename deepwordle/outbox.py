@@ -0,0 +1,276 @@
+"""
+| The following script implements the outbox the results are tweeted from.
+
+| Posting a tweet is a network round trip, and a rate limited account has to wait up to fifteen
+| minutes before posting again: none of it may happen in a key handler. A result is put in the outbox
+| and the key handler returns at once. A worker task sends the posts one after the other, each in a
+| thread, and reads the rate limit headers of every response: once the limit is reached, the next
+| post waits for the reset time the API gave rather than being retried blindly. The other transient
+| failures are retried after a jittered exponential backoff, and the rejected posts are dropped.
+
+| The posts are written to a journal before being sent, so the ones still pending when the game is
+| quit are sent on the next launch. Every change of the status of a post is reported to a callback,
+| the message panel in the game.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import asyncio
+from attrs import (
+    define,
+    field,
+)
+import json
+import os
+import random
+import time
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+)
+import uuid
+
+from deepwordle.core.word_store import (
+    get_cache_dir,
+)
+
+JOURNAL_FILE_NAME = "outbox.jsonl"
+# the statuses worth a retry, a rate limit is waited for until its reset time instead.
+RATE_LIMITED = 429
+RETRY_STATUSES = {500, 502, 503, 504}
+# the seconds waited after a rate limit without a reset time, the window of the API.
+RATE_LIMIT_WINDOW = 15 * 60.0
+# the upper bound of the first backoff, doubled on every retry up to MAX_BACKOFF.
+BACKOFF = 1.0
+MAX_BACKOFF = 60.0
+# the attempts of a post failing for another reason than a rate limit.
+ATTEMPTS = 5
+
+
+def journal_path() -> str:
+    return os.environ.get(
+        "DEEPWORDLE_OUTBOX", os.path.join(get_cache_dir(), JOURNAL_FILE_NAME)
+    )
+
+
+@define
+class Post:
+    """
+    A brief encapsulation of a tweet waiting in the outbox.
+
+    Attrs:
+        id: the identifier of the post in the journal.
+        text: the text of the tweet.
+        attempts: the number of failed attempts to send it, rate limits aside.
+    """
+
+    id: str
+    text: str
+    attempts: int = field(default=0)
+
+
+@define
+class Outbox:
+    """
+    A brief encapsulation of the queue of the tweets to post and of the worker posting them.
+
+    Attrs:
+        send: posts a text and returns the HTTP response, blocking: a `requests.Response`.
+        path: the journal of the posts, in JSON lines.
+        on_status: called with a description of every change of status of a post.
+        backoff: the upper bound of the first backoff, in seconds.
+        random: the generator the backoffs are drawn from.
+        queue: the posts waiting to be sent, in order.
+        resume_at: the time, since the epoch, before which nothing is sent.
+        worker: the task sending the posts, while running.
+        sent: the number of posts sent so far.
+    """
+
+    _send: Callable[[str], Any]
+    _path: str = field(factory=journal_path)
+    _on_status: Optional[Callable[[str], None]] = field(default=None)
+    _backoff: float = field(default=BACKOFF)
+    _random: random.Random = field(factory=random.Random, repr=False)
+    _queue: Optional["asyncio.Queue[Post]"] = field(init=False, default=None)
+    _resume_at: float = field(init=False, default=0.0)
+    _worker: Optional[asyncio.Task] = field(init=False, default=None, repr=False)
+    _sent: int = field(init=False, default=0)
+
+    @property
+    def path(self) -> str:
+        """
+        A getter method that returns the value of the `path` attribute.
+        :param self: Instance of the class.
+        :return: A string that represents the value of the `path` attribute.
+        """
+        if not hasattr(self, "_path"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named path."
+            )
+        return self._path
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    @property
+    def sent(self) -> int:
+        return self._sent
+
+    def _report(self, status: str) -> None:
+        if self._on_status is not None:
+            self._on_status(status)
+
+    def _journal(self, entry: Dict[str, Any]) -> None:
+        with open(self._path, "a") as journal:
+            journal.write(json.dumps(entry) + "\n")
+            journal.flush()
+            os.fsync(journal.fileno())
+
+    def load(self) -> List[Post]:
+        """
+        A method that replays the journal, returns the posts still pending and compacts the
+        journal down to them.
+        """
+        posts: Dict[str, Post] = {}
+        if os.path.exists(self._path):
+            with open(self._path) as journal:
+                for line in journal:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # a line cut short by a crash.
+                        continue
+                    if entry["op"] == "queued":
+                        posts[entry["id"]] = Post(entry["id"], entry["text"])
+                    else:
+                        posts.pop(entry["id"], None)
+        directory = os.path.dirname(self._path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temporary_path = f"{self._path}.tmp"
+        with open(temporary_path, "w") as journal:
+            for post in posts.values():
+                journal.write(
+                    json.dumps({"op": "queued", "id": post.id, "text": post.text})
+                    + "\n"
+                )
+        os.replace(temporary_path, self._path)
+        return list(posts.values())
+
+    def start(self) -> None:
+        """
+        A method that starts the worker, the posts left pending by the last session first.
+        """
+        self._queue = asyncio.Queue()
+        pending = self.load()
+        for post in pending:
+            self._queue.put_nowait(post)
+        if pending:
+            self._report(f"Sending {len(pending)} tweet(s) left from last time...")
+        self._worker = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        A method that stops the worker, the posts not sent yet stay in the journal.
+        """
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+    def put(self, text: str) -> Post:
+        """
+        A method that journals a tweet and queues it, it returns at once.
+        """
+        if self._queue is None:
+            raise RuntimeError("The outbox is not started.")
+        post = Post(uuid.uuid4().hex, text)
+        self._journal({"op": "queued", "id": post.id, "text": post.text})
+        self._queue.put_nowait(post)
+        self._report("Tweet queued...")
+        return post
+
+    async def join(self) -> None:
+        """
+        A method that waits for every queued post to be sent or dropped.
+        """
+        if self._queue is not None:
+            await self._queue.join()
+
+    def backoff(self, attempts: int) -> float:
+        bound = min(MAX_BACKOFF, self._backoff * 2 ** (attempts - 1))
+        return self._random.uniform(0, bound)
+
+    def _rate_limit(self, headers: Any, exhausted: bool) -> None:
+        """
+        A helper method that schedules the next post after the reset of the rate limit, when
+        the limit was hit or the response says no request is left.
+        """
+        remaining = headers.get("x-rate-limit-remaining")
+        if not exhausted and remaining != "0":
+            return
+        reset = headers.get("x-rate-limit-reset")
+        now = time.time()
+        self._resume_at = float(reset) if reset else now + RATE_LIMIT_WINDOW
+        self._resume_at = max(self._resume_at, now)
+
+    async def _attempt(self, post: Post) -> bool:
+        """
+        A helper method that sends a post once and returns whether it is done with, sent or
+        dropped.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            response = await loop.run_in_executor(None, self._send, post.text)
+        except Exception as error:
+            # the request did not go through: no connection, a timeout...
+            status, headers, reason = None, {}, str(error)
+        else:
+            status, headers = response.status_code, response.headers
+            reason = f"HTTP {status}"
+        if status is not None and status < 400:
+            self._rate_limit(headers, False)
+            self._journal({"op": "sent", "id": post.id})
+            self._sent += 1
+            self._report("Tweet posted!")
+            return True
+        if status == RATE_LIMITED:
+            self._rate_limit(headers, True)
+            resume = time.strftime("%H:%M:%S", time.localtime(self._resume_at))
+            self._report(f"Rate limited by twitter, the tweet is sent at {resume}.")
+            return False
+        post.attempts += 1
+        if (status is None or status in RETRY_STATUSES) and post.attempts < ATTEMPTS:
+            delay = self.backoff(post.attempts)
+            self._resume_at = time.time() + delay
+            self._report(f"Tweeting failed ({reason}), retrying in {delay:.0f} s...")
+            return False
+        self._journal({"op": "dropped", "id": post.id, "reason": reason})
+        self._report(f"Tweeting failed ({reason}), the tweet is dropped.")
+        return True
+
+    async def _run(self) -> None:
+        while True:
+            post = await self._queue.get()
+            try:
+                while True:
+                    delay = self._resume_at - time.time()
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                    if await self._attempt(post):
+                        break
+            finally:
+                self._queue.task_done()
@@ -0,0 +1,383 @@
+"""
+| The following script implements the speech recognizer backends and their benchmark.
+
+| Every backend turns a WAV file held in memory into a response shaped like the ones of Deepgram, so
+| the game does not care which one it talks to:
+
+| - ``deepgram``: the Deepgram prerecorded endpoint, one network round trip per guess.
+| - ``local``: a Vosk model running on the CPU, with a grammar limited to the words of the game and the
+|   names of the letters, so it can only ever hear a valid guess or a spelled letter.
+
+| The backend is picked with the ``DEEPWORDLE_RECOGNIZER`` environment variable or the ``--recognizer``
+| option, and ``deepwordle benchmark CLIPS`` compares the latency and the accuracy of the backends on
+| the same recordings.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import argparse
+import asyncio
+from attrs import (
+    define,
+    field,
+)
+import io
+import json
+import numpy as np
+import os
+import threading
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+import wave
+
+from deepwordle.audio.capture import (
+    RATE,
+)
+from deepwordle.audio.preprocess import (
+    TARGET_RATE,
+)
+from deepwordle.core.matcher import (
+    WordMatcher,
+)
+from deepwordle.core.spelling import (
+    LETTERS,
+    PAIRS,
+)
+from deepwordle.core.word_store import (
+    WordStore,
+)
+from deepwordle.transcribe import (
+    Buffer,
+    Recognizer,
+)
+
+DEFAULT_BACKEND = os.environ.get("DEEPWORDLE_RECOGNIZER", "deepgram")
+# the token vosk returns for the audio outside of the grammar.
+UNKNOWN = "[unk]"
+
+
+def transcript_response(words: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    A function that wraps recognized words in a response shaped like the ones of
+    Deepgram's prerecorded endpoint.
+    """
+    confidence = (
+        float(np.mean([item["confidence"] for item in words])) if words else 0.0
+    )
+    return {
+        "results": {
+            "channels": [
+                {
+                    "alternatives": [
+                        {
+                            "transcript": " ".join(item["word"] for item in words),
+                            "confidence": confidence,
+                            "words": words,
+                        }
+                    ]
+                }
+            ]
+        }
+    }
+
+
+def response_words(response: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    return response["results"]["channels"][0]["alternatives"][0]["words"]
+
+
+@define
+class LocalRecognizer:
+    """
+    A speech recognizer running on the CPU, limited to the vocabulary of the game.
+
+    Attrs:
+        model_path: the directory of the vosk model, the small English model by default.
+        word_store: the words the grammar is made of.
+        engine: the vosk module, imported on the first recognition.
+        rates: the sample rates the grammar is compiled for ahead of the first guess, those
+            of the microphone and of the preprocessed recordings.
+        model: the loaded model.
+        recognizers: the recognizer compiled with the grammar, for every sample rate.
+        lock: serializes the recognitions, a recognizer is not thread safe.
+    """
+
+    _model_path: Optional[str] = field(default=os.environ.get("DEEPWORDLE_VOSK_MODEL"))
+    _word_store: Optional[WordStore] = field(default=None)
+    _engine: Any = field(default=None, repr=False)
+    _rates: Tuple[int, ...] = field(default=(RATE, TARGET_RATE))
+    _model: Any = field(init=False, default=None, repr=False)
+    _recognizers: Dict[int, Any] = field(init=False, factory=dict, repr=False)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock, repr=False)
+
+    @classmethod
+    def create(cls, word_store: Optional[WordStore] = None) -> "LocalRecognizer":
+        return cls(word_store=word_store)
+
+    @property
+    def model_path(self) -> Optional[str]:
+        """
+        A getter method that returns the value of the `model_path` attribute.
+        :param self: Instance of the class.
+        :return: A string that represents the value of the `model_path` attribute.
+        """
+        if not hasattr(self, "_model_path"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named model_path."
+            )
+        return self._model_path
+
+    @model_path.setter
+    def model_path(self, value: Optional[str]) -> None:
+        """
+        A setter method that changes the value of the `model_path` attribute.
+        :param value: A string that represents the value of the `model_path` attribute.
+        :return: None.
+        """
+        setattr(self, "_model_path", value)
+
+    def grammar(self) -> List[str]:
+        """
+        A method that returns the phrases the recognizer is limited to: the valid guesses,
+        the names of the letters and the unknown token.
+        """
+        word_store = (
+            self._word_store if self._word_store is not None else WordStore.open()
+        )
+        letters = {name for name in LETTERS if name.isalpha()}
+        letters.update(word for pair in PAIRS for word in pair)
+        return word_store.words() + sorted(letters) + [UNKNOWN]
+
+    def load(self) -> None:
+        """
+        A method that imports vosk and loads the model, it takes a few seconds and is done
+        on the first recognition unless called beforehand.
+        """
+        if self._engine is None:
+            import vosk  # type: ignore
+
+            vosk.SetLogLevel(-1)
+            self._engine = vosk
+        if self._model is None:
+            if self._model_path:
+                self._model = self._engine.Model(self._model_path)
+            else:
+                self._model = self._engine.Model(lang="en-us")
+
+    def compile(self) -> None:
+        """
+        A method that loads the model and compiles the grammar for every sample rate of
+        `rates`, rather than within the first guess and its timeout.
+        """
+        with self._lock:
+            for rate in self._rates:
+                self._recognizer(rate)
+
+    def _recognizer(self, rate: int) -> Any:
+        if rate not in self._recognizers:
+            self.load()
+            self._recognizers[rate] = self._engine.KaldiRecognizer(
+                self._model, rate, json.dumps(self.grammar())
+            )
+            self._recognizers[rate].SetWords(True)
+        return self._recognizers[rate]
+
+    def transcribe(self, audio: Buffer) -> Dict[str, Any]:
+        """
+        A method that recognizes the words of a mono int16 WAV file, blocking.
+        """
+        with wave.open(io.BytesIO(audio), "rb") as wave_file:
+            rate = wave_file.getframerate()
+            frames = wave_file.readframes(wave_file.getnframes())
+        with self._lock:
+            recognizer = self._recognizer(rate)
+            recognizer.AcceptWaveform(frames)
+            result = json.loads(recognizer.FinalResult())
+        words = [
+            {
+                "word": item["word"],
+                "start": item["start"],
+                "end": item["end"],
+                "confidence": item.get("conf", 1.0),
+            }
+            for item in result.get("result", [])
+            if item["word"] != UNKNOWN
+        ]
+        return transcript_response(words)
+
+    async def warm(self) -> Optional[float]:
+        """
+        Load the model and compile the grammar in a background thread ahead of the first
+        guess, the seconds it took are returned.
+        """
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.compile)
+        return time.perf_counter() - start
+
+    async def close(self) -> None:
+        pass
+
+    async def recognize(self, audio: Buffer, mimetype: str = "audio/wav"):
+        """
+        Transcribe a WAV file held in memory in a background thread.
+        """
+        if mimetype != "audio/wav":
+            raise ValueError(f"The local recognizer cannot read {mimetype!r} audio.")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.transcribe, bytes(audio))
+
+
+RecognizerBackend = Union[Recognizer, LocalRecognizer]
+
+BACKENDS: Dict[str, Type[RecognizerBackend]] = {
+    "deepgram": Recognizer,
+    "local": LocalRecognizer,
+}
+
+
+def create_recognizer(
+    name: Optional[str] = None, word_store: Optional[WordStore] = None
+) -> RecognizerBackend:
+    """
+    A function that creates the recognizer backend called `name`, the one configured by
+    the DEEPWORDLE_RECOGNIZER environment variable by default.
+    """
+    name = name or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown recognizer {name!r}, expected one of {', '.join(sorted(BACKENDS))}."
+        )
+    return BACKENDS[name].create(word_store)
+
+
+def load_clips(directory: str) -> List[Tuple[str, bytes]]:
+    """
+    A function that loads the WAV clips of a directory along with the word said in each,
+    the beginning of the file name: `react.wav` or `react-2.wav`.
+    """
+    clips = []
+    for file_name in sorted(os.listdir(directory)):
+        stem, extension = os.path.splitext(file_name)
+        if extension.lower() != ".wav":
+            continue
+        with open(os.path.join(directory, file_name), "rb") as clip:
+            clips.append((stem.split("-")[0].split("_")[0].lower(), clip.read()))
+    return clips
+
+
+def heard_word(response: Mapping[str, Any], word_matcher: WordMatcher) -> Optional[str]:
+    """
+    A function that maps a response to the valid guess the game would fill in.
+    """
+    words = response_words(response)
+    word = word_matcher.match(words[0]["word"]) if words else None
+    if word is None and len(words) > 1:
+        word = word_matcher.match("".join(item["word"] for item in words))
+    return word
+
+
+@define
+class BenchmarkReport:
+    """
+    A brief encapsulation of the latency and the accuracy of a backend on a set of clips.
+
+    Attrs:
+        backend: the name of the backend.
+        latencies: the seconds every recognition took.
+        correct: the number of clips mapped to the word said.
+        failures: the number of recognitions that raised.
+    """
+
+    backend: str
+    latencies: List[float] = field(factory=list)
+    correct: int = field(default=0)
+    failures: int = field(default=0)
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct / len(self.latencies) if self.latencies else 0.0
+
+    def format(self) -> str:
+        if not self.latencies:
+            return f"{self.backend:<10} no clips"
+        p50, p90 = np.percentile(self.latencies, [50, 90]) * 1e3
+        return (
+            f"{self.backend:<10} {len(self.latencies):>5} clips  "
+            f"accuracy {self.accuracy:>6.1%}  p50 {p50:>7.1f} ms  p90 {p90:>7.1f} ms  "
+            f"failures {self.failures}"
+        )
+
+
+async def benchmark(
+    name: str,
+    recognizer: RecognizerBackend,
+    clips: Sequence[Tuple[str, bytes]],
+    word_matcher: WordMatcher,
+) -> BenchmarkReport:
+    """
+    A function that recognizes every clip with a backend, one after the other.
+    """
+    report = BenchmarkReport(name)
+    for word, audio in clips:
+        start = time.perf_counter()
+        try:
+            response = await recognizer.recognize(audio, "audio/wav")
+        except Exception:
+            report.failures += 1
+            response = transcript_response([])
+        report.latencies.append(time.perf_counter() - start)
+        report.correct += heard_word(response, word_matcher) == word
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="deepwordle benchmark",
+        description="Compare the recognizer backends on a directory of WAV clips.",
+    )
+    parser.add_argument("clips", help="a directory of clips named after the word said")
+    parser.add_argument(
+        "--backend",
+        action="append",
+        choices=sorted(BACKENDS),
+        help="the backends to compare, all of them by default",
+    )
+    args = parser.parse_args(argv)
+    clips = load_clips(args.clips)
+    word_store = WordStore.open()
+    word_matcher = WordMatcher(word_store)
+
+    async def run(name: str, recognizer: RecognizerBackend) -> BenchmarkReport:
+        # the model is loaded and the connection opened before the clock starts.
+        await recognizer.warm()
+        try:
+            return await benchmark(name, recognizer, clips, word_matcher)
+        finally:
+            await recognizer.close()
+
+    for name in args.backend or sorted(BACKENDS):
+        recognizer = create_recognizer(name, word_store)
+        print(asyncio.run(run(name, recognizer)).format())
+        if isinstance(recognizer, Recognizer):
+            print(f"{'':<10} {recognizer.stats.format()}")
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""
+| The following script implements the request layer wrapped around the speech recognizers.
+
+| A recognition has a deadline: past it, the guess fails with an error the player can act on rather
+| than the game waiting forever. Within the deadline, every attempt has its own timeout and the
+| transient failures, a dropped connection, a timeout, a 429 or a 5xx, are retried after a randomly
+| jittered exponential backoff, so the retries of many clients do not hit the endpoint in lockstep.
+
+| Optionally, the requests are hedged: when an attempt takes longer than the 95th percentile of the
+| latencies seen so far, a second identical request is sent and whichever response comes first is
+| kept, the other request being cancelled. The tail latency is cut at the price of about 5% more
+| requests.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import asyncio
+from attrs import (
+    define,
+    field,
+)
+import random
+import time
+from typing import (
+    Any,
+    Optional,
+)
+
+from deepwordle.recognizers import (
+    RecognizerBackend,
+)
+from deepwordle.tracing import (
+    Histogram,
+)
+from deepwordle.transcribe import (
+    Buffer,
+)
+
+# the seconds a recognition may take, retries included.
+DEADLINE = 8.0
+# the seconds a single attempt may take before it is retried.
+ATTEMPT_TIMEOUT = 3.0
+ATTEMPTS = 3
+# the upper bound of the first backoff, doubled on every retry up to MAX_BACKOFF.
+BACKOFF = 0.2
+MAX_BACKOFF = 2.0
+HEDGE_QUANTILE = 0.95
+# the hedging delay until enough latencies were seen to estimate the quantile.
+HEDGE_DELAY = 1.0
+MIN_HEDGE_DELAY = 0.05
+MIN_HEDGE_SAMPLES = 20
+# the statuses worth a retry: rate limited and the errors of the server.
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+def deadline_exceeded(deadline: float) -> TimeoutError:
+    """
+    A function that returns the error a recognition missing its deadline fails with.
+    """
+    return TimeoutError(f"No transcript within {deadline:g} seconds.")
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    A function that tells whether a failed request may succeed when sent again.
+    """
+    import aiohttp
+
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status in RETRY_STATUSES
+    return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+@define
+class ResilienceStats:
+    """
+    A brief encapsulation of what the request layer did.
+
+    Attrs:
+        requests: the number of recognitions asked for.
+        attempts: the number of requests sent, retries and hedges included.
+        retries: the number of attempts sent after a transient failure.
+        hedged: the number of attempts doubled by a hedged request.
+        hedge_wins: the number of hedged requests answering first.
+        timeouts: the number of recognitions that missed their deadline.
+        failures: the number of recognitions that failed.
+    """
+
+    requests: int = field(default=0)
+    attempts: int = field(default=0)
+    retries: int = field(default=0)
+    hedged: int = field(default=0)
+    hedge_wins: int = field(default=0)
+    timeouts: int = field(default=0)
+    failures: int = field(default=0)
+
+    def format(self) -> str:
+        return (
+            f"{self.requests} recognitions, {self.attempts} attempts, {self.retries} retries, "
+            f"{self.hedged} hedged ({self.hedge_wins} won), {self.timeouts} timeouts, "
+            f"{self.failures} failures"
+        )
+
+
+@define
+class ResilientRecognizer:
+    """
+    A brief encapsulation of a recognizer backend behind deadlines, retries and hedging.
+
+    Attrs:
+        backend: the recognizer the requests are sent to.
+        deadline: the seconds a recognition may take, retries included.
+        attempt_timeout: the seconds a single attempt may take.
+        attempts: the number of attempts of a recognition, the first one included.
+        backoff: the upper bound of the first backoff, in seconds.
+        hedge: whether a slow attempt is doubled by a second request.
+        random: the generator the backoffs are drawn from.
+        latencies: the histogram of the latencies of the successful attempts.
+        stats: what the request layer did so far.
+    """
+
+    _backend: RecognizerBackend
+    _deadline: float = field(default=DEADLINE)
+    _attempt_timeout: float = field(default=ATTEMPT_TIMEOUT)
+    _attempts: int = field(default=ATTEMPTS)
+    _backoff: float = field(default=BACKOFF)
+    _hedge: bool = field(default=False)
+    _random: random.Random = field(factory=random.Random, repr=False)
+    _latencies: Histogram = field(init=False, factory=Histogram, repr=False)
+    _stats: ResilienceStats = field(init=False, factory=ResilienceStats)
+
+    @property
+    def backend(self) -> RecognizerBackend:
+        """
+        A getter method that returns the value of the `backend` attribute.
+        :param self: Instance of the class.
+        :return: The recognizer the requests are sent to.
+        """
+        if not hasattr(self, "_backend"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named backend."
+            )
+        return self._backend
+
+    @property
+    def hedge(self) -> bool:
+        """
+        A getter method that returns the value of the `hedge` attribute.
+        :param self: Instance of the class.
+        :return: A boolean that represents the value of the `hedge` attribute.
+        """
+        return self._hedge
+
+    @hedge.setter
+    def hedge(self, value: bool) -> None:
+        """
+        A setter method that changes the value of the `hedge` attribute.
+        :param value: A boolean that represents the value of the `hedge` attribute.
+        :return: None.
+        """
+        setattr(self, "_hedge", value)
+
+    @property
+    def stats(self) -> ResilienceStats:
+        return self._stats
+
+    def backoff(self, retry: int) -> float:
+        """
+        A method that draws the seconds to wait before the retry number `retry`, between
+        zero and an exponentially growing bound.
+        """
+        return self._random.uniform(0, min(MAX_BACKOFF, self._backoff * 2**retry))
+
+    def hedge_delay(self) -> float:
+        """
+        A method that returns the seconds after which a slow attempt is hedged.
+        """
+        if self._latencies.count < MIN_HEDGE_SAMPLES:
+            return HEDGE_DELAY
+        return max(self._latencies.percentile(HEDGE_QUANTILE), MIN_HEDGE_DELAY)
+
+    async def warm(self) -> Optional[float]:
+        return await self._backend.warm()
+
+    async def close(self) -> None:
+        await self._backend.close()
+
+    async def _attempt(self, audio: Buffer, mimetype: str) -> Any:
+        self._stats.attempts += 1
+        start = time.perf_counter()
+        response = await asyncio.wait_for(
+            self._backend.recognize(audio, mimetype), self._attempt_timeout
+        )
+        self._latencies.record(time.perf_counter() - start)
+        return response
+
+    async def _hedged(self, audio: Buffer, mimetype: str) -> Any:
+        """
+        A helper method that sends an attempt, and a second one if the first is slow, and
+        returns the first response. It raises the last error when all of them failed.
+        """
+        if not self._hedge:
+            return await self._attempt(audio, mimetype)
+        loop = asyncio.get_running_loop()
+        tasks = [loop.create_task(self._attempt(audio, mimetype))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self.hedge_delay())
+            if not done:
+                self._stats.hedged += 1
+                tasks.append(loop.create_task(self._attempt(audio, mimetype)))
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        self._stats.hedge_wins += task is not tasks[0]
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _retried(self, audio: Buffer, mimetype: str) -> Any:
+        for retry in range(self._attempts):
+            try:
+                return await self._hedged(audio, mimetype)
+            except Exception as error:
+                if retry + 1 == self._attempts or not is_transient(error):
+                    raise
+            self._stats.retries += 1
+            await asyncio.sleep(self.backoff(retry))
+
+    async def recognize(self, audio: Buffer, mimetype: str = "audio/wav") -> Any:
+        """
+        Transcribe an audio file held in memory within the deadline.
+        """
+        self._stats.requests += 1
+        try:
+            return await asyncio.wait_for(
+                self._retried(audio, mimetype), self._deadline
+            )
+        except asyncio.TimeoutError:
+            self._stats.timeouts += 1
+            self._stats.failures += 1
+            raise deadline_exceeded(self._deadline) from None
+        except Exception:
+            self._stats.failures += 1
+            raise
@@ -0,0 +1,260 @@
+"""
+| The following script implements the long-lived HTTP session the recognizer uploads the recordings with.
+
+| Every request of the Deepgram SDK opens its own session, so every guess pays for the DNS lookup, the
+| TCP handshake and the TLS handshake before a single byte of audio is sent. The session below keeps
+| its connections alive between the guesses, caches the DNS lookups and is warmed up while the game
+| starts, so the first guess already goes through an open connection. Whether each request opened a
+| connection or reused one is traced, along with its latency.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import asyncio
+from attrs import (
+    define,
+    field,
+)
+import json
+import numpy as np
+import threading
+import time
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    import aiohttp
+
+# the seconds an idle connection is kept open, a guess usually follows the previous one sooner.
+KEEPALIVE_TIMEOUT = 120.0
+# the seconds a DNS lookup is cached.
+DNS_TTL = 600
+# the connections kept open at once, a guess is uploaded at a time.
+CONNECTION_LIMIT = 4
+
+
+@define
+class SessionStats:
+    """
+    A brief encapsulation of the connections and the latencies of the requests of a session.
+
+    Attrs:
+        requests: the number of requests sent, warm-ups included.
+        connections: the number of connections opened.
+        reused: the number of requests sent through an open connection.
+        cold: the seconds taken by the requests that opened a connection.
+        warm: the seconds taken by the requests that reused one.
+    """
+
+    requests: int = field(default=0)
+    connections: int = field(default=0)
+    reused: int = field(default=0)
+    cold: List[float] = field(factory=list)
+    warm: List[float] = field(factory=list)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused / self.requests if self.requests else 0.0
+
+    def record(self, seconds: float, reused: bool) -> None:
+        self.requests += 1
+        if reused:
+            self.reused += 1
+            self.warm.append(seconds)
+        else:
+            self.cold.append(seconds)
+
+    def format(self) -> str:
+        cold = f"{np.median(self.cold) * 1e3:.1f} ms" if self.cold else "-"
+        warm = f"{np.median(self.warm) * 1e3:.1f} ms" if self.warm else "-"
+        return (
+            f"{self.requests} requests over {self.connections} connections "
+            f"({self.reuse_ratio:.0%} reused), cold {cold}, warm {warm}"
+        )
+
+
+@define
+class KeepAliveSession:
+    """
+    A brief encapsulation of an HTTP session keeping its connections alive.
+
+    Attrs:
+        base_url: the url the paths of the requests are relative to.
+        headers: the headers sent with every request.
+        keepalive_timeout: the seconds an idle connection is kept open.
+        session: the aiohttp session, opened on the first request of an event loop.
+        loop: the event loop the session belongs to.
+        stats: the connections and the latencies of the requests.
+    """
+
+    _base_url: str
+    _headers: Dict[str, str] = field(factory=dict)
+    _keepalive_timeout: float = field(default=KEEPALIVE_TIMEOUT)
+    _session: Optional["aiohttp.ClientSession"] = field(
+        init=False, default=None, repr=False
+    )
+    _loop: Optional[asyncio.AbstractEventLoop] = field(
+        init=False, default=None, repr=False
+    )
+    _stats: SessionStats = field(init=False, factory=SessionStats)
+
+    @property
+    def base_url(self) -> str:
+        """
+        A getter method that returns the value of the `base_url` attribute.
+        :param self: Instance of the class.
+        :return: A string that represents the value of the `base_url` attribute.
+        """
+        if not hasattr(self, "_base_url"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named base_url."
+            )
+        return self._base_url
+
+    @property
+    def stats(self) -> SessionStats:
+        """
+        A getter method that returns the value of the `stats` attribute.
+        :param self: Instance of the class.
+        :return: A SessionStats object that represents the value of the `stats` attribute.
+        """
+        return self._stats
+
+    def _trace_config(self) -> "aiohttp.TraceConfig":
+        """
+        A helper method that flags the requests opening a connection and those reusing one.
+        """
+        import aiohttp
+
+        async def on_create(session: Any, context: Any, params: Any) -> None:
+            self._stats.connections += 1
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx["reused"] = False
+
+        async def on_reuse(session: Any, context: Any, params: Any) -> None:
+            if context.trace_request_ctx is not None:
+                context.trace_request_ctx["reused"] = True
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(on_create)
+        trace_config.on_connection_reuseconn.append(on_reuse)
+        return trace_config
+
+    def _release(self) -> None:
+        """
+        A helper method that closes the session of a previous event loop before it is replaced.
+        """
+        session, loop = self._session, self._loop
+        self._session = None
+        if session is None or session.closed or loop is None:
+            return
+        if loop.is_running():
+            # the loop runs in another thread, the session is closed there.
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        elif not loop.is_closed():
+            # the loop is stopped, it runs the closing on a thread of its own, briefly.
+            closing = threading.Thread(
+                target=loop.run_until_complete, args=(session.close(),)
+            )
+            closing.start()
+            closing.join()
+        else:
+            # a closed loop can no longer close its connections, the session lets go of them.
+            session.detach()
+
+    def session(self) -> "aiohttp.ClientSession":
+        """
+        A method that returns the session of the running event loop, opening it if needed.
+        The session of a previous event loop is closed first.
+        """
+        # aiohttp is imported on the first request rather than on startup.
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._release()
+            connector = aiohttp.TCPConnector(
+                limit=CONNECTION_LIMIT,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=DNS_TTL,
+            )
+            self._session = aiohttp.ClientSession(
+                headers=self._headers,
+                connector=connector,
+                trace_configs=[self._trace_config()],
+            )
+            self._loop = loop
+        return self._session
+
+    async def request(
+        self,
+        method: str,
+        path: str = "",
+        params: Optional[Mapping[str, str]] = None,
+        data: Any = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Any:
+        """
+        A method that sends a request and returns its decoded JSON body, None when empty.
+        A request sent through a connection the server closed meanwhile is sent again.
+        """
+        import aiohttp
+
+        for attempt in range(2):
+            context: Dict[str, Optional[bool]] = {"reused": None}
+            start = time.perf_counter()
+            try:
+                async with self.session().request(
+                    method,
+                    self._base_url + path,
+                    params=params,
+                    data=data,
+                    headers=headers,
+                    raise_for_status=True,
+                    trace_request_ctx=context,
+                ) as response:
+                    content = (await response.read()).strip()
+            except aiohttp.ServerDisconnectedError:
+                if attempt or not context["reused"]:
+                    raise
+                continue
+            self._stats.record(time.perf_counter() - start, bool(context["reused"]))
+            return json.loads(content) if content else None
+
+    async def warm(self, path: str = "") -> Optional[float]:
+        """
+        A method that opens a connection ahead of the first request, with a GET whose status
+        does not matter: the body of an error keeps the connection reusable, unlike a HEAD
+        answered without a length. It returns the seconds it took, None when offline.
+        """
+        import aiohttp
+
+        context: Dict[str, Optional[bool]] = {"reused": None}
+        start = time.perf_counter()
+        try:
+            async with self.session().get(
+                self._base_url + path, trace_request_ctx=context
+            ) as response:
+                await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            return None
+        seconds = time.perf_counter() - start
+        self._stats.record(seconds, bool(context["reused"]))
+        return seconds
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
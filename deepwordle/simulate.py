@@ -0,0 +1,372 @@
+"""
+| The following script implements the headless game simulator: `deepwordle simulate`.
+
+| It plays every word of `wordle-answers.txt`, or a sample of it, against a pluggable guessing strategy
+| without starting textual. The games are spread across a process pool, and the simulator reports the
+| throughput, the guess-count distribution, the failure rate and the time spent in each stage of a
+| turn: choosing a guess, validating it against the word store, scoring it and applying the feedback.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import argparse
+from attrs import (
+    Factory,
+    define,
+    field,
+)
+from collections import (
+    Counter,
+)
+from concurrent.futures import (
+    ProcessPoolExecutor,
+)
+import os
+import random
+import time
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from deepwordle.core import (
+    WordStore,
+)
+from deepwordle.core.constants import (
+    MAX_ATTEMPTS,
+)
+from deepwordle.core.constraints import (
+    ConstraintEngine,
+)
+from deepwordle.core.game_state import (
+    GameState,
+)
+from deepwordle.core.patterns import (
+    PatternMatrix,
+)
+from deepwordle.core.solver import (
+    Solver,
+)
+
+STAGES = ("choose", "validate", "score", "update")
+# the number of chunks handed to each worker, more chunks balance the load better.
+CHUNKS_PER_PROCESS = 4
+
+
+@define
+class EntropyStrategy:
+    """
+    A strategy that plays the guess with the highest expected information gain.
+    """
+
+    _solver: Solver = field()
+
+    @classmethod
+    def create(
+        cls, word_store: WordStore, seed: int, cache_dir: Optional[str] = None
+    ) -> "EntropyStrategy":
+        return cls(Solver(word_store, cache_dir=cache_dir))
+
+    @staticmethod
+    def prepare(word_store: WordStore, cache_dir: Optional[str] = None) -> None:
+        """
+        Build the pattern matrix once, before the workers start, instead of in every worker.
+        """
+        PatternMatrix.open(word_store, cache_dir)
+
+    def reset(self) -> None:
+        self._solver.reset()
+
+    def next_guess(self) -> str:
+        return self._solver.rank_guesses(top_k=1)[0][0]
+
+    def update(self, guess: str, pattern: int) -> None:
+        self._solver.update(guess, pattern)
+
+
+@define
+class CandidateStrategy:
+    """
+    A strategy that plays one of the answers still consistent with the feedback, the first
+    one alphabetically or, when a random generator is given, a random one.
+    """
+
+    _constraints: ConstraintEngine = field()
+    _random: Optional[random.Random] = field(default=None)
+
+    @classmethod
+    def create(
+        cls, word_store: WordStore, seed: int, cache_dir: Optional[str] = None
+    ) -> "CandidateStrategy":
+        return cls(ConstraintEngine(word_store))
+
+    @staticmethod
+    def prepare(word_store: WordStore, cache_dir: Optional[str] = None) -> None:
+        return None
+
+    def reset(self) -> None:
+        self._constraints.reset()
+
+    def next_guess(self) -> str:
+        survivors = self._constraints.survivors()
+        index = survivors[0] if self._random is None else self._random.choice(survivors)
+        return self._constraints.word_store.answer(int(index))
+
+    def update(self, guess: str, pattern: int) -> None:
+        self._constraints.update(guess, pattern)
+
+
+@define
+class RandomCandidateStrategy(CandidateStrategy):
+    @classmethod
+    def create(
+        cls, word_store: WordStore, seed: int, cache_dir: Optional[str] = None
+    ) -> "CandidateStrategy":
+        return cls(ConstraintEngine(word_store), random.Random(seed))
+
+
+Strategy = Union[EntropyStrategy, CandidateStrategy]
+
+STRATEGIES: Dict[str, Type[Strategy]] = {
+    "entropy": EntropyStrategy,
+    "first": CandidateStrategy,
+    "random": RandomCandidateStrategy,
+}
+
+
+@define
+class SimulationReport:
+    """
+    A brief encapsulation of the results of a simulation.
+
+    Attrs:
+        strategy: the name of the guessing strategy.
+        processes: the number of worker processes.
+        seconds: the wall-clock duration of the simulation.
+        distribution: the number of games won in 1, 2, ... guesses, 0 counts the failures.
+        timings: the total time in nanoseconds and the number of calls of each stage.
+    """
+
+    _strategy: str = field()
+    _processes: int = field()
+    _seconds: float = field(default=0.0)
+    _distribution: Counter = field(default=Factory(Counter))
+    _timings: Dict[str, List[int]] = field(
+        default=Factory(lambda: {stage: [0, 0] for stage in STAGES})
+    )
+
+    @property
+    def games(self) -> int:
+        return sum(self._distribution.values())
+
+    @property
+    def failures(self) -> int:
+        return self._distribution[0]
+
+    @property
+    def seconds(self) -> float:
+        """
+        A getter method that returns the value of the `seconds` attribute.
+        :param self: Instance of the class.
+        :return: A float that represents the wall-clock duration of the simulation.
+        """
+        return self._seconds
+
+    @seconds.setter
+    def seconds(self, value: float) -> None:
+        """
+        A setter method that changes the value of the `seconds` attribute.
+        :param value: A float that represents the wall-clock duration of the simulation.
+        :return: None.
+        """
+        setattr(self, "_seconds", value)
+
+    @property
+    def distribution(self) -> Counter:
+        """
+        A getter method that returns the value of the `distribution` attribute.
+        :param self: Instance of the class.
+        :return: A counter of the number of guesses per game, 0 being a lost game.
+        """
+        return self._distribution
+
+    @property
+    def timings(self) -> Dict[str, List[int]]:
+        """
+        A getter method that returns the value of the `timings` attribute.
+        :param self: Instance of the class.
+        :return: A dictionary of [total nanoseconds, calls] per stage.
+        """
+        return self._timings
+
+    def merge(self, distribution: Counter, timings: Dict[str, List[int]]) -> None:
+        """
+        A method that adds the results of a chunk of games to the report.
+        """
+        self._distribution.update(distribution)
+        for stage, (nanoseconds, calls) in timings.items():
+            self._timings[stage][0] += nanoseconds
+            self._timings[stage][1] += calls
+
+    def format(self) -> str:
+        games, failures = self.games, self.failures
+        won = games - failures
+        lines = [
+            f"strategy: {self._strategy}, processes: {self._processes}",
+            f"games: {games} in {self._seconds:.2f}s, "
+            f"{games / max(self._seconds, 1e-9):.1f} games/s",
+            f"failure rate: {failures / max(games, 1):.2%} ({failures} games)",
+            f"average guesses (won games): "
+            f"{sum(k * v for k, v in self._distribution.items()) / max(won, 1):.3f}",
+            "guess distribution:",
+        ]
+        for guesses in range(1, MAX_ATTEMPTS + 1):
+            count = self._distribution[guesses]
+            bar = "#" * round(50 * count / max(games, 1))
+            lines.append(f"  {guesses}: {count:>6} {bar}")
+        lines.append(f"  x: {failures:>6}")
+        lines.append("stage timings (summed over all the workers):")
+        total = sum(nanoseconds for nanoseconds, _ in self._timings.values()) or 1
+        for stage, (nanoseconds, calls) in self._timings.items():
+            lines.append(
+                f"  {stage:<9} {nanoseconds / 1e9:>9.3f}s {nanoseconds / total:>7.1%}"
+                f" {nanoseconds / max(calls, 1) / 1e3:>10.2f} us/call"
+            )
+        return "\n".join(lines)
+
+
+def play_game(
+    word_store: WordStore,
+    strategy: Strategy,
+    secret: str,
+    timings: Dict[str, List[int]],
+) -> int:
+    """
+    A function that plays one game on a widget-free game state and returns the number of
+    guesses, 0 if it was lost.
+    """
+    clock = time.perf_counter_ns
+    game_state = GameState(secret)
+    strategy.reset()
+    while not game_state.over:
+        start = clock()
+        guess = strategy.next_guess()
+        chosen = clock()
+        if guess not in word_store:
+            raise ValueError(f"The strategy played an invalid word: {guess!r}.")
+        validated = clock()
+        for character in guess:
+            game_state.insert(character)
+        pattern = game_state.submit()
+        scored = clock()
+        strategy.update(guess, pattern)
+        updated = clock()
+        for stage, (begin, end) in zip(
+            STAGES,
+            (
+                (start, chosen),
+                (chosen, validated),
+                (validated, scored),
+                (scored, updated),
+            ),
+        ):
+            timings[stage][0] += end - begin
+            timings[stage][1] += 1
+    return game_state.row if game_state.won else 0
+
+
+_word_store: Optional[WordStore] = None
+_strategy: Optional[Strategy] = None
+
+
+def _init_worker(strategy_name: str, seed: int, cache_dir: Optional[str]) -> None:
+    global _word_store, _strategy
+    _word_store = WordStore.open(cache_dir=cache_dir)
+    _strategy = STRATEGIES[strategy_name].create(_word_store, seed, cache_dir)
+
+
+def _play_chunk(secrets: Sequence[int]) -> Tuple[Counter, Dict[str, List[int]]]:
+    """
+    A helper function that plays the games of a chunk of answers in a worker.
+    """
+    assert _word_store is not None and _strategy is not None
+    distribution: Counter = Counter()
+    timings = {stage: [0, 0] for stage in STAGES}
+    for secret in secrets:
+        answer = _word_store.answer(secret)
+        distribution[play_game(_word_store, _strategy, answer, timings)] += 1
+    return distribution, timings
+
+
+def simulate(
+    strategy: str = "entropy",
+    sample: Optional[int] = None,
+    processes: Optional[int] = None,
+    seed: int = 0,
+    cache_dir: Optional[str] = None,
+) -> SimulationReport:
+    """
+    A function that plays all the answers, or a random sample of `sample` answers, with
+    the given strategy across `processes` worker processes, one per core by default.
+    """
+    word_store = WordStore.open(cache_dir=cache_dir)
+    secrets = list(range(word_store.answers_count))
+    if sample is not None and sample < len(secrets):
+        secrets = random.Random(seed).sample(secrets, sample)
+    processes = processes or os.cpu_count() or 1
+    STRATEGIES[strategy].prepare(word_store, cache_dir)
+    report = SimulationReport(strategy, processes)
+    chunk_size = max(1, -(-len(secrets) // (processes * CHUNKS_PER_PROCESS)))
+    chunks = [
+        secrets[start : start + chunk_size]
+        for start in range(0, len(secrets), chunk_size)
+    ]
+    start = time.perf_counter()
+    if processes == 1:
+        _init_worker(strategy, seed, cache_dir)
+        results = map(_play_chunk, chunks)
+        for distribution, timings in results:
+            report.merge(distribution, timings)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=processes,
+            initializer=_init_worker,
+            initargs=(strategy, seed, cache_dir),
+        ) as executor:
+            for distribution, timings in executor.map(_play_chunk, chunks):
+                report.merge(distribution, timings)
+    report.seconds = time.perf_counter() - start
+    return report
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="deepwordle simulate",
+        description="Play the answers list headlessly and report the throughput.",
+    )
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--sample", type=int, help="play a random sample of answers")
+    parser.add_argument("--processes", type=int, help="defaults to one per core")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--cache-dir", help="where the word index and matrix live")
+    args = parser.parse_args(argv)
+    report = simulate(
+        args.strategy, args.sample, args.processes, args.seed, args.cache_dir
+    )
+    print(report.format())
+    return 0
+
+
+if __name__ == "__main__":
+    main()
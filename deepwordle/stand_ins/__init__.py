@@ -0,0 +1,22 @@
+"""
+| Top-level package for stand_ins.
+
+| ``stand_ins`` holds local servers speaking the protocols of the remote services the game talks to,
+| so the clients can be tested and benchmarked offline, with a controlled latency.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from deepwordle.stand_ins.deepgram import (
+    LiveStandIn,
+    PrerecordedStandIn,
+)
+from deepwordle.stand_ins.twitter import (
+    TwitterStandIn,
+)
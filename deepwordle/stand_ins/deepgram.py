@@ -0,0 +1,352 @@
+"""
+| The following script implements local stand-ins for Deepgram's live and prerecorded endpoints.
+
+| The stand-in does not recognize anything: it is given the word it should hear and how many seconds
+| of audio it takes to say it. It counts the seconds of audio received, sends interim results holding
+| the beginning of the word while the audio arrives, then the final result once enough audio was
+| received, or as soon as the stream is closed. Every result is delayed by `latency` seconds, to stand
+| for the network and the recognition.
+
+| The prerecorded stand-in answers every upload with the word it is given, after `latency` seconds,
+| and counts the connections its clients opened, to check they are kept alive between the uploads.
+| It can also be given the latencies and the error statuses of the next uploads, to check how the
+| clients cope with a slow or failing endpoint.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from aiohttp import (
+    web,
+)
+import asyncio
+from attrs import (
+    define,
+    field,
+)
+import json
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+)
+from urllib.parse import (
+    parse_qs,
+    urlsplit,
+)
+from websockets.exceptions import (
+    ConnectionClosed,
+)
+
+try:
+    # websockets >= 13 ships the new asyncio implementation.
+    from websockets.asyncio.server import (
+        serve,
+    )
+except ImportError:
+    from websockets import (
+        serve,
+    )
+
+SAMPLE_WIDTH = 2
+
+
+def results(
+    transcript: str, start: float, duration: float, is_final: bool
+) -> Dict[str, Any]:
+    """
+    A function that builds a message of the live endpoint holding a transcript.
+    """
+    words = [
+        {
+            "word": word,
+            "start": start,
+            "end": start + duration,
+            "confidence": 0.99,
+        }
+        for word in transcript.split()
+    ]
+    return {
+        "type": "Results",
+        "channel_index": [0, 1],
+        "duration": duration,
+        "start": start,
+        "is_final": is_final,
+        "speech_final": is_final,
+        "channel": {
+            "alternatives": [
+                {"transcript": transcript, "confidence": 0.99, "words": words}
+            ]
+        },
+    }
+
+
+@define
+class LiveStandIn:
+    """
+    A brief encapsulation of a local websocket server behaving like the live endpoint.
+
+    Attrs:
+        transcript: the words the stand-in hears.
+        speech_seconds: the seconds of audio it takes to say the words.
+        interim_seconds: the seconds of audio between two interim results.
+        latency: the seconds every result is delayed by.
+        stalled: whether the stand-in never answers, like a stalled endpoint.
+        host: the interface the server listens on.
+        port: the port the server listens on, any free port by default.
+        server: the websocket server, while running.
+        pending: the results waiting for their latency to elapse.
+        streams: the number of streams opened so far.
+        received: the number of bytes of audio received so far.
+    """
+
+    _transcript: str = field(default="react")
+    _speech_seconds: float = field(default=0.6)
+    _interim_seconds: float = field(default=0.2)
+    _latency: float = field(default=0.05)
+    _stalled: bool = field(default=False)
+    _host: str = field(default="127.0.0.1")
+    _port: int = field(default=0)
+    _server: Any = field(init=False, default=None, repr=False)
+    _pending: Set[asyncio.Task] = field(init=False, factory=set, repr=False)
+    _streams: int = field(init=False, default=0)
+    _received: int = field(init=False, default=0)
+
+    @property
+    def url(self) -> str:
+        """
+        A getter method that returns the websocket url of the running server.
+        """
+        if self._server is None:
+            raise RuntimeError("The stand-in server is not running.")
+        port = list(self._server.sockets)[0].getsockname()[1]
+        return f"ws://{self._host}:{port}/v1/listen"
+
+    @property
+    def streams(self) -> int:
+        return self._streams
+
+    @property
+    def received(self) -> int:
+        return self._received
+
+    async def start(self) -> str:
+        """
+        A method that starts listening and returns the url of the server.
+        """
+        self._server = await serve(self._handle, self._host, self._port)
+        return self.url
+
+    async def stop(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+
+    async def __aenter__(self) -> "LiveStandIn":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    def _send_later(self, websocket: Any, message: Dict[str, Any]) -> None:
+        """
+        A helper method that sends a message once the latency elapsed, without holding up
+        the audio still arriving.
+        """
+
+        async def send() -> None:
+            await asyncio.sleep(self._latency)
+            try:
+                await websocket.send(json.dumps(message))
+            except ConnectionClosed:
+                # the client stopped listening, e.g. after the word it waited for.
+                pass
+
+        task = asyncio.get_running_loop().create_task(send())
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _handle(self, websocket: Any, path: Optional[str] = None) -> None:
+        """
+        A helper method that serves a stream, the path is only given by websockets < 13.
+        """
+        request = getattr(websocket, "request", None)
+        path = path or (request.path if request is not None else websocket.path)
+        query = parse_qs(urlsplit(path).query)
+        bytes_per_second = (
+            int(query.get("sample_rate", ["16000"])[0])
+            * int(query.get("channels", ["1"])[0])
+            * SAMPLE_WIDTH
+        )
+        interim = query.get("interim_results", ["false"])[0] == "true"
+        self._streams += 1
+        if self._stalled:
+            # the audio is taken in, and nothing is ever sent back, until the client leaves.
+            async for message in websocket:
+                if isinstance(message, bytes):
+                    self._received += len(message)
+            return
+        received, seconds = 0, 0.0
+        interims: List[float] = []
+        is_final = False
+        async for message in websocket:
+            if isinstance(message, str):
+                if json.loads(message).get("type") == "CloseStream":
+                    break
+                continue
+            if not message:
+                # the legacy way of closing the stream.
+                break
+            received += len(message)
+            self._received += len(message)
+            seconds = received / bytes_per_second
+            if is_final:
+                continue
+            if seconds >= self._speech_seconds:
+                is_final = True
+                self._send_later(
+                    websocket,
+                    results(self._transcript, 0.0, self._speech_seconds, True),
+                )
+            elif interim and seconds >= self._interim_seconds * (len(interims) + 1):
+                interims.append(seconds)
+                size = int(len(self._transcript) * seconds / self._speech_seconds)
+                self._send_later(
+                    websocket,
+                    results(self._transcript[: max(size, 1)], 0.0, seconds, False),
+                )
+        if not is_final:
+            transcript = self._transcript if seconds else ""
+            self._send_later(websocket, results(transcript, 0.0, seconds, True))
+        # flush the results before closing, like the endpoint does.
+        await asyncio.gather(*self._pending, return_exceptions=True)
+        try:
+            await websocket.send(json.dumps({"type": "Metadata", "duration": seconds}))
+        except ConnectionClosed:
+            return
+        await websocket.close()
+
+
+def prerecorded(transcript: str, duration: float) -> Dict[str, Any]:
+    """
+    A function that builds a response of the prerecorded endpoint holding a transcript.
+    """
+    alternative = results(transcript, 0.0, duration, True)["channel"]["alternatives"][0]
+    return {
+        "metadata": {"duration": duration, "channels": 1},
+        "results": {"channels": [{"alternatives": [alternative]}]},
+    }
+
+
+@define
+class PrerecordedStandIn:
+    """
+    A brief encapsulation of a local HTTP server behaving like the prerecorded endpoint.
+
+    Attrs:
+        transcript: the words the stand-in hears in every upload.
+        latency: the seconds every response is delayed by.
+        host: the interface the server listens on.
+        port: the port the server listens on, any free port by default.
+        delays: the latencies of the next uploads, in order, `latency` once exhausted.
+        statuses: the error statuses the next uploads are answered with, in order.
+        runner: the aiohttp runner of the server, while running.
+        uploads: the bodies of the uploads received so far.
+        transports: the connections opened by the clients so far.
+    """
+
+    _transcript: str = field(default="react")
+    _latency: float = field(default=0.05)
+    _host: str = field(default="127.0.0.1")
+    _port: int = field(default=0)
+    _delays: List[float] = field(factory=list, converter=list)
+    _statuses: List[int] = field(factory=list, converter=list)
+    _runner: Optional[web.AppRunner] = field(init=False, default=None, repr=False)
+    _uploads: List[bytes] = field(init=False, factory=list, repr=False)
+    _transports: List[Any] = field(init=False, factory=list, repr=False)
+
+    @property
+    def url(self) -> str:
+        """
+        A getter method that returns the base url of the running server.
+        """
+        if self._runner is None:
+            raise RuntimeError("The stand-in server is not running.")
+        port = self._runner.addresses[0][1]
+        return f"http://{self._host}:{port}/v1"
+
+    @property
+    def uploads(self) -> List[bytes]:
+        return self._uploads
+
+    @property
+    def connections(self) -> int:
+        return len(self._transports)
+
+    async def start(self) -> str:
+        """
+        A method that starts listening and returns the base url of the server.
+        """
+        app = web.Application()
+        app.router.add_post("/v1/listen", self._listen)
+        app.router.add_get("/v1/listen", self._get)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "PrerecordedStandIn":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    def _count(self, request: web.Request) -> None:
+        if all(transport is not request.transport for transport in self._transports):
+            self._transports.append(request.transport)
+
+    async def _get(self, request: web.Request) -> web.Response:
+        self._count(request)
+        return web.Response(status=405, text="Method Not Allowed")
+
+    async def _listen(self, request: web.Request) -> web.Response:
+        self._count(request)
+        body = await request.read()
+        self._uploads.append(body)
+        await asyncio.sleep(self._delays.pop(0) if self._delays else self._latency)
+        if self._statuses:
+            status = self._statuses.pop(0)
+            return web.json_response({"err_code": "STAND_IN_ERROR"}, status=status)
+        return web.json_response(prerecorded(self._transcript, 0.5))
+
+
+def main() -> int:
+    async def serve_forever() -> None:
+        async with LiveStandIn() as stand_in, PrerecordedStandIn() as prerecorded:
+            print(f"Listening on {stand_in.url} and {prerecorded.url}")
+            await asyncio.Future()
+
+    try:
+        asyncio.run(serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    main()
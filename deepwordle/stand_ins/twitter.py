@@ -0,0 +1,166 @@
+"""
+| The following script implements a local stand-in for the endpoints of the Twitter API tweets are
+| posted to and credentials are verified with.
+
+| The stand-in keeps the tweets it is sent and enforces a rate limit: `limit` posts per `window`
+| seconds, answered with the `x-rate-limit-*` headers of the API and a 429 once the limit is reached.
+| It can also be given the error statuses of the next requests, and a latency, to check how the
+| clients cope with a failing or a slow API.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from aiohttp import (
+    web,
+)
+import asyncio
+from attrs import (
+    define,
+    field,
+)
+import time
+from typing import (
+    Any,
+    Dict,
+    List,
+    Optional,
+)
+
+
+@define
+class TwitterStandIn:
+    """
+    A brief encapsulation of a local HTTP server behaving like the Twitter API.
+
+    Attrs:
+        limit: the number of posts allowed per window.
+        window: the seconds of a rate limit window.
+        statuses: the error statuses the next requests are answered with, in order.
+        latency: the seconds every request is answered after.
+        host: the interface the server listens on.
+        port: the port the server listens on, any free port by default.
+        runner: the aiohttp runner of the server, while running.
+        tweets: the texts posted so far.
+        requests: the number of posts received so far, rejected ones included.
+        verifications: the number of verifications of the credentials received so far.
+        remaining: the posts left in the current window.
+        reset: the time, since the epoch, the current window ends at.
+    """
+
+    _limit: int = field(default=300)
+    _window: float = field(default=15 * 60.0)
+    _statuses: List[int] = field(factory=list, converter=list)
+    _latency: float = field(default=0.0)
+    _host: str = field(default="127.0.0.1")
+    _port: int = field(default=0)
+    _runner: Optional[web.AppRunner] = field(init=False, default=None, repr=False)
+    _tweets: List[str] = field(init=False, factory=list)
+    _requests: int = field(init=False, default=0)
+    _verifications: int = field(init=False, default=0)
+    _remaining: int = field(init=False, default=0)
+    _reset: float = field(init=False, default=0.0)
+
+    @property
+    def url(self) -> str:
+        """
+        A getter method that returns the base url of the running server.
+        """
+        if self._runner is None:
+            raise RuntimeError("The stand-in server is not running.")
+        port = self._runner.addresses[0][1]
+        return f"http://{self._host}:{port}"
+
+    @property
+    def tweets(self) -> List[str]:
+        return self._tweets
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+    @property
+    def verifications(self) -> int:
+        return self._verifications
+
+    async def start(self) -> str:
+        """
+        A method that starts listening and returns the base url of the server.
+        """
+        app = web.Application()
+        app.router.add_post("/1.1/statuses/update.json", self._update)
+        app.router.add_get("/1.1/account/verify_credentials.json", self._verify)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+        return self.url
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "TwitterStandIn":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.stop()
+
+    def _headers(self) -> Dict[str, str]:
+        return {
+            "x-rate-limit-limit": str(self._limit),
+            "x-rate-limit-remaining": str(self._remaining),
+            "x-rate-limit-reset": f"{self._reset:.3f}",
+        }
+
+    async def _verify(self, request: web.Request) -> web.Response:
+        self._verifications += 1
+        await asyncio.sleep(self._latency)
+        if self._statuses:
+            errors = {
+                "errors": [{"code": 32, "message": "Could not authenticate you."}]
+            }
+            return web.json_response(errors, status=self._statuses.pop(0))
+        return web.json_response({"id": 1, "screen_name": "deepwordle"})
+
+    async def _update(self, request: web.Request) -> web.Response:
+        self._requests += 1
+        form = await request.post()
+        await asyncio.sleep(self._latency)
+        now = time.time()
+        if now >= self._reset:
+            self._remaining, self._reset = self._limit, now + self._window
+        if self._statuses:
+            status = self._statuses.pop(0)
+            errors = {"errors": [{"code": 131, "message": "Internal error."}]}
+            return web.json_response(errors, status=status, headers=self._headers())
+        if not self._remaining:
+            errors = {"errors": [{"code": 88, "message": "Rate limit exceeded."}]}
+            return web.json_response(errors, status=429, headers=self._headers())
+        self._remaining -= 1
+        self._tweets.append(str(form["status"]))
+        tweet = {"id": len(self._tweets), "text": form["status"]}
+        return web.json_response(tweet, headers=self._headers())
+
+
+def main() -> int:
+    async def serve_forever() -> None:
+        async with TwitterStandIn() as stand_in:
+            print(f"Listening on {stand_in.url}")
+            await asyncio.Future()
+
+    try:
+        asyncio.run(serve_forever())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    main()
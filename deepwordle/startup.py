@@ -0,0 +1,129 @@
+"""
+| The following script implements the startup profile of the game, `deepwordle --startup-profile`.
+
+| The packages only needed by a feature, tweepy and requests for the tweets, aiohttp and websockets
+| for the recognizers, pyaudio for the microphone and pyfiglet for the big letters, are imported on
+| the first use of the feature rather than on startup, and no audio device is probed before the
+| first recording. The profile checks it holds: `deepwordle.app` is imported in a fresh interpreter
+| with `-X importtime`, the time of every module imported on its behalf is summed by package, and
+| the deferred packages imported anyway are listed. The game is then run up to its first frame.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from attrs import (
+    define,
+    field,
+)
+import json
+import subprocess
+import sys
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+# the packages imported on the first use of their feature.
+DEFERRED = ("tweepy", "requests", "aiohttp", "websockets", "pyaudio", "pyfiglet")
+MODULE = "deepwordle.app"
+# the number of packages shown by the profile, the slowest ones.
+TOP = 12
+
+
+def parse_importtime(
+    output: str, module: str = MODULE
+) -> Tuple[Dict[str, float], float]:
+    """
+    A function that reads the output of `-X importtime` and returns the seconds spent in
+    every package imported on behalf of `module`, the modules of deepwordle by subpackage,
+    along with the seconds `module` took to import.
+    """
+    block: List[Tuple[str, float]] = []
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        own, cumulative, name = line.split(":", 1)[1].split("|")
+        block.append((name.strip(), int(own) / 1e6))
+        # the modules of an import are listed before it, the top-level imports end a block.
+        if len(name) - len(name.lstrip()) > 1:
+            continue
+        if name.strip() == module:
+            packages: Dict[str, float] = {}
+            for imported, seconds in block:
+                parts = imported.split(".")
+                package = ".".join(parts[:2] if parts[0] == "deepwordle" else parts[:1])
+                packages[package] = packages.get(package, 0.0) + seconds
+            return packages, int(cumulative) / 1e6
+        block = []
+    raise ValueError(f"{module} was not imported.")
+
+
+@define
+class StartupProfile:
+    """
+    A brief encapsulation of the time the game takes to start.
+
+    Attrs:
+        packages: the seconds spent importing every package, by name.
+        imports: the seconds `deepwordle.app` takes to import in a fresh interpreter.
+        loaded: the deferred packages imported on startup anyway.
+        first_frame: the seconds from the start of the app to its first frame.
+    """
+
+    packages: Dict[str, float] = field(factory=dict)
+    imports: float = field(default=0.0)
+    loaded: List[str] = field(factory=list)
+    first_frame: Optional[float] = field(default=None)
+
+    def format(self) -> str:
+        lines = [f"{'package':<24}{'import':>10}"]
+        ranked = sorted(self.packages.items(), key=lambda item: -item[1])
+        for package, seconds in ranked[:TOP]:
+            lines.append(f"{package:<24}{seconds * 1e3:>8.1f}ms")
+        others = sum(seconds for _, seconds in ranked[TOP:])
+        lines.append(f"{f'{len(ranked[TOP:])} others':<24}{others * 1e3:>8.1f}ms")
+        lines.append(f"{'imports':<24}{self.imports * 1e3:>8.1f}ms")
+        if self.first_frame is not None:
+            lines.append(f"{'app to first frame':<24}{self.first_frame * 1e3:>8.1f}ms")
+            total = self.imports + self.first_frame
+            lines.append(f"{'time to first frame':<24}{total * 1e3:>8.1f}ms")
+        loaded = ", ".join(self.loaded) if self.loaded else "none"
+        lines.append(f"deferred packages imported on startup: {loaded}")
+        return "\n".join(lines)
+
+
+def profile_imports(module: str = MODULE) -> StartupProfile:
+    """
+    A function that imports `module` in a fresh interpreter and returns the time spent in
+    every package, and the deferred packages it imported.
+    """
+    code = (
+        f"import json, sys, {module}; "
+        f"print(json.dumps([name for name in {DEFERRED!r} if name in sys.modules]))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    packages, imports = parse_importtime(completed.stderr, module)
+    loaded = json.loads(completed.stdout.splitlines()[-1])
+    return StartupProfile(packages, imports, loaded)
+
+
+def main() -> int:
+    print(profile_imports().format())
+    return 0
+
+
+if __name__ == "__main__":
+    main()
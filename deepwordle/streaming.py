@@ -0,0 +1,295 @@
+"""
+| The following script implements the streaming recognizer on top of Deepgram's live endpoint.
+
+| Recording a fixed number of seconds before uploading them means the answer can only come back once
+| the whole recording is over, even when the word was said in the first half second. The streaming
+| recognizer sends every chunk of samples over a websocket as soon as it is captured, surfaces the
+| interim and the final results while the player is still speaking and stops as soon as a final
+| result holds a five letters word, so the latency is the time to say the word, not the recording.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+import asyncio
+from attrs import (
+    define,
+    field,
+)
+import json
+import numpy as np
+import os
+import time
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import (
+    urlencode,
+)
+
+from deepwordle.core.constants import (
+    WORD_LENGTH,
+)
+from deepwordle.core.matcher import (
+    normalize,
+)
+from deepwordle.resilience import (
+    DEADLINE,
+    deadline_exceeded,
+)
+
+LIVE_URL = "wss://api.deepgram.com/v1/listen"
+# the message asking the server to flush the last results and close the stream.
+CLOSE_STREAM = json.dumps({"type": "CloseStream"})
+
+Chunk = Union[bytes, np.ndarray]
+
+
+def websocket_client() -> Tuple[Callable[..., Any], str]:
+    """
+    A function that imports websockets on the first stream rather than on startup, and
+    returns its `connect` along with the name of its headers argument.
+    """
+    try:
+        # websockets >= 13 ships the new asyncio implementation.
+        from websockets.asyncio.client import (
+            connect,
+        )
+
+        return connect, "additional_headers"
+    except ImportError:
+        from websockets import (
+            connect,
+        )
+
+        return connect, "extra_headers"
+
+
+@define
+class StreamResult:
+    """
+    A brief encapsulation of a result of the live endpoint.
+
+    Attrs:
+        transcript: the transcript of the audio since the last final result.
+        words: the words of the transcript, with their start and end times.
+        is_final: whether the transcript of this audio will not change anymore.
+        elapsed: the seconds between the start of the stream and this result.
+    """
+
+    transcript: str
+    words: List[Dict[str, Any]]
+    is_final: bool
+    elapsed: float
+
+    @classmethod
+    def parse(
+        cls, message: Union[str, bytes], elapsed: float
+    ) -> Optional["StreamResult"]:
+        """
+        A method that builds a result out of a message of the live endpoint, None if the
+        message holds no transcript, e.g. the metadata sent when the stream closes.
+        """
+        response = json.loads(message)
+        if response.get("type", "Results") != "Results" or "channel" not in response:
+            return None
+        alternative = response["channel"]["alternatives"][0]
+        return cls(
+            transcript=alternative.get("transcript", ""),
+            words=alternative.get("words", []),
+            is_final=bool(response.get("is_final")),
+            elapsed=elapsed,
+        )
+
+
+def is_final_word(result: StreamResult) -> bool:
+    """
+    A function that tells whether a result is final and holds a five letters word.
+    """
+    return result.is_final and any(
+        len(normalize(item["word"])) == WORD_LENGTH for item in result.words
+    )
+
+
+@define
+class StreamingRecognizer:
+    """
+    A brief encapsulation of a live transcription stream.
+
+    Attrs:
+        api_key: the Deepgram api key.
+        url: the websocket endpoint, a local stand-in server for the tests and benchmarks.
+        rate: the sample rate of the streamed audio.
+        channels: the number of channels of the streamed audio.
+        interim_results: whether the endpoint sends results before they are final.
+        deadline: the seconds a stream may take, a stalled endpoint fails it afterwards.
+    """
+
+    _api_key: Optional[str] = field(default=os.environ.get("DEEPGRAM_API_KEY"))
+    _url: str = field(default=LIVE_URL)
+    _rate: int = field(default=44100)
+    _channels: int = field(default=1)
+    _interim_results: bool = field(default=True)
+    _deadline: float = field(default=DEADLINE)
+
+    @property
+    def url(self) -> str:
+        """
+        A getter method that returns the value of the `url` attribute.
+        :param self: Instance of the class.
+        :return: A string that represents the value of the `url` attribute.
+        """
+        if not hasattr(self, "_url"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named url."
+            )
+        return self._url
+
+    @url.setter
+    def url(self, value: str) -> None:
+        """
+        A setter method that changes the value of the `url` attribute.
+        :param value: A string that represents the value of the `url` attribute.
+        :return: None.
+        """
+        setattr(self, "_url", value)
+
+    @property
+    def rate(self) -> int:
+        """
+        A getter method that returns the value of the `rate` attribute.
+        :param self: Instance of the class.
+        :return: An integer that represents the value of the `rate` attribute.
+        """
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: int) -> None:
+        """
+        A setter method that changes the value of the `rate` attribute.
+        :param value: An integer that represents the value of the `rate` attribute.
+        :return: None.
+        """
+        setattr(self, "_rate", value)
+
+    def endpoint(self) -> str:
+        """
+        A method that returns the url of the stream, along with the audio format.
+        """
+        query = {
+            "encoding": "linear16",
+            "sample_rate": self._rate,
+            "channels": self._channels,
+            "interim_results": str(self._interim_results).lower(),
+            "punctuate": "false",
+        }
+        return f"{self._url}?{urlencode(query)}"
+
+    async def _send(self, websocket: Any, chunks: AsyncIterator[Chunk]) -> None:
+        """
+        A helper method that sends the chunks as they are captured, then asks the server
+        to close the stream.
+        """
+        try:
+            async for chunk in chunks:
+                if isinstance(chunk, np.ndarray):
+                    chunk = chunk.tobytes()
+                if chunk:
+                    await websocket.send(chunk)
+            await websocket.send(CLOSE_STREAM)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # the receiver would wait for the results forever otherwise.
+            await websocket.close()
+            raise
+
+    async def transcribe(
+        self,
+        chunks: AsyncIterator[Chunk],
+        on_result: Optional[Callable[[StreamResult], None]] = None,
+        stop: Callable[[StreamResult], bool] = is_final_word,
+    ) -> Optional[StreamResult]:
+        """
+        A method that streams the chunks and calls `on_result` with every interim and final
+        result. It returns the first final result accepted by `stop`, without waiting for
+        the rest of the chunks, or the last final result once the chunks run out. Past the
+        deadline, the stream is closed and a TimeoutError is raised.
+        """
+        try:
+            return await asyncio.wait_for(
+                self._transcribe(chunks, on_result, stop), self._deadline
+            )
+        except asyncio.TimeoutError:
+            raise deadline_exceeded(self._deadline) from None
+
+    async def _transcribe(
+        self,
+        chunks: AsyncIterator[Chunk],
+        on_result: Optional[Callable[[StreamResult], None]],
+        stop: Callable[[StreamResult], bool],
+    ) -> Optional[StreamResult]:
+        headers = {"Authorization": f"Token {self._api_key}"}
+        start = time.perf_counter()
+        final = None
+        connect, headers_argument = websocket_client()
+        async with connect(self.endpoint(), **{headers_argument: headers}) as websocket:
+            sender = asyncio.ensure_future(self._send(websocket, chunks))
+            try:
+                async for message in websocket:
+                    result = StreamResult.parse(message, time.perf_counter() - start)
+                    if result is None:
+                        continue
+                    if on_result is not None:
+                        on_result(result)
+                    if result.is_final and result.transcript:
+                        final = result
+                        if stop(result):
+                            break
+            finally:
+                sender.cancel()
+                await asyncio.gather(sender, return_exceptions=True)
+                if hasattr(chunks, "aclose"):
+                    await chunks.aclose()
+        if sender.done() and not sender.cancelled() and sender.exception():
+            raise sender.exception()
+        return final
+
+
+def main() -> int:
+    from deepwordle.audio import (
+        AudioCapture,
+    )
+
+    async def listen() -> Optional[StreamResult]:
+        audio_capture = AudioCapture()
+        recognizer = StreamingRecognizer(rate=audio_capture.rate)
+        audio_capture.start()
+        timer = asyncio.get_running_loop().call_later(5, audio_capture.stop)
+        try:
+            return await recognizer.transcribe(
+                audio_capture.chunks(),
+                on_result=lambda result: print(result.transcript, result.is_final),
+            )
+        finally:
+            timer.cancel()
+            audio_capture.close()
+
+    print(asyncio.run(listen()))
+    return 0
+
+
+if __name__ == "__main__":
+    main()
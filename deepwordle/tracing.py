@@ -0,0 +1,264 @@
+"""
+| The following script implements the latency tracing of the voice guesses.
+
+| A guess goes through a few stages between pressing `r` and its letters showing up on the grid: the
+| recording, the preprocessing, the recognition, the matching of the transcript to a valid word and
+| the update of the grid. Every stage is timed with the monotonic clock and its durations are kept in
+| a histogram in the fashion of HdrHistogram: the buckets are linear within every power of two, so
+| any duration from a microsecond to an hour is recorded in constant time and memory, with a relative
+| error below 1%, and the p50 and the p99 come out of a cumulative sum.
+
+| The histograms are shown in the stats panel and exported as Prometheus text or as JSON lines.
+
+| This program and the accompanying materials are made available under the terms of the `MIT License`_.
+| SPDX short identifier: MIT
+| Contributors:
+    Mahmoud Harmouch, mail_.
+.. _MIT License: https://opensource.org/licenses/MIT
+.. _mail: eng.mahmoudharmouch@gmail.com
+
+"""
+
+from attrs import (
+    define,
+    field,
+)
+from contextlib import (
+    contextmanager,
+)
+import json
+import numpy as np
+import os
+import time
+from typing import (
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+# the stages of a voice guess, in their order.
+STAGES = ("record", "preprocess", "recognize", "stream", "match", "render", "total")
+QUANTILES = (0.5, 0.9, 0.99, 0.999)
+# the values below 2 ** SUB_BUCKET_BITS microseconds are exact, the larger ones are kept with
+# SUB_BUCKET_BITS - 1 bits of precision, a relative error below 2 ** (1 - SUB_BUCKET_BITS).
+SUB_BUCKET_BITS = 8
+# the largest value recorded, 2 ** 32 microseconds, over an hour.
+MAX_BITS = 32
+METRIC = "deepwordle_stage_seconds"
+
+
+def bucket_index(value: int) -> int:
+    """
+    A function that returns the bucket of a value in microseconds.
+    """
+    value = min(max(value, 0), (1 << MAX_BITS) - 1)
+    if value < 1 << SUB_BUCKET_BITS:
+        return value
+    shift = value.bit_length() - SUB_BUCKET_BITS
+    half = 1 << (SUB_BUCKET_BITS - 1)
+    return (1 << SUB_BUCKET_BITS) + (shift - 1) * half + (value >> shift) - half
+
+
+def bucket_bounds(index: int) -> Tuple[int, int]:
+    """
+    A function that returns the lowest and the highest value in microseconds of a bucket.
+    """
+    if index < 1 << SUB_BUCKET_BITS:
+        return index, index
+    half = 1 << (SUB_BUCKET_BITS - 1)
+    offset = index - (1 << SUB_BUCKET_BITS)
+    shift = offset // half + 1
+    lowest = (offset % half + half) << shift
+    return lowest, lowest + (1 << shift) - 1
+
+
+BUCKETS = bucket_index((1 << MAX_BITS) - 1) + 1
+
+
+@define
+class Histogram:
+    """
+    A brief encapsulation of the distribution of the durations of a stage.
+
+    Attrs:
+        counts: the number of durations of every bucket.
+        count: the number of durations recorded.
+        total: the sum of the durations, in seconds.
+        maximum: the longest duration, in seconds.
+    """
+
+    _counts: np.ndarray = field(factory=lambda: np.zeros(BUCKETS, dtype=np.int64))
+    _count: int = field(default=0)
+    _total: float = field(default=0.0)
+    _maximum: float = field(default=0.0)
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def total(self) -> float:
+        return self._total
+
+    @property
+    def maximum(self) -> float:
+        return self._maximum
+
+    def record(self, seconds: float) -> None:
+        self._counts[bucket_index(int(seconds * 1e6))] += 1
+        self._count += 1
+        self._total += seconds
+        self._maximum = max(self._maximum, seconds)
+
+    def percentiles(self, quantiles: Sequence[float] = QUANTILES) -> List[float]:
+        """
+        A method that returns the durations, in seconds, below which the given fractions of
+        the durations recorded fall: the highest value of the bucket each one lands in.
+        """
+        if not self._count:
+            return [0.0] * len(quantiles)
+        cumulative = np.cumsum(self._counts)
+        ranks = np.maximum(np.ceil(np.asarray(quantiles) * self._count), 1)
+        indices = np.searchsorted(cumulative, ranks)
+        return [
+            min(bucket_bounds(int(index))[1] / 1e6, self._maximum) for index in indices
+        ]
+
+    def percentile(self, quantile: float) -> float:
+        return self.percentiles([quantile])[0]
+
+
+@define
+class Tracer:
+    """
+    A brief encapsulation of the histograms of the stages of the voice guesses.
+
+    Attrs:
+        histograms: the histogram of every stage, by name.
+        start: the monotonic time the current guess started at, in nanoseconds.
+        trace: the durations of the stages of the current guess, in seconds.
+    """
+
+    _histograms: Dict[str, Histogram] = field(factory=dict)
+    _start: Optional[int] = field(default=None)
+    _trace: Dict[str, float] = field(factory=dict)
+
+    @property
+    def trace(self) -> Dict[str, float]:
+        return self._trace
+
+    def histogram(self, stage: str) -> Histogram:
+        if stage not in self._histograms:
+            self._histograms[stage] = Histogram()
+        return self._histograms[stage]
+
+    def begin(self) -> None:
+        """
+        A method that starts timing a guess, the stages of the last one are forgotten.
+        """
+        self._start = time.perf_counter_ns()
+        self._trace = {}
+
+    def record(self, stage: str, seconds: float) -> None:
+        self.histogram(stage).record(seconds)
+        self._trace[stage] = self._trace.get(stage, 0.0) + seconds
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        A context manager timing a stage, the stages raising are not recorded.
+        """
+        start = time.perf_counter_ns()
+        yield
+        self.record(name, (time.perf_counter_ns() - start) / 1e9)
+
+    def end(self) -> Dict[str, float]:
+        """
+        A method that records the total duration of the current guess and returns the
+        durations of its stages.
+        """
+        if self._start is not None:
+            self.record("total", (time.perf_counter_ns() - self._start) / 1e9)
+            self._start = None
+        return self._trace
+
+    def stages(self) -> List[str]:
+        """
+        A method that returns the names of the stages recorded, in the order of a guess.
+        """
+        known = [stage for stage in STAGES if stage in self._histograms]
+        return known + sorted(set(self._histograms) - set(STAGES))
+
+    def format(self) -> str:
+        lines = [f"{'stage':<11}{'n':>4}{'p50':>8}{'p99':>8}"]
+        for stage in self.stages():
+            histogram = self._histograms[stage]
+            p50, p99 = histogram.percentiles([0.5, 0.99])
+            lines.append(
+                f"{stage:<11}{histogram.count:>4}{p50 * 1e3:>6.0f}ms{p99 * 1e3:>6.0f}ms"
+            )
+        return "\n".join(lines)
+
+    def to_prometheus(self) -> str:
+        """
+        A method that returns the histograms as Prometheus summaries, in the text format.
+        """
+        lines = [
+            f"# HELP {METRIC} The time spent in the stages of the voice guesses.",
+            f"# TYPE {METRIC} summary",
+        ]
+        for stage in self.stages():
+            histogram = self._histograms[stage]
+            for quantile, value in zip(QUANTILES, histogram.percentiles()):
+                lines.append(
+                    f'{METRIC}{{stage="{stage}",quantile="{quantile}"}} {value:.6f}'
+                )
+            lines.append(f'{METRIC}_sum{{stage="{stage}"}} {histogram.total:.6f}')
+            lines.append(f'{METRIC}_count{{stage="{stage}"}} {histogram.count}')
+        return "\n".join(lines) + "\n"
+
+    def to_json_lines(self) -> str:
+        """
+        A method that returns the histograms as JSON lines, one stage per line.
+        """
+        lines = []
+        for stage in self.stages():
+            histogram = self._histograms[stage]
+            record = {"stage": stage, "count": histogram.count, "sum": histogram.total}
+            for quantile, value in zip(QUANTILES, histogram.percentiles()):
+                record[f"p{quantile * 100:g}"] = value
+            record["max"] = histogram.maximum
+            lines.append(json.dumps(record))
+        return "\n".join(lines) + "\n"
+
+    def export(self, path: str) -> None:
+        """
+        A method that writes the histograms to `path`, as Prometheus text when it ends with
+        `.prom` and as JSON lines otherwise.
+        """
+        if os.path.splitext(path)[1] == ".prom":
+            content = self.to_prometheus()
+        else:
+            content = self.to_json_lines()
+        with open(path, "w") as export_file:
+            export_file.write(content)
+
+
+def main() -> int:
+    rng = np.random.default_rng(0)
+    tracer = Tracer()
+    for _ in range(1000):
+        tracer.begin()
+        tracer.record("record", rng.uniform(0.5, 2.0))
+        tracer.record("recognize", rng.lognormal(np.log(0.3), 0.5))
+        tracer.end()
+    print(tracer.format())
+    print(tracer.to_prometheus())
+    return 0
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 """
 | The following script implements all the necessary logic required for deepgram.
 
+| The recordings are uploaded through a keep-alive session owned by the recognizer and warmed up while
+| the game starts, rather than through the SDK, which opens a new session for every request.
+
 | This program and the accompanying materials are made available under the terms of the `MIT License`_.
 | SPDX short identifier: MIT
 | Contributors:
@@ -10,24 +13,32 @@
 
 """
 
+import argparse
 import asyncio
 from attrs import (
     define,
     field,
 )
-from deepgram import (
-    Deepgram,
-)
 import json
 import os
 from typing import (
+    Any,
     Optional,
-    TypeVar,
+    Sequence,
+    Union,
+)
+
+from deepwordle.core.word_store import (
+    WordStore,
+)
+from deepwordle.session import (
+    KeepAliveSession,
+    SessionStats,
 )
 
-T = TypeVar("T", bound=Deepgram)
+Buffer = Union[bytes, bytearray, memoryview]
 
-BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+API_URL = "https://api.deepgram.com/v1"
 
 
 @define
@@ -35,8 +46,15 @@ class Recognizer:
     """Class that encapsulates Deepgram's api config."""
 
     _api_key: Optional[str] = field(default=os.environ.get("DEEPGRAM_API_KEY"))
-    _file_name: Optional[str] = field(default="word.wav")
-    _deepgram: Optional[T] = field(default=None)
+    # a path to write every uploaded recording to, to debug them.
+    _dump_path: Optional[str] = field(default=os.environ.get("DEEPWORDLE_AUDIO_DUMP"))
+    _api_url: str = field(default=os.environ.get("DEEPGRAM_API_URL", API_URL))
+    # the keep-alive session every recording is uploaded with.
+    _session: Optional[KeepAliveSession] = field(init=False, default=None, repr=False)
+
+    @classmethod
+    def create(cls, word_store: Optional[WordStore] = None) -> "Recognizer":
+        return cls()
 
     @property
     def api_key(self) -> str:
@@ -61,69 +79,122 @@ class Recognizer:
         setattr(self, "_api_key", value)
 
     @property
-    def file_name(self) -> str:
+    def dump_path(self) -> Optional[str]:
         """
-        A getter method that returns the value of the `file_name` attribute.
+        A getter method that returns the value of the `dump_path` attribute.
         :param self: Instance of the class.
-        :return: A string that represents the value of the `file_name` attribute.
+        :return: A string that represents the value of the `dump_path` attribute.
         """
-        if not hasattr(self, "_file_name"):
+        if not hasattr(self, "_dump_path"):
             raise AttributeError(
-                f"Your {self.__class__.__name__!r} instance has no attribute named file_name."
+                f"Your {self.__class__.__name__!r} instance has no attribute named dump_path."
             )
-        return self._file_name
+        return self._dump_path
 
-    @file_name.setter
-    def file_name(self, value: str) -> None:
+    @dump_path.setter
+    def dump_path(self, value: Optional[str]) -> None:
         """
-        A setter method that changes the value of the `file_name` attribute.
-        :param value: A string that represents the value of the `file_name` attribute.
+        A setter method that changes the value of the `dump_path` attribute.
+        :param value: A string that represents the value of the `dump_path` attribute.
         :return: NoReturn.
         """
-        setattr(self, "_file_name", value)
+        setattr(self, "_dump_path", value)
 
     @property
-    def deepgram(self) -> T:
+    def api_url(self) -> str:
         """
-        A getter method that returns the value of the `deepgram` attribute.
+        A getter method that returns the value of the `api_url` attribute.
         :param self: Instance of the class.
-        :return: A Deepgram object that represents the value of the `deepgram` attribute.
+        :return: A string that represents the value of the `api_url` attribute.
         """
-        if not hasattr(self, "_deepgram"):
+        if not hasattr(self, "_api_url"):
             raise AttributeError(
-                f"Your {self.__class__.__name__!r} instance has no attribute named deepgram."
+                f"Your {self.__class__.__name__!r} instance has no attribute named api_url."
             )
-        return self._deepgram
+        return self._api_url
 
-    @deepgram.setter
-    def deepgram(self, value: T) -> None:
+    @property
+    def session(self) -> KeepAliveSession:
         """
-        A setter method that changes the value of the `deepgram` attribute.
-        :param value: A Deepgram object that represents the value of the `deepgram` attribute.
-        :return: NoReturn.
+        A getter method that returns the keep-alive session, created on the first use.
+        :param self: Instance of the class.
+        :return: A KeepAliveSession object that represents the value of the `session` attribute.
         """
-        setattr(self, "_deepgram", value)
+        if self._session is None:
+            self._session = KeepAliveSession(self._api_url)
+        return self._session
 
-    def __attrs_post_init__(self):
-        self.deepgram = Deepgram(self.api_key)
+    @property
+    def stats(self) -> SessionStats:
+        """
+        A getter method that returns the connections and the latencies of the requests.
+        :param self: Instance of the class.
+        :return: A SessionStats object.
+        """
+        return self.session.stats
 
-    async def recognize(self):
-        # Open the audio file
-        with open(os.path.join(BASE_DIR, self.file_name), "rb") as audio:
-            # ...or replace mimetype as appropriate
-            source = {"buffer": audio, "mimetype": "audio/wav"}
-            response = await self.deepgram.transcription.prerecorded(
-                source, {"punctuate": False}
-            )
-            return response
+    async def warm(self) -> Optional[float]:
+        """
+        Open a connection to the endpoint ahead of the first guess, the seconds it took are
+        returned, None when the endpoint cannot be reached.
+        """
+        return await self.session.warm("/listen")
 
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
 
-def main():
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    result = loop.run_until_complete(Recognizer().recognize())
+    async def recognize(self, audio: Buffer, mimetype: str = "audio/wav"):
+        """
+        Transcribe an audio file held in memory.
+        """
+        if self.dump_path:
+            with open(self.dump_path, "wb") as dump_file:
+                dump_file.write(audio)
+        import aiohttp
+
+        headers = {"Authorization": f"Token {self.api_key}", "Content-Type": mimetype}
+        try:
+            response = await self.session.request(
+                "POST", "/listen", {"punctuate": "false"}, audio, headers
+            )
+        except aiohttp.ClientResponseError as exc:
+            # the errors of the request itself are not worth a retry, unlike being rate
+            # limited or an error of the server.
+            raise (
+                Exception(f"DG: {exc}")
+                if exc.status < 500 and exc.status != 429
+                else exc
+            )
+        if response is not None and response.get("error"):
+            raise Exception(f"DG: {response}")
+        return response
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m deepwordle.transcribe",
+        description="Transcribe a recording with deepgram.",
+    )
+    parser.add_argument(
+        "path", help="the recording to transcribe, a WAV or a FLAC file"
+    )
+    args = parser.parse_args(argv)
+    with open(args.path, "rb") as audio_file:
+        audio = audio_file.read()
+    mimetype = "audio/flac" if args.path.endswith(".flac") else "audio/wav"
+
+    async def transcribe() -> Any:
+        recognizer = Recognizer()
+        try:
+            return await recognizer.recognize(audio, mimetype)
+        finally:
+            await recognizer.close()
+
+    result = asyncio.run(transcribe())
     words = result["results"]["channels"][0]["alternatives"][0]["words"]
     print(words)
+    return 0
 
 
 if __name__ == "__main__":
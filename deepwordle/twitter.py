@@ -1,6 +1,10 @@
 """
 | The following script implements all the necessary logic required for tweepy.
 
+| Nothing is done on creation, tweepy is not even imported: the tweepy client is built on its first
+| use and the credentials are verified in the background, once a day at most, a successful
+| verification being cached on disk.
+
 | This program and the accompanying materials are made available under the terms of the `MIT License`_.
 | SPDX short identifier: MIT
 | Contributors:
@@ -14,15 +18,35 @@ from attrs import (
     define,
     field,
 )
+import hashlib
+import json
 import os
-import tweepy
+import time
 from typing import (
+    TYPE_CHECKING,
+    List,
     Optional,
     TypeVar,
 )
 
-T = TypeVar("T", bound=tweepy.auth.OAuthHandler)
-V = TypeVar("V", bound=type(tweepy.api))
+from deepwordle.core.word_store import (
+    get_cache_dir,
+)
+
+if TYPE_CHECKING:
+    import requests
+    import tweepy
+
+T = TypeVar("T", bound="tweepy.auth.OAuthHandler")
+
+API_URL = "https://api.twitter.com"
+UPDATE_PATH = "/1.1/statuses/update.json"
+VERIFY_PATH = "/1.1/account/verify_credentials.json"
+VERIFIED_FILE_NAME = "twitter-verified.json"
+# the seconds a successful verification of the credentials is trusted for.
+VERIFIED_TTL = 24 * 60 * 60
+# the seconds a post may take.
+TIMEOUT = 10
 
 
 @define
@@ -37,9 +61,11 @@ class Twitter:
     _access_token_secret: Optional[str] = field(
         default=os.environ.get("ACCESS_TOKEN_SECRET", "")
     )
-    _text: Optional[str] = field(default="automated tweet by deepwordle!")
     _auth: Optional[T] = field(default=None)
-    _api: Optional[T] = field(default=None)
+    _api_url: str = field(default=os.environ.get("TWITTER_API_URL", API_URL))
+    _verified_path: str = field(
+        factory=lambda: os.path.join(get_cache_dir(), VERIFIED_FILE_NAME)
+    )
 
     @property
     def consumer_key(self) -> str:
@@ -129,32 +155,10 @@ class Twitter:
         """
         setattr(self, "_access_token_secret", value)
 
-    @property
-    def text(self) -> str:
-        """
-        A getter method that returns the value of the `text` attribute.
-        :param self: Instance of the class.
-        :return: A string that represents the value of the `text` attribute.
-        """
-        if not hasattr(self, "_text"):
-            raise AttributeError(
-                f"Your {self.__class__.__name__!r} instance has no attribute named text."
-            )
-        return self._text
-
-    @text.setter
-    def text(self, value: str) -> None:
-        """
-        A setter method that changes the value of the `text` attribute.
-        :param value: A string that represents the value of the `text` attribute.
-        :return: NoReturn.
-        """
-        setattr(self, "_text", value)
-
     @property
     def auth(self) -> T:
         """
-        A getter method that returns the value of the `auth` attribute.
+        A getter method that returns the value of the `auth` attribute, built on the first use.
         :param self: Instance of the class.
         :return: A tweepy OAuth Handler that represents the value of the `auth` attribute.
         """
@@ -162,6 +166,13 @@ class Twitter:
             raise AttributeError(
                 f"Your {self.__class__.__name__!r} instance has no attribute named auth."
             )
+        if self._auth is None:
+            # tweepy is imported on the first tweet rather than on startup.
+            import tweepy
+
+            # Request User Authentication via the API.
+            self._auth = tweepy.OAuthHandler(self.consumer_key, self.consumer_secret)
+            self._auth.set_access_token(self.access_token, self.access_token_secret)
         return self._auth
 
     @auth.setter
@@ -174,46 +185,114 @@ class Twitter:
         setattr(self, "_auth", value)
 
     @property
-    def api(self) -> V:
+    def verified_path(self) -> str:
         """
-        A getter method that returns the value of the `api` attribute.
+        A getter method that returns the value of the `verified_path` attribute.
         :param self: Instance of the class.
-        :return: A tweepy client api that represents the value of the `api` attribute.
+        :return: A string that represents the value of the `verified_path` attribute.
         """
-        if not hasattr(self, "_api"):
+        if not hasattr(self, "_verified_path"):
             raise AttributeError(
-                f"Your {self.__class__.__name__!r} instance has no attribute named api."
+                f"Your {self.__class__.__name__!r} instance has no attribute named verified_path."
             )
-        return self._api
+        return self._verified_path
 
-    @api.setter
-    def api(self, value: V) -> None:
+    def missing_credentials(self) -> List[str]:
         """
-        A setter method that changes the value of the `api` attribute.
-        :param value: A tweepy client api that represents the value of the `api` attribute.
-        :return: NoReturn.
+        A method that returns the names of the credentials left empty.
         """
-        setattr(self, "_api", value)
-
-    def __attrs_post_init__(self):
         config = {
             "consumer_key": self.consumer_key,
             "consumer_secret": self.consumer_secret,
             "access_token": self.access_token,
             "access_token_secret": self.access_token_secret,
         }
-        for key, value in config.items():
-            assert len(value) > 0, f"Please provide a valid secret for: {key}"
-        # Request User Authentication via the API.
-        self.auth = tweepy.OAuthHandler(self.consumer_key, self.consumer_secret)
-        self.auth.set_access_token(self.access_token, self.access_token_secret)
-        # Create API object
-        self.api = tweepy.API(self.auth, wait_on_rate_limit=True)
+        return [key for key, value in config.items() if not value]
+
+    def fingerprint(self) -> str:
+        """
+        A method that returns a digest of the credentials, the verification cached on disk
+        belongs to, rather than the credentials themselves.
+        """
+        secrets = "\n".join(
+            (
+                self.consumer_key,
+                self.consumer_secret,
+                self.access_token,
+                self.access_token_secret,
+                self.api_url,
+            )
+        )
+        return hashlib.sha256(secrets.encode()).hexdigest()
+
+    def verified_recently(self, ttl: float = VERIFIED_TTL) -> bool:
+        """
+        A method that tells whether the credentials were verified less than `ttl` seconds ago.
+        """
         try:
-            self.api.verify_credentials()
-        except Exception as error:
-            raise error
+            with open(self.verified_path) as verified_file:
+                verified = json.load(verified_file)
+        except (OSError, ValueError):
+            return False
+        return (
+            verified.get("fingerprint") == self.fingerprint()
+            and 0 <= time.time() - verified.get("verified_at", 0) < ttl
+        )
+
+    def verify(self, ttl: float = VERIFIED_TTL) -> bool:
+        """
+        Verify the credentials, blocking, unless they were verified less than `ttl` seconds
+        ago. It returns whether the API was asked and raises a ValueError when the
+        credentials are missing or rejected.
+        """
+        missing = self.missing_credentials()
+        if missing:
+            raise ValueError(f"Please provide a valid secret for: {', '.join(missing)}")
+        if self.verified_recently(ttl):
+            return False
+        import requests
+
+        response = requests.get(
+            self.api_url + VERIFY_PATH, auth=self.auth.apply_auth(), timeout=TIMEOUT
+        )
+        if response.status_code in (401, 403):
+            raise ValueError(
+                f"Twitter rejected the credentials: HTTP {response.status_code}"
+            )
+        response.raise_for_status()
+        directory = os.path.dirname(self.verified_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(self.verified_path, "w") as verified_file:
+            json.dump(
+                {"fingerprint": self.fingerprint(), "verified_at": time.time()},
+                verified_file,
+            )
+        return True
+
+    @property
+    def api_url(self) -> str:
+        """
+        A getter method that returns the value of the `api_url` attribute.
+        :param self: Instance of the class.
+        :return: A string that represents the value of the `api_url` attribute.
+        """
+        if not hasattr(self, "_api_url"):
+            raise AttributeError(
+                f"Your {self.__class__.__name__!r} instance has no attribute named api_url."
+            )
+        return self._api_url
+
+    def send(self, text: str) -> "requests.Response":
+        """
+        Post a text based tweet and return the response whatever its status, the outbox
+        reads its rate limit headers. It never sleeps on a rate limit.
+        """
+        import requests
 
-    def post_tweet(self):
-        # Post a text based tweet
-        self.api.update_status(self.text)
+        return requests.post(
+            self.api_url + UPDATE_PATH,
+            data={"status": text},
+            auth=self.auth.apply_auth(),
+            timeout=TIMEOUT,
+        )
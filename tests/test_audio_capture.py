@@ -0,0 +1,110 @@
+import asyncio
+import numpy as np
+import threading
+import time
+
+from deepwordle.audio import (
+    AudioCapture,
+    RingBuffer,
+)
+
+
+class FakeStream:
+    def __init__(self, callback, frames_per_buffer, samples):
+        self.callback = callback
+        self.frames_per_buffer = frames_per_buffer
+        self.samples = samples
+        self.running = False
+        self.thread = threading.Thread(target=self.run)
+
+    def run(self):
+        for start in range(0, len(self.samples), self.frames_per_buffer):
+            if not self.running:
+                return
+            chunk = self.samples[start : start + self.frames_per_buffer]
+            self.callback(chunk.tobytes(), len(chunk), {}, 0)
+            time.sleep(0.001)
+
+    def start_stream(self):
+        self.running = True
+        self.thread.start()
+
+    def stop_stream(self):
+        self.running = False
+        self.thread.join()
+
+    def close(self):
+        pass
+
+
+class FakePyAudio:
+    def __init__(self, samples):
+        self.samples = samples
+
+    def get_format_from_width(self, width):
+        return width
+
+    def open(self, frames_per_buffer, stream_callback, **kwargs):
+        return FakeStream(stream_callback, frames_per_buffer, self.samples)
+
+    def terminate(self):
+        pass
+
+
+def test_ring_buffer_wraps_around():
+    ring_buffer = RingBuffer(8)
+    assert ring_buffer.write(np.arange(6, dtype=np.int16)) == 6
+    assert ring_buffer.read(4).tolist() == [0, 1, 2, 3]
+    assert ring_buffer.write(np.arange(6, 12, dtype=np.int16)) == 6
+    assert ring_buffer.available == 8 and ring_buffer.free == 0
+    # the buffer is full, the new samples are dropped.
+    assert ring_buffer.write(np.arange(3, dtype=np.int16).tobytes()) == 0
+    assert ring_buffer.overruns == 3
+    assert ring_buffer.read().tolist() == [4, 5, 6, 7, 8, 9, 10, 11]
+    assert len(ring_buffer) == 0
+
+
+def test_ring_buffer_across_threads():
+    ring_buffer = RingBuffer(64)
+    expected = np.arange(10_000, dtype=np.int16)
+
+    def produce():
+        for start in range(0, len(expected), 7):
+            chunk = expected[start : start + 7]
+            while ring_buffer.free < len(chunk):
+                time.sleep(0)
+            ring_buffer.write(chunk)
+
+    producer = threading.Thread(target=produce)
+    producer.start()
+    received = []
+    while sum(map(len, received)) < len(expected):
+        received.append(ring_buffer.read())
+    producer.join()
+    assert np.array_equal(np.concatenate(received), expected)
+    assert ring_buffer.overruns == 0
+
+
+def test_record_keeps_the_loop_responsive():
+    rate = 8000
+    samples = (np.arange(rate * 2) % 100).astype(np.int16)
+    audio_capture = AudioCapture(rate=rate, py_audio=FakePyAudio(samples))
+
+    async def record():
+        ticks = 0
+
+        async def tick():
+            nonlocal ticks
+            while True:
+                ticks += 1
+                await asyncio.sleep(0)
+
+        ticker = asyncio.get_running_loop().create_task(tick())
+        recorded = await audio_capture.record(0.5)
+        ticker.cancel()
+        return recorded, ticks
+
+    recorded, ticks = asyncio.run(record())
+    assert np.array_equal(recorded, samples[: rate // 2])
+    assert ticks > 1
+    assert not audio_capture.capturing
@@ -0,0 +1,35 @@
+from deepwordle.core.codec import (
+    INVALID,
+    PackedWords,
+    decode,
+    encode,
+    letter_at,
+    unpack_letters,
+)
+from deepwordle.core.word_store import (
+    ANSWERS_FILE,
+    GUESSES_FILE,
+    _read_words,
+)
+
+
+def test_encode_decode():
+    assert decode(encode("react")) == "react"
+    assert encode("REACT") == encode(iter("react"))
+    assert encode("react") < encode("ready") < encode("zonal")
+    assert letter_at(encode("react"), 4) == ord("t") - 96
+    for word in ("", "reacts", "reac", "re4ct", ["re", "a", "c", "t"]):
+        assert encode(word) == INVALID
+
+
+def test_packed_words():
+    words = _read_words(GUESSES_FILE) + _read_words(ANSWERS_FILE)
+    packed_words = PackedWords(words)
+    assert packed_words.words() == sorted(words)
+    assert packed_words.nbytes == 4 * len(words)
+    assert all(word in packed_words for word in words[::97])
+    assert "zzzzz" not in packed_words and packed_words.index_of("zzzzz") == -1
+    assert packed_words.column(0) == bytes(ord(word[0]) - 96 for word in sorted(words))
+    letters = unpack_letters(packed_words.as_numpy())
+    assert letters.shape == (len(words), 5)
+    assert bytes(letters[packed_words.index_of("react")]) == b"\x12\x05\x01\x03\x14"
@@ -0,0 +1,45 @@
+import numpy as np
+
+from deepwordle.core import (
+    WordStore,
+)
+from deepwordle.core.constraints import (
+    ConstraintEngine,
+    allowed_counts,
+)
+from deepwordle.core.scorer import (
+    score_many,
+)
+
+
+def test_allowed_counts():
+    # "lllll" against "hello" shows yellow, yellow, green, green, yellow.
+    assert 2 in allowed_counts([1, 1, 2, 2, 1])
+    assert allowed_counts([0]) == [0]
+    assert allowed_counts([1, 0]) == [1]
+    assert allowed_counts([2, 1]) == [2, 3, 4, 5]
+
+
+def test_row_masks_match_the_scorer(tmp_path):
+    word_store = WordStore.open(cache_dir=str(tmp_path))
+    constraint_engine = ConstraintEngine(word_store)
+    answers = word_store.answers()
+    guesses = ["lolly", "eerie", "mamma", "fuzzy", "soare", "react"]
+    for guess, row in zip(guesses, score_many(guesses, answers)):
+        for pattern in np.unique(row):
+            survivors = np.flatnonzero(row == pattern)
+            constraint_engine.reset()
+            constraint_engine.update(guess, int(pattern))
+            assert np.array_equal(constraint_engine.survivors(), survivors)
+            assert constraint_engine.count == len(survivors)
+
+
+def test_incremental_updates(tmp_path):
+    word_store = WordStore.open(cache_dir=str(tmp_path))
+    constraint_engine = ConstraintEngine(word_store)
+    assert constraint_engine.update("raise", (2, 1, 0, 0, 1)) < 2309
+    constraint_engine.update("clout", (1, 0, 0, 0, 2))
+    assert constraint_engine.candidates() == ["react"]
+    assert constraint_engine.is_possible("react")
+    assert not constraint_engine.is_possible("aback")
+    assert not constraint_engine.is_possible("aahed")
@@ -0,0 +1,77 @@
+from types import (
+    SimpleNamespace,
+)
+
+from deepwordle.components.constants import (
+    IS_IN_POSITION,
+    MAX_ATTEMPTS,
+    WORD_LENGTH,
+)
+from deepwordle.components.utils import (
+    update_letters_state,
+)
+from deepwordle.core.game_state import (
+    GameState,
+)
+
+
+def type_word(game_state, word):
+    for character in word:
+        game_state.insert(character)
+
+
+def test_editing_stays_in_the_current_row():
+    game_state = GameState("react")
+    assert not game_state.delete()
+    type_word(game_state, "theres")
+    assert game_state.current_word() == "THERE"
+    assert game_state.cursor == WORD_LENGTH
+    assert game_state.delete() and game_state.current_word() == "THER"
+    assert game_state.submit() is None
+    assert game_state.insert("e") and game_state.submit() is not None
+    assert game_state.row == 1 and game_state.cursor == WORD_LENGTH
+    # the submitted row can not be edited anymore.
+    assert not game_state.delete()
+    assert bytes(game_state.chars[:WORD_LENGTH]) == b"THERE"
+
+
+def test_states_match_the_letters():
+    game_state = GameState("hello")
+    for guess in ("lllll", "eerie", "hello"):
+        type_word(game_state, guess)
+        game_state.submit()
+    for row, (word, states) in enumerate(game_state.rows()):
+        letters = [SimpleNamespace(character=character) for character in word]
+        expected = update_letters_state(letters, "HELLO")
+        assert states == tuple(letter.state for letter in expected)
+    assert game_state.won and game_state.over
+    assert not game_state.insert("a")
+
+
+def test_lost_game():
+    game_state = GameState("react")
+    for _ in range(MAX_ATTEMPTS):
+        type_word(game_state, "there")
+        game_state.submit()
+    assert game_state.over and not game_state.won
+    assert game_state.state(0) != IS_IN_POSITION
+    game_state.reset("hello")
+    assert game_state.row == 0 and not any(game_state.chars)
+
+
+def test_edits_return_the_touched_cells():
+    game_state = GameState("react")
+    assert [game_state.insert(character) for character in "there"] == [
+        (0,),
+        (1,),
+        (2,),
+        (3,),
+        (4,),
+    ]
+    assert game_state.insert("s") == ()
+    assert game_state.delete() == (4,)
+    game_state.insert("e")
+    game_state.submit()
+    assert list(game_state.row_cells(game_state.row - 1)) == [0, 1, 2, 3, 4]
+    assert game_state.delete() == ()
+    assert game_state.insert("r") == (WORD_LENGTH,)
@@ -0,0 +1,59 @@
+import pytest
+
+from pyfiglet import (
+    CharNotPrinted,
+    Figlet,
+)
+
+from deepwordle.components.glyphs import (
+    ATLAS_FONTS,
+    GlyphCache,
+    build_atlas,
+    load_atlas,
+)
+
+
+def test_glyphs_are_rendered_once():
+    cache = GlyphCache()
+    for width in (40, 80, 40):
+        for font_name in ("mini", "small", "standard", "big"):
+            expected = Figlet(font=font_name, width=width).renderText("AW").rstrip("\n")
+            assert cache.render("AW", font_name, width) == expected
+    # a width is a key of its own, a font is loaded once whatever the width.
+    assert (cache.stats.hits, cache.stats.misses) == (4, 8)
+    assert len(cache._fonts) == 4
+
+
+def test_least_recently_used_glyphs_are_evicted():
+    cache = GlyphCache(size=2, font_size=1, atlas_path=None)
+    cache.render("A", "mini", 20)
+    cache.render("B", "mini", 20)
+    cache.render("A", "mini", 20)
+    cache.render("C", "small", 20)
+    # "B" was the least recently used, "A" is still there.
+    assert len(cache) == 2 and cache.stats.evictions == 1
+    cache.render("A", "mini", 20)
+    assert cache.stats.hits == 2
+    cache.render("B", "mini", 20)
+    assert cache.stats.misses == 4
+    assert list(cache._fonts) == ["mini"]
+
+
+def test_atlas_is_up_to_date():
+    # run `python -m deepwordle.components.glyphs` when it fails.
+    assert load_atlas() == build_atlas()
+
+
+def test_letters_are_prebuilt():
+    cache = GlyphCache()
+    for font_name in ATLAS_FONTS:
+        for text in ("", "r", "E", "w"):
+            expected = Figlet(font=font_name, width=40).renderText(text).rstrip("\n")
+            assert cache.render(text, font_name, 40) == expected
+    # the first paint parses no font file.
+    assert cache.stats.prebuilt == 16 and not cache._fonts
+    # pyfiglet renders the other texts, and the widths narrower than a glyph.
+    with pytest.raises(CharNotPrinted):
+        cache.render("w", "big", 4)
+    cache.render("react", "mini", 40)
+    assert cache.stats.prebuilt == 16 and list(cache._fonts) == ["big", "mini"]
@@ -0,0 +1,67 @@
+import random
+
+from deepwordle.core import (
+    WordStore,
+)
+from deepwordle.core.matcher import (
+    WordMatcher,
+    edit_distance,
+    phonetic_key,
+)
+
+
+def reference_distance(source, target):
+    previous = list(range(len(target) + 1))
+    for row, source_char in enumerate(source, 1):
+        current = [row]
+        for column, target_char in enumerate(target, 1):
+            current.append(
+                min(
+                    previous[column] + 1,
+                    current[column - 1] + 1,
+                    previous[column - 1] + (source_char != target_char),
+                )
+            )
+        previous = current
+    return previous[-1]
+
+
+def test_edit_distance():
+    generator = random.Random(0)
+    for _ in range(2000):
+        source = "".join(generator.choices("abcd", k=generator.randint(0, 9)))
+        target = "".join(generator.choices("abcd", k=generator.randint(0, 9)))
+        assert edit_distance(source, target) == reference_distance(source, target)
+
+
+def test_phonetic_key():
+    assert phonetic_key("write") == phonetic_key("rite") == phonetic_key("right")
+    assert phonetic_key("phone") == phonetic_key("fone")
+    assert phonetic_key("knack") == phonetic_key("nak")
+
+
+def test_match(tmp_path):
+    word_matcher = WordMatcher(WordStore.open(cache_dir=str(tmp_path)))
+    assert word_matcher.match("React.") == "react"
+    assert word_matcher.match("reakt") == "react"
+    assert word_matcher.match("reacts") == "react"
+    assert word_matcher.match("rite") == "write"
+    assert word_matcher.match("xylophone") is None
+    assert word_matcher.match("") is None
+    closest = word_matcher.closest("reakt")
+    assert closest[0] == ("react", 1)
+    assert [distance for _, distance in closest] == sorted(
+        distance for _, distance in closest
+    )
+
+
+def test_match_on_a_small_store(tmp_path):
+    guesses, answers = tmp_path / "guesses.txt", tmp_path / "answers.txt"
+    guesses.write_text("react\ncrane\n")
+    answers.write_text("react\n")
+    word_store = WordStore.open(str(guesses), str(answers), cache_dir=str(tmp_path))
+    word_matcher = WordMatcher(word_store)
+    # fewer words than candidates, they are all ranked.
+    assert word_matcher.match("reakt") == "react"
+    assert word_matcher.match("crain") == "crane"
+    assert word_matcher.match("xylophone") is None
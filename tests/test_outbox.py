@@ -0,0 +1,95 @@
+import asyncio
+import json
+import random
+import requests
+import time
+
+from deepwordle.outbox import (
+    Outbox,
+)
+from deepwordle.stand_ins import (
+    TwitterStandIn,
+)
+
+
+def poster(url):
+    def send(text):
+        return requests.post(
+            url + "/1.1/statuses/update.json", data={"status": text}, timeout=5
+        )
+
+    return send
+
+
+def run_outbox(path, texts, stand_in_kwargs, **kwargs):
+    """
+    Post `texts` through an outbox to a stand-in and wait for all of them to be done with.
+    """
+    statuses = []
+
+    async def run():
+        async with TwitterStandIn(**stand_in_kwargs) as stand_in:
+            outbox = Outbox(
+                poster(stand_in.url),
+                path=str(path),
+                on_status=statuses.append,
+                backoff=0.01,
+                random=random.Random(0),
+                **kwargs,
+            )
+            outbox.start()
+            start = time.perf_counter()
+            for text in texts:
+                outbox.put(text)
+            # the key handler is never held up by the posts.
+            assert time.perf_counter() - start < 0.1
+            await asyncio.wait_for(outbox.join(), 5)
+            await outbox.stop()
+            return stand_in, time.perf_counter() - start
+
+    stand_in, seconds = asyncio.run(run())
+    return stand_in, statuses, seconds
+
+
+def test_rate_limit_is_waited_for(tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    stand_in, statuses, seconds = run_outbox(
+        path, ["one", "two", "three"], {"limit": 2, "window": 0.3}
+    )
+    assert stand_in.tweets == ["one", "two", "three"]
+    # the last post waited for the reset of the window rather than hitting the limit.
+    assert stand_in.requests == 3 and seconds >= 0.25
+    assert statuses.count("Tweet posted!") == 3
+    # an unexpected 429 is waited for as well.
+    stand_in, statuses, _ = run_outbox(
+        path, ["four"], {"statuses": [429], "window": 0.3}
+    )
+    assert stand_in.tweets == ["four"] and stand_in.requests == 2
+    assert any("Rate limited" in status for status in statuses)
+
+
+def test_failures_are_retried_or_dropped(tmp_path):
+    path = tmp_path / "outbox.jsonl"
+    stand_in, statuses, _ = run_outbox(path, ["one", "two"], {"statuses": [503, 403]})
+    # the 503 is retried, the 403 the retry is answered with drops the first post.
+    assert stand_in.tweets == ["two"] and stand_in.requests == 3
+    assert any("retrying" in status for status in statuses)
+    assert "Tweeting failed (HTTP 403), the tweet is dropped." in statuses
+    assert Outbox(print, path=str(path)).load() == []
+
+
+def test_pending_posts_survive_a_restart(tmp_path):
+    path = str(tmp_path / "outbox.jsonl")
+
+    async def quit_before_sending():
+        outbox = Outbox(lambda text: time.sleep(1), path=path)
+        outbox.start()
+        outbox.put("pending")
+        await outbox.stop()
+
+    asyncio.run(quit_before_sending())
+    entries = [json.loads(line) for line in open(path)]
+    assert [entry["text"] for entry in entries] == ["pending"]
+    stand_in, statuses, _ = run_outbox(path, [], {})
+    assert stand_in.tweets == ["pending"]
+    assert statuses[0] == "Sending 1 tweet(s) left from last time..."
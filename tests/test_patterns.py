@@ -0,0 +1,63 @@
+import pytest
+
+import numpy as np
+
+from deepwordle.core import (
+    WordStore,
+    patterns,
+)
+from deepwordle.core.patterns import (
+    PatternMatrix,
+    compute_matrix,
+    feedback_pattern,
+    pattern_to_states,
+    states_to_pattern,
+)
+
+GUESSES = ["aahed", "eerie", "lolly", "speed", "there", "zymic"]
+ANSWERS = ["abbey", "hello", "react", "creep"]
+
+
+def open_store(directory, guesses, answers):
+    guesses_path = directory / "guesses.txt"
+    answers_path = directory / "answers.txt"
+    guesses_path.write_text("\n".join(guesses) + "\n")
+    answers_path.write_text("\n".join(answers) + "\n")
+    return WordStore.open(str(guesses_path), str(answers_path), str(directory))
+
+
+def test_feedback_pattern():
+    assert pattern_to_states(feedback_pattern("there", "react")) == (1, 0, 1, 1, 0)
+    assert pattern_to_states(feedback_pattern("react", "react")) == (2, 2, 2, 2, 2)
+    assert states_to_pattern((2, 0, 1, 0, 0)) == 2 * 81 + 9
+
+
+def test_compute_matrix_with_a_pool(monkeypatch):
+    pools = []
+
+    class Pool(patterns.ProcessPoolExecutor):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            pools.append(self)
+
+    # rows of two, the six guesses are split across three tasks.
+    monkeypatch.setattr(patterns, "ROWS_PER_TASK", 2)
+    monkeypatch.setattr(patterns, "ProcessPoolExecutor", Pool)
+    serial = compute_matrix(GUESSES, ANSWERS, processes=1)
+    assert not pools
+    assert np.array_equal(serial, compute_matrix(GUESSES, ANSWERS, processes=2))
+    assert len(pools) == 1
+    assert serial[4, 2] == feedback_pattern("there", "react")
+
+
+def test_pattern_matrix_cache(tmp_path):
+    word_store = open_store(tmp_path, GUESSES, ANSWERS)
+    pattern_matrix = PatternMatrix.open(word_store, str(tmp_path), processes=1)
+    assert pattern_matrix.shape == (len(word_store), len(ANSWERS))
+    rank, index = word_store.rank("lolly"), word_store.answer_index("hello")
+    assert pattern_matrix.pattern(rank, index) == feedback_pattern("lolly", "hello")
+    with pytest.raises(ValueError):
+        pattern_matrix.row(rank)[0] = 0
+    word_store = open_store(tmp_path, GUESSES + ["mummy"], ANSWERS)
+    pattern_matrix = PatternMatrix.open(word_store, str(tmp_path), processes=1)
+    assert pattern_matrix.shape == (len(GUESSES) + len(ANSWERS) + 1, len(ANSWERS))
@@ -0,0 +1,154 @@
+import hashlib
+import io
+import numpy as np
+import wave
+
+from deepwordle.audio.flac import (
+    crc8,
+    crc16,
+    encode_flac,
+)
+from deepwordle.audio.preprocess import (
+    Preprocessor,
+    resample,
+    trim,
+)
+
+RATE = 44100
+
+
+class BitReader:
+    def __init__(self, data):
+        self.data = data
+        self.position = 0
+
+    def read(self, width):
+        value = 0
+        for _ in range(width):
+            byte = self.data[self.position >> 3]
+            value = value << 1 | (byte >> (7 - (self.position & 7))) & 1
+            self.position += 1
+        return value
+
+    def signed(self, width):
+        value = self.read(width)
+        return value - (1 << width) if value >> (width - 1) else value
+
+    def unary(self):
+        count = 0
+        while not self.read(1):
+            count += 1
+        return count
+
+    def align(self):
+        self.position = -(-self.position // 8) * 8
+
+
+def decode_flac(data):
+    """
+    A reference decoder of the subset of FLAC the encoder writes, checking the CRCs.
+    """
+    assert data[:4] == b"fLaC" and data[4] == 0x80
+    reader = BitReader(data[8:42])
+    reader.read(16 + 16 + 24 + 24)
+    rate = reader.read(20)
+    assert reader.read(3) == 0 and reader.read(5) == 15
+    total = reader.read(36)
+    md5 = data[26:42]
+    reader = BitReader(data)
+    reader.position = 42 * 8
+    samples = []
+    while len(samples) < total:
+        start = reader.position >> 3
+        assert reader.read(14) == 0b11111111111110
+        reader.read(2)
+        size_code = reader.read(4)
+        assert reader.read(4) == 0 and reader.read(4) == 0
+        assert reader.read(3) == 0b100 and reader.read(1) == 0
+        first = reader.read(8)
+        for _ in range(bin(first).index("0", 2) - 3 if first >= 0xC0 else 0):
+            reader.read(8)
+        size = 256 << (size_code - 8) if size_code >= 8 else reader.read(16) + 1
+        assert reader.read(8) == crc8(data[start : (reader.position >> 3) - 1])
+        assert reader.read(1) == 0
+        kind = reader.read(6)
+        assert reader.read(1) == 0
+        if kind == 0:
+            samples += [reader.signed(16)] * size
+        else:
+            order = kind & 0b111
+            block = [reader.signed(16) for _ in range(order)]
+            assert reader.read(2) == 0
+            partition_order = reader.read(4)
+            residuals = []
+            for index in range(1 << partition_order):
+                parameter = reader.read(4)
+                count = (size >> partition_order) - (order if index == 0 else 0)
+                for _ in range(count):
+                    folded = reader.unary() << parameter | reader.read(parameter)
+                    residuals.append(
+                        folded >> 1 if folded & 1 == 0 else -(folded >> 1) - 1
+                    )
+            coefficients = [[], [1], [2, -1], [3, -3, 1], [4, -6, 4, -1]][order]
+            for residual in residuals:
+                prediction = sum(c * block[-1 - i] for i, c in enumerate(coefficients))
+                block.append(prediction + residual)
+            samples += block
+        reader.align()
+        end = reader.position >> 3
+        assert reader.read(16) == crc16(data[start:end])
+    decoded = np.array(samples, dtype=np.int16)
+    assert hashlib.md5(decoded.tobytes()).digest() == md5
+    return rate, decoded
+
+
+def speech(seconds=0.5, leading=0.5, trailing=1.0, seed=0):
+    rng = np.random.default_rng(seed)
+    time = np.arange(int(RATE * seconds)) / RATE
+    word = 8000 * np.sin(2 * np.pi * 200 * time) * np.hanning(len(time))
+    word += 2000 * np.sin(2 * np.pi * 1200 * time)
+    samples = np.concatenate(
+        (np.zeros(int(RATE * leading)), word, np.zeros(int(RATE * trailing)))
+    )
+    return (samples + rng.normal(0, 40, len(samples))).astype(np.int16)
+
+
+def test_flac_round_trip():
+    samples = speech()
+    for block in (samples, samples[:1000], np.zeros(5000, dtype=np.int16)):
+        data = encode_flac(block, 16000)
+        rate, decoded = decode_flac(data)
+        assert rate == 16000 and np.array_equal(decoded, block)
+    assert len(encode_flac(samples, 16000)) < len(samples)
+
+
+def test_resample_keeps_speech_and_drops_aliases():
+    time = np.arange(RATE) / RATE
+    speech_band = (8000 * np.sin(2 * np.pi * 1000 * time)).astype(np.int16)
+    alias = (8000 * np.sin(2 * np.pi * 12000 * time)).astype(np.int16)
+    output = resample(speech_band, RATE)
+    assert len(output) == 16000
+    expected = 8000 * np.sin(2 * np.pi * 1000 * np.arange(16000) / 16000)
+    assert np.abs(output - expected)[100:-100].max() < 8
+    assert np.abs(resample(alias, RATE)[100:-100]).max() < 8
+
+
+def test_trim_keeps_the_word():
+    samples = speech(leading=0.5, trailing=1.0)
+    trimmed = trim(samples, RATE, padding=0.1)
+    assert 0.6 <= len(trimmed) / RATE <= 0.8
+    silence = np.zeros(RATE, dtype=np.int16)
+    assert len(trim(silence, RATE)) == RATE
+
+
+def test_preprocessor_reports_the_savings():
+    samples = speech()
+    data, report = Preprocessor().process(samples, RATE)
+    with wave.open(io.BytesIO(bytes(data)), "rb") as wave_file:
+        assert wave_file.getframerate() == 16000
+    assert report.output_bytes == len(data)
+    assert report.saved_bytes > 0.75 * report.input_bytes
+    compressed, flac_report = Preprocessor(compress=True).process(samples, RATE)
+    assert decode_flac(compressed)[0] == 16000
+    assert flac_report.output_bytes < report.output_bytes
+    assert "KB sent instead of" in flac_report.format()
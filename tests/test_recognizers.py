@@ -0,0 +1,113 @@
+import pytest
+
+import asyncio
+import json
+import numpy as np
+
+from deepwordle.audio.wav import (
+    wav_bytes,
+)
+from deepwordle.core import (
+    WordStore,
+)
+from deepwordle.core.matcher import (
+    WordMatcher,
+)
+from deepwordle.recognizers import (
+    UNKNOWN,
+    LocalRecognizer,
+    benchmark,
+    create_recognizer,
+    load_clips,
+    response_words,
+    transcript_response,
+)
+
+
+class FakeKaldiRecognizer:
+    def __init__(self, model, rate, grammar):
+        self.rate = rate
+        self.grammar = json.loads(grammar)
+        self.frames = b""
+
+    def SetWords(self, words):
+        pass
+
+    def AcceptWaveform(self, frames):
+        self.frames += frames
+
+    def FinalResult(self):
+        seconds = len(self.frames) / 2 / self.rate
+        self.frames = b""
+        result = [
+            {"word": UNKNOWN, "start": 0.0, "end": 0.1, "conf": 1.0},
+            {"word": "react", "start": 0.1, "end": seconds, "conf": 0.9},
+        ]
+        return json.dumps({"result": result, "text": "react"})
+
+
+class FakeVosk:
+    def __init__(self):
+        self.recognizers = []
+
+    def Model(self, model_path=None, lang=None):
+        return model_path or lang
+
+    def KaldiRecognizer(self, model, rate, grammar):
+        self.recognizers.append(FakeKaldiRecognizer(model, rate, grammar))
+        return self.recognizers[-1]
+
+
+def test_local_recognizer_is_limited_to_the_vocabulary():
+    word_store = WordStore.open()
+    engine = FakeVosk()
+    recognizer = LocalRecognizer(word_store=word_store, engine=engine)
+    audio = wav_bytes(np.zeros(8000, dtype=np.int16), 16000)
+    response = asyncio.run(recognizer.recognize(audio))
+    asyncio.run(recognizer.recognize(audio))
+    words = response_words(response)
+    assert [item["word"] for item in words] == ["react"]
+    assert words[0]["end"] == 0.5
+    # the grammar is compiled once for every sample rate.
+    assert len(engine.recognizers) == 1
+    grammar = engine.recognizers[0].grammar
+    assert len(grammar) > len(word_store) and grammar[-1] == UNKNOWN
+    assert {"react", "alfa", "tango", "double"} <= set(grammar)
+    with pytest.raises(ValueError):
+        asyncio.run(recognizer.recognize(audio, "audio/flac"))
+
+
+def test_grammar_is_compiled_on_warm_up():
+    engine = FakeVosk()
+    recognizer = LocalRecognizer(word_store=WordStore.open(), engine=engine)
+    assert asyncio.run(recognizer.warm()) is not None
+    assert [item.rate for item in engine.recognizers] == [44100, 16000]
+    # the first guess goes through a compiled recognizer.
+    audio = wav_bytes(np.zeros(8000, dtype=np.int16), 16000)
+    asyncio.run(recognizer.recognize(audio))
+    assert len(engine.recognizers) == 2
+
+
+def test_create_recognizer():
+    assert isinstance(create_recognizer("local"), LocalRecognizer)
+    with pytest.raises(ValueError):
+        create_recognizer("unknown")
+
+
+def test_benchmark_on_clips(tmp_path):
+    audio = bytes(wav_bytes(np.zeros(1600, dtype=np.int16), 16000))
+    for name in ("react.wav", "react-2.wav", "ghost.wav", "notes.txt"):
+        (tmp_path / name).write_bytes(audio)
+    clips = load_clips(str(tmp_path))
+    assert [word for word, _ in clips] == ["ghost", "react", "react"]
+
+    class FakeBackend:
+        async def recognize(self, audio, mimetype):
+            words = [{"word": "reakt", "start": 0.0, "end": 0.1, "confidence": 1.0}]
+            return transcript_response(words)
+
+    report = asyncio.run(
+        benchmark("fake", FakeBackend(), clips, WordMatcher(WordStore.open()))
+    )
+    assert report.correct == 2 and len(report.latencies) == 3
+    assert "accuracy  66.7%" in report.format()
@@ -0,0 +1,77 @@
+import pytest
+
+import asyncio
+import random
+import time
+
+from deepwordle.resilience import (
+    ResilientRecognizer,
+)
+from deepwordle.stand_ins import (
+    PrerecordedStandIn,
+)
+from deepwordle.transcribe import (
+    Recognizer,
+)
+
+
+def recognize(stand_in_kwargs, calls=1, **kwargs):
+    """
+    Run `calls` recognitions against a stand-in, returning their outcomes, the layer, the
+    number of uploads and the seconds taken by the recognitions.
+    """
+
+    async def run():
+        async with PrerecordedStandIn(latency=0, **stand_in_kwargs) as stand_in:
+            recognizer = ResilientRecognizer(
+                Recognizer(api_key="key", api_url=stand_in.url),
+                backoff=0.01,
+                random=random.Random(0),
+                **kwargs,
+            )
+            outcomes = []
+            start = time.perf_counter()
+            for _ in range(calls):
+                try:
+                    outcomes.append(await recognizer.recognize(b"audio"))
+                except Exception as error:
+                    outcomes.append(error)
+            seconds = time.perf_counter() - start
+            await recognizer.close()
+            return outcomes, recognizer, len(stand_in.uploads), seconds
+
+    return asyncio.run(run())
+
+
+def test_transient_errors_are_retried():
+    outcomes, recognizer, uploads, _ = recognize({"statuses": [503, 429]})
+    assert "results" in outcomes[0] and uploads == 3
+    assert recognizer.stats.retries == 2 and recognizer.stats.failures == 0
+    # the errors of the request itself are raised at once.
+    outcomes, recognizer, uploads, _ = recognize({"statuses": [400]})
+    assert "DG: 400" in str(outcomes[0]) and uploads == 1
+    assert recognizer.stats.retries == 0 and recognizer.stats.failures == 1
+
+
+def test_slow_attempts_and_deadline():
+    outcomes, recognizer, _, _ = recognize({"delays": [0.6]}, attempt_timeout=0.2)
+    assert "results" in outcomes[0] and recognizer.stats.retries == 1
+    outcomes, recognizer, _, seconds = recognize(
+        {"delays": [0.6] * 3}, attempt_timeout=0.5, deadline=0.3
+    )
+    assert seconds < 0.5
+    assert isinstance(outcomes[0], TimeoutError)
+    assert "within 0.3 seconds" in str(outcomes[0])
+    assert recognizer.stats.timeouts == 1
+
+
+def test_slow_request_is_hedged():
+    # the 21st upload is slow, the hedge sent after the p95 of the first 20 answers first.
+    outcomes, recognizer, uploads, seconds = recognize(
+        {"delays": [0.0] * 20 + [0.6]}, calls=21, hedge=True
+    )
+    assert seconds < 0.4
+    assert all("results" in outcome for outcome in outcomes)
+    assert uploads == 22
+    assert recognizer.stats.hedged == 1 and recognizer.stats.hedge_wins == 1
+    assert recognizer.hedge_delay() < 1.0
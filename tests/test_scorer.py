@@ -0,0 +1,52 @@
+import numpy as np
+from types import (
+    SimpleNamespace,
+)
+
+from deepwordle.components.utils import (
+    update_letters_state,
+)
+from deepwordle.core.patterns import (
+    states_to_pattern,
+)
+from deepwordle.core.scorer import (
+    score,
+    score_many,
+)
+from deepwordle.core.word_store import (
+    ANSWERS_FILE,
+    GUESSES_FILE,
+    _read_words,
+)
+
+GUESSES = _read_words(GUESSES_FILE) + _read_words(ANSWERS_FILE)
+ANSWERS = _read_words(ANSWERS_FILE)
+
+
+def reference_pattern(guess, answer):
+    # `update_letters_state` only needs the `character` and the `state` of each letter.
+    letters = [SimpleNamespace(character=character, state=0) for character in guess]
+    letters = update_letters_state(letters, answer)
+    return states_to_pattern([letter.state for letter in letters])
+
+
+def test_duplicate_letters():
+    for guess, answer in (("lllll", "hello"), ("eerie", "creep"), ("abbey", "babes")):
+        assert score(guess, [answer])[0] == reference_pattern(guess, answer)
+
+
+def test_every_guess_against_sampled_answers():
+    answers = ANSWERS[::131]
+    patterns = score_many(GUESSES, answers)
+    for guess, row in zip(GUESSES, patterns):
+        assert row.tolist() == [reference_pattern(guess, answer) for answer in answers]
+
+
+def test_every_answer_against_sampled_guesses():
+    guesses = GUESSES[::797]
+    patterns = score_many(guesses, ANSWERS, chunk_size=3)
+    for column, answer in zip(patterns.T, ANSWERS):
+        assert column.tolist() == [
+            reference_pattern(guess, answer) for guess in guesses
+        ]
+    assert np.array_equal(patterns[0], score(guesses[0], ANSWERS))
@@ -0,0 +1,78 @@
+import pytest
+
+import aiohttp
+import asyncio
+import threading
+
+from deepwordle.stand_ins import (
+    PrerecordedStandIn,
+)
+from deepwordle.transcribe import (
+    Recognizer,
+)
+
+
+def test_connection_is_warmed_and_reused():
+    async def guesses():
+        async with PrerecordedStandIn(transcript="crane", latency=0) as stand_in:
+            recognizer = Recognizer(api_key="key", api_url=stand_in.url)
+            assert await recognizer.warm() is not None
+            responses = [await recognizer.recognize(b"audio") for _ in range(3)]
+            await recognizer.close()
+            return stand_in, recognizer.stats, responses
+
+    stand_in, stats, responses = asyncio.run(guesses())
+    words = responses[0]["results"]["channels"][0]["alternatives"][0]["words"]
+    assert words[0]["word"] == "crane"
+    # a single connection, opened by the warm-up, carried every guess.
+    assert stand_in.connections == 1 and stand_in.uploads == [b"audio"] * 3
+    assert stats.requests == 4 and stats.connections == 1 and stats.reused == 3
+    assert len(stats.cold) == 1 and len(stats.warm) == 3
+    assert "4 requests over 1 connections (75% reused)" in stats.format()
+
+
+def test_warm_up_offline_and_request_errors():
+    async def offline():
+        recognizer = Recognizer(api_key="key", api_url="http://127.0.0.1:9/v1")
+        seconds = await recognizer.warm()
+        await recognizer.close()
+        return seconds
+
+    assert asyncio.run(offline()) is None
+
+    async def not_found():
+        async with PrerecordedStandIn(latency=0) as stand_in:
+            recognizer = Recognizer(api_key="key", api_url=stand_in.url + "/missing")
+            try:
+                await recognizer.recognize(b"audio")
+            finally:
+                await recognizer.close()
+
+    with pytest.raises(Exception, match="DG: 404"):
+        asyncio.run(not_found())
+
+
+def test_session_of_another_loop_is_closed():
+    async def guesses():
+        async with PrerecordedStandIn(latency=0) as stand_in:
+            recognizer = Recognizer(api_key="key", api_url=stand_in.url)
+            other = asyncio.new_event_loop()
+            thread = threading.Thread(target=other.run_forever)
+            thread.start()
+            try:
+                future = asyncio.run_coroutine_threadsafe(
+                    recognizer.recognize(b"audio"), other
+                )
+                await asyncio.wrap_future(future)
+                previous = recognizer.session._session
+            finally:
+                other.call_soon_threadsafe(other.stop)
+                thread.join()
+            await recognizer.recognize(b"audio")
+            await recognizer.close()
+            other.close()
+            return stand_in, previous
+
+    stand_in, previous = asyncio.run(guesses())
+    # the session of the other loop was closed before the running loop opened its own.
+    assert previous.closed and stand_in.connections == 2
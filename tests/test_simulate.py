@@ -0,0 +1,26 @@
+from deepwordle.core import (
+    WordStore,
+)
+from deepwordle.simulate import (
+    STAGES,
+    CandidateStrategy,
+    play_game,
+    simulate,
+)
+
+
+def test_play_game(tmp_path):
+    word_store = WordStore.open(cache_dir=str(tmp_path))
+    strategy = CandidateStrategy.create(word_store, seed=0)
+    timings = {stage: [0, 0] for stage in STAGES}
+    assert play_game(word_store, strategy, word_store.answer(0), timings) == 1
+    assert play_game(word_store, strategy, "react", timings) in range(1, 7)
+    assert all(calls > 0 for _, calls in timings.values())
+
+
+def test_simulate_a_sample(tmp_path):
+    report = simulate("random", sample=40, processes=1, cache_dir=str(tmp_path))
+    assert report.games == 40
+    assert sum(report.distribution.values()) == 40
+    assert report.timings["score"][1] >= 40
+    assert "games/s" in report.format()
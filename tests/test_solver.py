@@ -0,0 +1,47 @@
+from deepwordle.core import (
+    WordStore,
+)
+from deepwordle.core.patterns import (
+    feedback_pattern,
+)
+from deepwordle.core.solver import (
+    Solver,
+)
+
+GUESSES = ["aahed", "eerie", "lolly", "speed", "there", "zymic"]
+ANSWERS = ["abbey", "hello", "react", "creep", "crepe", "cheer"]
+
+
+def open_solver(directory):
+    (directory / "guesses.txt").write_text("\n".join(GUESSES) + "\n")
+    (directory / "answers.txt").write_text("\n".join(ANSWERS) + "\n")
+    word_store = WordStore.open(
+        str(directory / "guesses.txt"), str(directory / "answers.txt"), str(directory)
+    )
+    return Solver(word_store, cache_dir=str(directory))
+
+
+def test_solver_narrows_and_ranks(tmp_path):
+    solver = open_solver(tmp_path)
+    solver.update("zymic", feedback_pattern("zymic", "creep"))
+    assert solver.candidates == ["react", "creep", "crepe", "cheer"]
+    hints = solver.rank_guesses(top_k=3)
+    assert len(hints) == 3 and hints[0][1] >= hints[1][1] >= hints[2][1]
+    assert hints == solver.rank_guesses(top_k=3)
+    solver.update(hints[0][0], feedback_pattern(hints[0][0], "creep"))
+    assert "creep" in solver.candidates and solver.candidates_count < 4
+    solver.reset()
+    assert solver.candidates_count == len(ANSWERS)
+
+
+def test_last_candidates(tmp_path):
+    solver = open_solver(tmp_path)
+    solver.update("eerie", feedback_pattern("eerie", "creep"))
+    assert solver.candidates == ["creep", "cheer"]
+    # guessing either one of the two splits them, a bit of information.
+    hints = solver.rank_guesses(top_k=3)
+    assert len(hints) == 3
+    assert {word for word, _ in hints[:2]} == {"creep", "cheer"}
+    assert hints[0][1] == hints[1][1] == 1.0
+    solver.update("cheer", feedback_pattern("cheer", "creep"))
+    assert solver.rank_guesses() == [("creep", 0.0)]
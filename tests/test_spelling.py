@@ -0,0 +1,44 @@
+from deepwordle.core import (
+    WordStore,
+)
+from deepwordle.core.spelling import (
+    spell,
+    spelled_word,
+    to_letter,
+)
+
+
+def timed(*tokens, gap=0.2, length=0.3):
+    words, start = [], 0.0
+    for token in tokens:
+        if token is None:
+            # a long silence between two words.
+            start += 2.0
+            continue
+        words.append({"word": token, "start": start, "end": start + length})
+        start += length + gap
+    return words
+
+
+def test_to_letter():
+    assert to_letter("Are.") == "r"
+    assert to_letter("romeo") == "r"
+    assert to_letter("0") == "o"
+    assert to_letter("react") is None
+
+
+def test_spell():
+    assert spell(timed("r", "e", "a", "c", "t")) == ["react"]
+    assert spell(timed("double", "you", "hotel", "i", "tea", "e")) == ["white"]
+    assert spell(timed("are", "e", None, "hey", "see", "tea")) == ["re", "act"]
+    assert spell(timed("the", "word", "is", "see", "oh", "are", "e", "ess")) == [
+        "cores"
+    ]
+
+
+def test_spelled_word(tmp_path):
+    word_store = WordStore.open(cache_dir=str(tmp_path))
+    assert spelled_word(timed("R", "E", "A", "C", "T"), word_store) == "react"
+    assert spelled_word(timed("uh", "tango", "r", "a", "i", "n"), word_store) == "train"
+    assert spelled_word(timed("x", "x", "x", "x", "x"), word_store) is None
+    assert spelled_word([], word_store) is None
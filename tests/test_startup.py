@@ -0,0 +1,45 @@
+import pytest
+
+import subprocess
+import sys
+
+from deepwordle.startup import (
+    parse_importtime,
+    profile_imports,
+)
+
+# the seconds `deepwordle.app` may take to import, about half a second on a laptop.
+IMPORT_BUDGET = 1.5
+
+IMPORTTIME = """import time: self [us] | cumulative | imported package
+import time:       100 |        100 | site
+import time:       300 |        300 |     numpy.core
+import time:       200 |        500 |   numpy
+import time:        50 |         50 |     deepwordle.core.codec
+import time:        70 |        120 |   deepwordle.core
+import time:        30 |        650 | deepwordle.app
+"""
+
+
+def test_parse_importtime():
+    packages, seconds = parse_importtime(IMPORTTIME)
+    # the interpreter startup is left out, the modules of deepwordle are kept apart.
+    assert packages == pytest.approx(
+        {"numpy": 500e-6, "deepwordle.core": 120e-6, "deepwordle.app": 30e-6}
+    )
+    assert seconds == pytest.approx(650e-6)
+
+
+def test_startup_is_within_budget():
+    profile = profile_imports()
+    # the packages of the features are imported on their first use, not on startup.
+    assert profile.loaded == []
+    assert profile.imports < IMPORT_BUDGET, profile.format()
+    # importing the app prints nothing and probes no audio device.
+    completed = subprocess.run(
+        [sys.executable, "-c", "import deepwordle.app"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout == "" and completed.stderr == ""
@@ -0,0 +1,75 @@
+import pytest
+
+import asyncio
+import json
+import numpy as np
+import time
+
+from deepwordle.stand_ins import (
+    LiveStandIn,
+)
+from deepwordle.streaming import (
+    StreamingRecognizer,
+    StreamResult,
+    is_final_word,
+)
+
+RATE = 16000
+
+
+async def speak(seconds, step=0.02):
+    for _ in range(int(seconds / step)):
+        yield np.zeros(int(RATE * step), dtype=np.int16)
+        await asyncio.sleep(step)
+
+
+def stream(stand_in, seconds, **kwargs):
+    async def transcribe():
+        async with stand_in:
+            recognizer = StreamingRecognizer(api_key="key", url=stand_in.url, rate=RATE)
+            results = []
+            final = await recognizer.transcribe(
+                speak(seconds), on_result=results.append, **kwargs
+            )
+            return final, results
+
+    return asyncio.run(transcribe())
+
+
+def test_stream_stops_on_the_first_final_word():
+    stand_in = LiveStandIn(transcript="react", speech_seconds=0.3, latency=0.01)
+    final, results = stream(stand_in, 2)
+    assert final.transcript == "react" and final.is_final
+    assert [result.is_final for result in results] == [False, True]
+    assert results[0].transcript == "rea"
+    # the recording did not go on after the word was heard.
+    assert final.elapsed < 1
+    assert stand_in.received < 2 * RATE * 2
+
+
+def test_stream_returns_the_last_final_result_when_the_audio_ends():
+    stand_in = LiveStandIn(transcript="uh", speech_seconds=0.1, latency=0.01)
+    final, results = stream(stand_in, 0.3)
+    assert final.transcript == "uh"
+    assert not is_final_word(final)
+    assert stand_in.streams == 1
+
+
+def test_stalled_stream_misses_its_deadline():
+    async def transcribe():
+        async with LiveStandIn(stalled=True) as stand_in:
+            recognizer = StreamingRecognizer(
+                api_key="key", url=stand_in.url, rate=RATE, deadline=0.5
+            )
+            start = time.perf_counter()
+            with pytest.raises(TimeoutError, match="No transcript within 0.5 seconds"):
+                await recognizer.transcribe(speak(0.2))
+            return stand_in, time.perf_counter() - start
+
+    stand_in, seconds = asyncio.run(transcribe())
+    # the audio ended long before, the stream was given up at the deadline.
+    assert stand_in.received and 0.5 <= seconds < 1
+
+
+def test_parse_skips_the_metadata():
+    assert StreamResult.parse(json.dumps({"type": "Metadata"}), 0.1) is None
@@ -0,0 +1,53 @@
+import pytest
+
+import json
+import numpy as np
+
+from deepwordle.tracing import (
+    Histogram,
+    Tracer,
+    bucket_bounds,
+    bucket_index,
+)
+
+
+def test_histogram_percentiles_are_within_one_percent():
+    values = np.random.default_rng(0).lognormal(np.log(0.3), 1.0, 10000)
+    histogram = Histogram()
+    for value in values:
+        histogram.record(value)
+    for quantile, expected in zip(
+        (0.5, 0.99), np.quantile(values, (0.5, 0.99), method="inverted_cdf")
+    ):
+        assert histogram.percentile(quantile) == pytest.approx(expected, rel=0.01)
+    assert histogram.percentile(1.0) == histogram.maximum == values.max()
+    assert histogram.count == 10000
+    for value in (0, 255, 256, 1000, 123456, 2**32 - 1):
+        lowest, highest = bucket_bounds(bucket_index(value))
+        assert lowest <= value <= highest
+
+
+def test_tracer_exports_stages(tmp_path):
+    tracer = Tracer()
+    for seconds in (0.1, 0.2, 0.3):
+        tracer.begin()
+        tracer.record("recognize", seconds)
+        with tracer.stage("match"):
+            pass
+        trace = tracer.end()
+    assert set(trace) == {"recognize", "match", "total"}
+    assert tracer.stages() == ["recognize", "match", "total"]
+    with pytest.raises(ValueError):
+        with tracer.stage("render"):
+            raise ValueError
+    assert "render" not in tracer.stages()
+
+    tracer.export(str(tmp_path / "latency.prom"))
+    prometheus = (tmp_path / "latency.prom").read_text()
+    assert "# TYPE deepwordle_stage_seconds summary" in prometheus
+    assert 'deepwordle_stage_seconds_count{stage="recognize"} 3' in prometheus
+    tracer.export(str(tmp_path / "latency.jsonl"))
+    lines = (tmp_path / "latency.jsonl").read_text().splitlines()
+    record = json.loads(lines[0])
+    assert record["stage"] == "recognize" and record["count"] == 3
+    assert record["p50"] == pytest.approx(0.2, rel=0.01)
@@ -0,0 +1,72 @@
+import pytest
+
+import asyncio
+
+from deepwordle.stand_ins import (
+    TwitterStandIn,
+)
+from deepwordle.twitter import (
+    Twitter,
+)
+
+CREDENTIALS = {
+    "consumer_key": "key",
+    "consumer_secret": "secret",
+    "access_token": "token",
+    "access_token_secret": "token secret",
+}
+
+
+def verify_all(path, calls, stand_in_kwargs):
+    """
+    Verify the credentials of `calls`, pairs of credentials and of a time to live, in turn
+    against a stand-in: whether the API was asked, or the error raised, is returned for each.
+    """
+
+    async def run():
+        async with TwitterStandIn(**stand_in_kwargs) as stand_in:
+            loop = asyncio.get_running_loop()
+            outcomes = []
+            for credentials, ttl in calls:
+                twitter = Twitter(
+                    **credentials, api_url=stand_in.url, verified_path=str(path)
+                )
+                try:
+                    outcomes.append(
+                        await loop.run_in_executor(None, twitter.verify, ttl)
+                    )
+                except ValueError as error:
+                    outcomes.append(error)
+            return stand_in, outcomes
+
+    return asyncio.run(run())
+
+
+def test_nothing_is_done_on_creation(tmp_path):
+    path = tmp_path / "verified.json"
+    twitter = Twitter(**{**CREDENTIALS, "access_token": ""}, verified_path=str(path))
+    # no client, no request and no assertion until the first tweet.
+    assert twitter._auth is None
+    assert twitter.missing_credentials() == ["access_token"]
+    with pytest.raises(ValueError, match="access_token"):
+        twitter.verify()
+    assert not path.exists()
+
+
+def test_verification_is_cached(tmp_path):
+    other = {**CREDENTIALS, "access_token": "other"}
+    calls = [(CREDENTIALS, 60)] * 3 + [(other, 60), (CREDENTIALS, 0)]
+    stand_in, outcomes = verify_all(tmp_path / "verified.json", calls, {})
+    # the first launch asks the API, the next ones trust the cache, unlike other credentials
+    # and a verification past its time to live.
+    assert outcomes == [True, False, False, True, True]
+    assert stand_in.verifications == 3
+
+
+def test_rejected_credentials_are_not_cached(tmp_path):
+    calls = [(CREDENTIALS, 60)] * 2
+    stand_in, outcomes = verify_all(
+        tmp_path / "verified.json", calls, {"statuses": [401]}
+    )
+    assert isinstance(outcomes[0], ValueError) and "HTTP 401" in str(outcomes[0])
+    assert outcomes[1] is True and stand_in.verifications == 2
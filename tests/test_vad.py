@@ -0,0 +1,75 @@
+import asyncio
+import numpy as np
+
+from deepwordle.audio import (
+    AudioCapture,
+    VoiceActivityDetector,
+)
+from deepwordle.audio.vad import (
+    endpoints,
+)
+from tests.test_audio_capture import (
+    FakePyAudio,
+)
+
+RATE = 16000
+
+
+def noise(seconds, seed=0):
+    rng = np.random.default_rng(seed)
+    return rng.normal(0, 60, int(RATE * seconds)).astype(np.int16)
+
+
+def tone(seconds, amplitude=5000):
+    time = np.arange(int(RATE * seconds)) / RATE
+    return (amplitude * np.sin(2 * np.pi * 180 * time)).astype(np.int16)
+
+
+def feed(detector, samples, chunk=1000):
+    for start in range(0, len(samples), chunk):
+        if detector.feed(samples[start : start + chunk]):
+            break
+    return detector
+
+
+def test_utterance_ends_after_the_trailing_silence():
+    samples = np.concatenate((noise(0.3), tone(0.4), noise(2, seed=1)))
+    detector = feed(VoiceActivityDetector(RATE, trailing_silence=0.25), samples)
+    assert detector.done
+    assert abs(detector.speech_start - int(0.3 * RATE)) <= 0.02 * RATE
+    assert abs(detector.speech_end - int(0.7 * RATE)) <= 0.02 * RATE
+    # a short word is done in well under a second, not after the fixed two seconds.
+    assert detector.samples / RATE < 1.0
+
+
+def test_noise_and_clicks_are_not_speech():
+    click = tone(0.02, amplitude=20000)
+    samples = np.concatenate((noise(0.5), click, noise(1.0, seed=2)))
+    detector = feed(VoiceActivityDetector(RATE, max_seconds=1.2), samples)
+    assert detector.done and detector.speech_start is None
+    assert detector.samples == int(1.2 * RATE)
+
+
+def test_long_speech_stops_at_the_maximum_length():
+    detector = feed(VoiceActivityDetector(RATE, max_seconds=1.0), tone(3))
+    assert detector.done and detector.speech_start == 0
+    assert detector.samples == RATE
+
+
+def test_frames_split_across_chunks():
+    samples = np.concatenate((noise(0.2), tone(0.3), noise(1)))
+    expected = endpoints(samples, RATE)
+    assert expected is not None
+    for chunk in (1, 7, 333):
+        detector = feed(VoiceActivityDetector(RATE, max_seconds=2), samples, chunk)
+        assert (detector.speech_start, detector.speech_end) == expected
+
+
+def test_record_stops_on_the_end_of_the_utterance():
+    samples = np.concatenate((noise(0.2), tone(0.3), noise(2.5, seed=3)))
+    audio_capture = AudioCapture(rate=RATE, py_audio=FakePyAudio(samples))
+    vad = VoiceActivityDetector(RATE)
+    recorded = asyncio.run(audio_capture.record(2, vad))
+    assert vad.done and vad.speech_start is not None
+    assert len(recorded) < RATE
+    assert not audio_capture.capturing
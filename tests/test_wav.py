@@ -0,0 +1,76 @@
+import asyncio
+import io
+import numpy as np
+import wave
+
+from deepwordle.audio import (
+    AudioCapture,
+)
+from deepwordle.audio.wav import (
+    HEADER_SIZE,
+    WavBuffer,
+    wav_bytes,
+    write_wav,
+)
+from deepwordle.stand_ins import (
+    PrerecordedStandIn,
+)
+from deepwordle.transcribe import (
+    Recognizer,
+)
+from tests.test_audio_capture import (
+    FakePyAudio,
+)
+
+
+def read_wav(data):
+    with wave.open(io.BytesIO(bytes(data)), "rb") as wave_file:
+        frames = wave_file.readframes(wave_file.getnframes())
+        return wave_file.getframerate(), np.frombuffer(frames, dtype=np.int16)
+
+
+def test_wav_buffer_is_a_valid_wav_file():
+    wav_buffer = WavBuffer(100, 16000)
+    wav_buffer.samples[:10] = np.arange(10)
+    view = wav_buffer.view(10)
+    assert len(view) == HEADER_SIZE + 20
+    rate, samples = read_wav(view)
+    assert rate == 16000 and samples.tolist() == list(range(10))
+    # the view shares the memory of the buffer, nothing was copied.
+    wav_buffer.samples[0] = 7
+    assert read_wav(view)[1][0] == 7
+
+
+def test_write_wav_debug_option(tmp_path):
+    samples = np.arange(-50, 50, dtype=np.int16)
+    write_wav(str(tmp_path / "samples.wav"), samples, 8000)
+    write_wav(str(tmp_path / "view.wav"), wav_bytes(samples, 8000))
+    assert (tmp_path / "samples.wav").read_bytes() == (
+        tmp_path / "view.wav"
+    ).read_bytes()
+    assert (
+        read_wav((tmp_path / "view.wav").read_bytes())[1].tolist() == samples.tolist()
+    )
+
+
+def test_recording_is_uploaded_from_memory(tmp_path):
+    rate = 8000
+    samples = (np.arange(rate) % 128).astype(np.int16)
+    audio_capture = AudioCapture(rate=rate, py_audio=FakePyAudio(samples))
+
+    async def record_and_upload():
+        async with PrerecordedStandIn(latency=0) as stand_in:
+            recognizer = Recognizer(
+                api_key="key",
+                dump_path=str(tmp_path / "dump.wav"),
+                api_url=stand_in.url,
+            )
+            audio = await audio_capture.record_wav(0.5)
+            assert isinstance(audio, memoryview)
+            await recognizer.recognize(audio)
+            await recognizer.close()
+            return audio, stand_in.uploads
+
+    audio, uploads = asyncio.run(record_and_upload())
+    assert read_wav(uploads[0])[1].tolist() == samples[: rate // 2].tolist()
+    assert (tmp_path / "dump.wav").read_bytes() == bytes(audio)
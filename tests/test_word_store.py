@@ -0,0 +1,47 @@
+import os
+
+from deepwordle.core import (
+    WordStore,
+)
+
+
+def write_lists(directory, guesses, answers):
+    guesses_path = directory / "guesses.txt"
+    answers_path = directory / "answers.txt"
+    guesses_path.write_text("".join(f"{word}\n" for word in guesses))
+    answers_path.write_text("".join(f"{word}\n" for word in answers))
+    return str(guesses_path), str(answers_path)
+
+
+def test_word_store_lookups(tmp_path):
+    guesses_path, answers_path = write_lists(
+        tmp_path, ["aahed", "zymic"], ["react", "aback"]
+    )
+    word_store = WordStore.open(guesses_path, answers_path, str(tmp_path))
+    assert os.path.exists(word_store.path)
+    assert len(word_store) == 4
+    assert "react" in word_store and "REACT" in word_store
+    assert "zymic" in word_store
+    assert "zzzzz" not in word_store and "reacts" not in word_store
+    assert word_store.is_answer("aback") and not word_store.is_answer("aahed")
+    assert [word_store.rank(word) for word in ("aahed", "aback", "react")] == [0, 1, 2]
+    assert word_store.answer_index("aback") == 1
+    assert word_store.answers() == ["react", "aback"]
+    assert word_store.word(3) == "zymic"
+    word_store.close()
+
+
+def test_word_store_rebuilds_on_change(tmp_path):
+    guesses_path, answers_path = write_lists(tmp_path, ["aahed"], ["react"])
+    WordStore.open(guesses_path, answers_path, str(tmp_path)).close()
+    write_lists(tmp_path, ["aahed", "zymic"], ["react"])
+    word_store = WordStore.open(guesses_path, answers_path, str(tmp_path))
+    assert "zymic" in word_store
+    word_store.close()
+
+
+def test_word_store_full_lists(tmp_path):
+    word_store = WordStore.open(cache_dir=str(tmp_path))
+    assert len(word_store) == 12947 and word_store.answers_count == 2309
+    assert all(word_store.word(rank) in word_store for rank in range(len(word_store)))
+    word_store.close()